@@ -1,10 +1,60 @@
+import os
+import sqlite3
 from flask import Flask
-from .routes.entry_routes import entry_routes
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
-def create_app():
+# Defined before the models and routes are imported, which import it from here.
+db = SQLAlchemy()
+
+DATABASE_URL_ENV = 'DATABASE_URL'
+# Upload size accepted by the bulk import endpoint.
+MAX_CONTENT_LENGTH = 1024 * 1024 * 1024
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Run SQLite in WAL mode so readers are not blocked by an import."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    # Durable at checkpoints; safe with WAL and much faster for bulk writes.
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA busy_timeout=5000')
+    cursor.close()
+
+def engine_options(database_uri):
+    """Connection pool settings for a database URI."""
+    if database_uri.startswith('sqlite') and (':memory:' in database_uri or database_uri.rstrip('/') == 'sqlite:'):
+        # In-memory SQLite uses a single static connection; there is nothing to pool.
+        return {}
+    return {
+        'pool_size': 5,
+        'max_overflow': 10,
+        'pool_recycle': 1800,
+        'pool_pre_ping': True,
+    }
+
+def create_app(config=None):
     app = Flask(__name__)
-    # ... other configurations ...
+    database_uri = os.environ.get(DATABASE_URL_ENV) or f"sqlite:///{os.path.join(app.instance_path, 'asosyal.db')}"
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=database_uri,
+        MAX_CONTENT_LENGTH=MAX_CONTENT_LENGTH,
+    )
+    app.config.update(config or {})
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', engine_options(app.config['SQLALCHEMY_DATABASE_URI']))
+    os.makedirs(app.instance_path, exist_ok=True)
+    
+    db.init_app(app)
     
+    from .routes.entry_routes import entry_routes
+    from .commands import import_entries_command
     app.register_blueprint(entry_routes)
+    app.cli.add_command(import_entries_command)
+    
+    with app.app_context():
+        db.create_all()
     
-    return app
\ No newline at end of file
+    return app
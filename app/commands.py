@@ -0,0 +1,14 @@
+import click
+from flask.cli import with_appcontext
+from app.services.entry_import import DEFAULT_BATCH_SIZE, import_entries
+
+@click.command('import-entries')
+@click.argument('csv_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--batch-size', default=DEFAULT_BATCH_SIZE, show_default=True, help='Rows per insert transaction.')
+@with_appcontext
+def import_entries_command(csv_path, batch_size):
+    """Bulk-import an Asosyal Sözlük CSV export into the entry table."""
+    # Offline load: the indexes of an empty table are built once at the end.
+    total = import_entries(csv_path, batch_size, on_batch=lambda count: click.echo(f"{count} entries imported", err=True),
+                           rebuild_indexes=True)
+    click.echo(f"Imported {total} entries from {csv_path}")
@@ -0,0 +1 @@
+from .entry import Entry
@@ -1,10 +1,55 @@
+from datetime import datetime, timezone
+import numpy as np
 from app import db
 
+# Hot ranking: every tenfold of net score is worth HOT_DECAY_SECONDS of
+# recency, so newer entries overtake older ones with the same score.
+HOT_EPOCH = datetime(2017, 1, 1)
+HOT_DECAY_SECONDS = 45000
+
+def hot_score(score, created_at_seconds):
+    """
+    Time-decayed rank of entries; works on scalars and numpy arrays.
+
+    The value is fixed once the vote counts are, so it can be stored and
+    indexed rather than recomputed at query time.
+
+    Args:
+    score: Net score(s), upvotes minus downvotes.
+    created_at_seconds: Creation time(s) in seconds since HOT_EPOCH.
+    """
+    order = np.log10(np.maximum(np.abs(score), 1))
+    return np.sign(score) * order + np.asarray(created_at_seconds) / HOT_DECAY_SECONDS
+
 class Entry(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     content = db.Column(db.Text, nullable=False)
-    upvotes = db.Column(db.Integer, default=0)
-    downvotes = db.Column(db.Integer, default=0)
+    upvotes = db.Column(db.Integer, nullable=False, default=0)
+    downvotes = db.Column(db.Integer, nullable=False, default=0)
+    # Columns of the archive export (baslik, tarih, silinmis).
+    title = db.Column(db.Text, nullable=False, default='')
+    created_at = db.Column(db.DateTime, index=True)
+    deleted = db.Column(db.Boolean, nullable=False, default=False)
+    # Maintained by the database from the vote counts.
+    score = db.Column(db.Integer, db.Computed('upvotes - downvotes', persisted=True))
+    # Maintained on insert and update, see `hot_score`.
+    hot = db.Column(db.Float, nullable=False, default=0.0)
+    
+    # Composite indexes backing the keyset pagination of /entries/sort:
+    # each sort mode is an ordered range scan on (sort column, id), so a
+    # top-K page reads K index entries instead of sorting the table.
+    __table_args__ = (
+        db.Index('ix_entry_upvotes_id', 'upvotes', 'id'),
+        db.Index('ix_entry_downvotes_id', 'downvotes', 'id'),
+        db.Index('ix_entry_score_id', 'score', 'id'),
+        db.Index('ix_entry_hot_id', 'hot', 'id'),
+    )
+    
+    def compute_hot(self):
+        """Return the hot score for the current votes and creation time."""
+        created_at = self.created_at or datetime.now(timezone.utc).replace(tzinfo=None)
+        score = (self.upvotes or 0) - (self.downvotes or 0)
+        return float(hot_score(score, (created_at - HOT_EPOCH).total_seconds()))
     
     # ... existing code ...
     
@@ -13,5 +58,15 @@ class Entry(db.Model):
             'id': self.id,
             'content': self.content,
             'upvotes': self.upvotes,
-            'downvotes': self.downvotes
-        }
\ No newline at end of file
+            'downvotes': self.downvotes,
+            'title': self.title,
+            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
+            'deleted': self.deleted,
+            'score': self.score,
+            'hot': self.hot
+        }
+
+@db.event.listens_for(Entry, 'before_insert')
+@db.event.listens_for(Entry, 'before_update')
+def _update_hot(mapper, connection, target):
+    target.hot = target.compute_hot()
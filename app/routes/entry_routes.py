@@ -1,18 +1,110 @@
-from flask import Blueprint, request, jsonify
+import json
+import math
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from sqlalchemy import tuple_
 from app.models import Entry
-from app import db
+from app.services.entry_import import import_entries
 
 entry_routes = Blueprint('entry_routes', __name__)
 
+SORT_COLUMNS = {
+    'most_upvoted': 'upvotes',
+    'most_downvoted': 'downvotes',
+    'best': 'score',
+    'hot': 'hot',
+}
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 1000
+# Rows fetched from the cursor at a time while streaming a page.
+STREAM_BATCH_SIZE = 500
+
+def encode_cursor(value, entry_id):
+    """Encode the sort key of the last entry of a page."""
+    return f"{value}:{entry_id}"
+
+def decode_cursor(cursor, value_type=int):
+    """Decode a cursor into (sort value, id); raises ValueError if malformed."""
+    value, entry_id = cursor.rsplit(':', 1)
+    value = value_type(value)
+    # 'nan' and 'inf' parse as floats but order against nothing meaningfully.
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"Cursor value is not finite: {value}")
+    return value, int(entry_id)
+
+def stream_page(query, column, limit):
+    """
+    Stream a page of entries as a JSON object.
+
+    One row beyond `limit` is read to know whether another page follows; the
+    cursor of the last emitted entry is written after the entries.
+    """
+    yield '{"entries": ['
+    last = None
+    has_more = False
+    for index, entry in enumerate(query.limit(limit + 1).yield_per(STREAM_BATCH_SIZE)):
+        if index == limit:
+            has_more = True
+            break
+        yield (',' if index else '') + json.dumps(entry.to_dict(), ensure_ascii=False)
+        last = entry
+    next_cursor = encode_cursor(getattr(last, column), last.id) if has_more else None
+    yield '], "next_cursor": ' + json.dumps(next_cursor) + '}'
+
 @entry_routes.route('/entries/sort', methods=['GET'])
 def sort_entries():
+    """
+    Return entries ordered by votes, one keyset-paginated page at a time.
+
+    Query parameters:
+    sort_by: 'most_upvoted' (default), 'most_downvoted', 'best' (net score)
+    or 'hot' (net score decayed by age).
+    limit: Page size, 1 to MAX_LIMIT (default DEFAULT_LIMIT).
+    cursor: The `next_cursor` of the previous page.
+
+    The response is streamed as `{"entries": [...], "next_cursor": ...}`;
+    `next_cursor` is null on the last page.
+    """
     sort_by = request.args.get('sort_by', 'most_upvoted')
-    
-    if sort_by == 'most_upvoted':
-        entries = Entry.query.order_by(Entry.upvotes.desc()).all()
-    elif sort_by == 'most_downvoted':
-        entries = Entry.query.order_by(Entry.downvotes.desc()).all()
-    else:
+    column = SORT_COLUMNS.get(sort_by)
+    if column is None:
         return jsonify({'error': 'Invalid sort parameter'}), 400
     
-    return jsonify([entry.to_dict() for entry in entries])
\ No newline at end of file
+    try:
+        limit = int(request.args.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        limit = None
+    if limit is None or not 1 <= limit <= MAX_LIMIT:
+        return jsonify({'error': f'limit must be between 1 and {MAX_LIMIT}'}), 400
+    
+    sort_column = getattr(Entry, column)
+    # Ties are broken by id so the order is total and matches the (votes, id) index.
+    query = Entry.query.order_by(sort_column.desc(), Entry.id.desc())
+    
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            value, entry_id = decode_cursor(cursor, sort_column.type.python_type)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        query = query.filter(tuple_(sort_column, Entry.id) < tuple_(value, entry_id))
+    
+    return Response(stream_with_context(stream_page(query, column, limit)), mimetype='application/json')
+
+
+@entry_routes.route('/entries/import', methods=['POST'])
+def import_entries_route():
+    """
+    Bulk-import an uploaded CSV export (multipart field `file`).
+
+    The upload is parsed straight from the request stream in batches. The
+    indexes stay in place, so concurrent /entries/sort requests keep their
+    range scans.
+    """
+    upload = request.files.get('file')
+    if upload is None or not upload.filename:
+        return jsonify({'error': 'No file uploaded'}), 400
+    try:
+        total = import_entries(upload.stream)
+    except (ValueError, KeyError) as e:
+        return jsonify({'error': f'Invalid CSV export: {e}'}), 400
+    return jsonify({'imported': total}), 201
@@ -0,0 +1,5 @@
+from .entry_import import import_entries
+
+__all__ = [
+    'import_entries'
+]
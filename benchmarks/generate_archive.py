@@ -0,0 +1,148 @@
+"""
+Synthetic asosyal sözlük exports for benchmarks.
+
+The archives follow the shape of real backups: quoted CSV with the
+`skor,baslik,entiri,silinmis,tarih` columns, Turkish text with apostrophe
+suffixes and (bkz: ...) references, multi-line entries, Zipf-distributed
+titles, an evening-heavy posting rhythm and about 8% deleted entries.
+Generation is deterministic for a given size and seed.
+
+Usage:
+python benchmarks/generate_archive.py 100k archive.csv
+"""
+import os
+import sys
+import csv
+import argparse
+import numpy as np
+import pandas as pd
+
+WORDS = """
+ve bir bu da de için ile ama çok daha gibi ne ki en olan var yok değil sonra önce şimdi zaten bile
+adam kadın insan hayat zaman gün gece sabah akşam yıl ay hafta dünya ülke şehir istanbul ankara izmir
+sözlük entry başlık yazar okur arkadaş anne baba kardeş abi abla hoca öğrenci okul üniversite sınav ders
+film dizi kitap müzik şarkı oyun maç futbol takım gol hakem taraftar sahne konser albüm sanatçı yönetmen
+kahve çay simit lahmacun döner ayran rakı bira yemek kahvaltı çorba tatlı baklava künefe pide köfte
+güzel kötü iyi harika berbat saçma komik üzücü garip ilginç sıkıcı zor kolay uzun kısa büyük küçük yeni eski
+sevmek gitmek gelmek yapmak etmek olmak bilmek düşünmek söylemek yazmak okumak izlemek dinlemek beklemek
+telefon bilgisayar internet uygulama mesaj bildirim şarj ekran klavye fare oyunu sunucu güncelleme hata
+ırmak ılık ışık ığdır çiçek şeker öğle ücret üzüm ördek güneş yağmur kar rüzgar deniz dağ orman bahçe
+""".split()
+# The first line of WORDS are function words, which never take a suffix.
+FUNCTION_WORDS = 25
+SUFFIXES = ["'nin", "'da", "'de", "'ya", "'ye", "'ı", "'i", "'ın", "'dan", "'ten", "'le"]
+SUFFIX_RATIO = 0.15
+LINE_COUNT = 60000
+TITLE_COUNT = 20000
+DELETED_RATIO = 0.08
+START = pd.Timestamp('2017-01-01')
+END = pd.Timestamp('2024-01-01')
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000, '5m': 5_000_000}
+
+
+def parse_size(size: str) -> int:
+    """Parse '100k', '1M' or a plain number into an entry count."""
+    return SIZES.get(size.lower()) or int(size)
+
+
+def _zipf_choice(rng: np.random.Generator, count: int, size: int, exponent: float) -> np.ndarray:
+    """Draw ranks 0..count-1 with Zipf-distributed frequencies."""
+    weights = 1.0 / np.arange(1, count + 1) ** exponent
+    return rng.choice(count, size=size, p=weights / weights.sum())
+
+
+def _sentence_pool(rng: np.random.Generator, count: int, min_words: int, max_words: int,
+                   suffix_ratio: float = SUFFIX_RATIO) -> list:
+    # Word ranks follow a Zipf law, like real text; the word list is shuffled
+    # once so the most frequent words are a mix of function and content words.
+    order = rng.permutation(len(WORDS))
+    ranks = order[_zipf_choice(rng, len(WORDS), count * max_words, 1.1)]
+    lengths = rng.integers(min_words, max_words + 1, size=count)
+    suffixes = np.where(rng.random(count * max_words) < suffix_ratio,
+                        rng.integers(0, len(SUFFIXES), size=count * max_words), -1)
+    pool = []
+    for i, length in enumerate(lengths):
+        start = i * max_words
+        words = [WORDS[rank] + (SUFFIXES[suffix] if suffix >= 0 and rank >= FUNCTION_WORDS else '')
+                 for rank, suffix in zip(ranks[start:start + length], suffixes[start:start + length])]
+        pool.append(' '.join(words))
+    return pool
+
+
+def generate_chunk(rng: np.random.Generator, size: int, lines: list, titles: list) -> pd.DataFrame:
+    """Generate `size` export rows."""
+    title_ids = _zipf_choice(rng, len(titles), size, 0.8)
+    line_counts = np.minimum(rng.geometric(0.55, size=size), 8)
+    line_ids = rng.integers(0, len(lines), size=int(line_counts.sum()))
+    bkz = rng.random(size) < 0.05
+    links = rng.random(size) < 0.02
+
+    entries = []
+    position = 0
+    for i, count in enumerate(line_counts):
+        text = '\n'.join(lines[line_id] for line_id in line_ids[position:position + count])
+        position += count
+        if bkz[i]:
+            text += f"\n(bkz: {titles[title_ids[i - 1]]})"
+        if links[i]:
+            text += f" https://www.example.com/{i}"
+        entries.append(text)
+
+    # Posting times are uniform over the years, but weighted towards evenings.
+    days = rng.integers(0, (END - START).days, size=size)
+    hours = rng.choice(24, size=size, p=_HOUR_WEIGHTS)
+    offsets = (days * 86400 + hours * 3600 + rng.integers(0, 3600, size=size)) * 1000 + rng.integers(0, 1000, size=size)
+    tarih = (START + pd.to_timedelta(offsets, unit='ms')).strftime('%Y-%m-%dT%H:%M:%S.%f').str[:-3] + 'Z'
+
+    return pd.DataFrame({
+        'skor': rng.negative_binomial(1, 0.25, size=size) - rng.poisson(0.4, size=size),
+        'baslik': [titles[title_id] for title_id in title_ids],
+        'entiri': entries,
+        'silinmis': np.where(rng.random(size) < DELETED_RATIO, 'true', 'false'),
+        'tarih': tarih,
+    })
+
+
+_HOUR_WEIGHTS = np.array([4, 3, 2, 1, 1, 1, 1, 2, 3, 4, 4, 5, 5, 5, 5, 5, 6, 6, 7, 8, 9, 9, 8, 6], dtype=float)
+_HOUR_WEIGHTS /= _HOUR_WEIGHTS.sum()
+
+
+def generate_archive(path: str, size: int, seed: int = 0, chunk_size: int = 100_000) -> str:
+    """
+    Write a synthetic export of `size` entries to `path`.
+
+    Args:
+    path (str): Output CSV path.
+    size (int): Number of entries.
+    seed (int): Random seed; the same size and seed give the same file.
+    chunk_size (int): Rows generated and written at a time.
+
+    Returns:
+    str: The path of the archive.
+    """
+    rng = np.random.default_rng(seed)
+    lines = _sentence_pool(rng, LINE_COUNT, 3, 25)
+    titles = _sentence_pool(rng, TITLE_COUNT, 1, 4, suffix_ratio=0.0)
+    partial = f"{path}.part"
+    with open(partial, 'w', encoding='utf-8', newline='') as f:
+        for start in range(0, size, chunk_size):
+            chunk = generate_chunk(rng, min(chunk_size, size - start), lines, titles)
+            chunk.to_csv(f, header=start == 0, index=False, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+    os.replace(partial, path)
+    return path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic asosyal sözlük export.")
+    parser.add_argument('size', help="number of entries, e.g. 10k, 100k, 1M, 5M or 25000")
+    parser.add_argument('path', help="output CSV path")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+    generate_archive(args.path, parse_size(args.size), args.seed)
+    print(f"Wrote {args.path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
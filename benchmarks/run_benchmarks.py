@@ -0,0 +1,227 @@
+"""
+Benchmark suite for the ingest, filter, search, analytics and chart paths.
+
+Each benchmark runs on synthetic archives (see generate_archive.py), reports
+the best of `--repeat` runs in seconds, and is compared with a stored
+baseline; a benchmark slower than baseline * threshold is a regression.
+
+Usage:
+python benchmarks/run_benchmarks.py --sizes 10k 100k
+python benchmarks/run_benchmarks.py --sizes 10k 100k 1M --save-baseline
+python benchmarks/run_benchmarks.py --sizes 1M 5M --repeat 1 --output results.json
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+from typing import Any, Callable, Dict, List, Optional
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(BENCHMARK_DIR), 'src'))
+sys.path.insert(0, BENCHMARK_DIR)
+
+import numpy as np
+import pandas as pd
+from generate_archive import generate_archive, parse_size
+from services.entry_store import read_entry_store_chunked
+from services.snapshot import write_snapshot, read_snapshot
+from services.filter_masks import FilterMasks
+from services.search_index import SearchIndex
+from services.relevance_index import RelevanceIndex
+from services.word_frequency import WordCounts
+from services.ngrams import NgramCounts
+from services.rollups import TimeRollups
+from services.export import iter_export, write_export
+from utils.data_validation import clean_data
+from components.display_component import render_entries_html
+from components.visualization_component import (
+    prepare_data, yearly_entry_count_chart, monthly_entry_trend_chart, daily_entry_trend_chart,
+    hourly_entry_trend_chart, activity_heatmap, word_frequency_chart
+)
+
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+DEFAULT_THRESHOLD = 1.25
+# Differences below this are timer noise, whatever the ratio.
+MIN_REGRESSION_SECONDS = 0.005
+
+
+class _NullWriter:
+    """Binary sink that only counts bytes, so exports measure serialization."""
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall-clock time of `repeat` runs of `fn`, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_suite(archive_path: str, repeat: int = 3) -> Dict[str, float]:
+    """
+    Time every benchmark on one archive.
+
+    Args:
+    archive_path (str): Path of a CSV export.
+    repeat (int): Runs per benchmark; the best one is reported.
+
+    Returns:
+    Dict[str, float]: Seconds per benchmark name.
+    """
+    results: Dict[str, float] = {}
+
+    def bench(name: str, fn: Callable[[], Any]) -> None:
+        results[name] = round(measure(fn, repeat), 6)
+        print(f"  {name:<28} {results[name] * 1000:10.1f} ms", file=sys.stderr)
+
+    # process_data: chunked CSV ingest, then the snapshot round trip used on later loads.
+    bench('ingest_csv', lambda: read_entry_store_chunked(archive_path, 'bench'))
+    store = read_entry_store_chunked(archive_path, 'bench')
+    snapshot_dir = tempfile.mkdtemp(prefix='asosyal-bench-snapshots-')
+    try:
+        def snapshot_write():
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+            write_snapshot(store, directory=snapshot_dir)
+        bench('snapshot_write', snapshot_write)
+        bench('snapshot_load', lambda: read_snapshot('bench', directory=snapshot_dir))
+        store = read_snapshot('bench', directory=snapshot_dir)
+
+        raw = pd.read_csv(archive_path)
+        bench('clean_data', lambda: clean_data(raw.copy()))
+        bench('prepare_data', lambda: prepare_data(store))
+
+        # Filter paths: a cold date + deletion filter, then the memoized rerun of a page flip.
+        start, end = store.date_bounds()
+        middle = start + (end - start) / 2
+        bench('filter_cold', lambda: FilterMasks(store).rows(start, middle, show_deleted=False))
+        masks = FilterMasks(store)
+        rows = masks.rows(start, middle, show_deleted=False)
+        bench('filter_page_flip', lambda: masks.rows(start, middle, show_deleted=False))
+
+        bench('search_index_build', lambda: SearchIndex.from_store(store))
+        index = SearchIndex.from_store(store)
+        bench('search_query', lambda: index.search('kahve'))
+        bench('search_query_short', lambda: index.search('ka'))
+
+        bench('relevance_index_build', lambda: RelevanceIndex.from_store(store))
+        relevance = RelevanceIndex.from_store(store)
+        bench('relevance_top100', lambda: relevance.search('bir gün kahve', 100))
+
+        bench('word_counts_build', lambda: WordCounts.from_store(store))
+        word_counts = store.memo('word_counts', WordCounts.from_store)
+        bench('word_counts_top_filtered', lambda: word_counts.top_words(rows, n=20))
+
+        bench('ngrams_build', lambda: NgramCounts.from_store(store))
+
+        bench('rollups_build', lambda: TimeRollups.from_store(store))
+        rollups = TimeRollups.from_store(store)
+        bench('chart_yearly', lambda: yearly_entry_count_chart(rollups))
+        bench('chart_monthly', lambda: monthly_entry_trend_chart(rollups))
+        bench('chart_daily', lambda: daily_entry_trend_chart(rollups))
+        bench('chart_hourly', lambda: hourly_entry_trend_chart(rollups))
+        bench('chart_heatmap', lambda: activity_heatmap(rollups))
+        bench('chart_word_frequency', lambda: word_frequency_chart(store, rows))
+
+        bench('render_page_100', lambda: render_entries_html(store.records(rows[:100])))
+        bench('export_ndjson_filtered', lambda: write_export(iter_export(store, rows, 'ndjson'), _NullWriter()))
+    finally:
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    Find benchmarks that got slower than the baseline allows.
+
+    Args:
+    results (Dict[str, Dict[str, float]]): Seconds per benchmark, per archive size.
+    baseline (Dict[str, Dict[str, float]]): The stored results, same layout.
+    threshold (float): Allowed slowdown ratio.
+
+    Returns:
+    List[str]: One message per regression.
+    """
+    regressions = []
+    for size, timings in results.items():
+        for name, seconds in timings.items():
+            reference = baseline.get(size, {}).get(name)
+            if reference is None:
+                continue
+            if seconds > reference * threshold and seconds - reference > MIN_REGRESSION_SECONDS:
+                regressions.append(f"{name} @ {size}: {seconds * 1000:.1f} ms vs baseline {reference * 1000:.1f} ms "
+                                   f"({seconds / reference:.2f}x)")
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('results', {})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the asosyal sözlük data paths.")
+    parser.add_argument('--sizes', nargs='+', default=['10k', '100k'], help="archive sizes, e.g. 10k 100k 1M 5M")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'asosyal-bench'),
+                        help="where generated archives are cached")
+    parser.add_argument('--output', help="write the results as JSON to this path")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown ratio")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the baseline")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    results: Dict[str, Dict[str, float]] = {}
+    for size_name in args.sizes:
+        size = parse_size(size_name)
+        path = os.path.join(args.data_dir, f"archive-{size}-seed{args.seed}.csv")
+        if not os.path.exists(path):
+            print(f"Generating {size:,} entries into {path}", file=sys.stderr)
+            generate_archive(path, size, args.seed)
+        print(f"{size:,} entries:", file=sys.stderr)
+        results[str(size)] = run_suite(path, args.repeat)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'repeat': args.repeat,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+
+    if args.save_baseline:
+        stored = load_baseline(args.baseline)
+        stored.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(dict(report, results=stored), f, indent=2)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
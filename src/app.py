@@ -1,44 +1,149 @@
 import streamlit as st
-import json
-import os
-from services.csv_to_json import process_uploaded_file
-from components.display_component import display_entries
-from components.search_filter_component import run_search_filter_component, search_filter_sidebar
-from components.visualization_component import run_visualization_component, prepare_data
-import math
-import csv
-import pandas as pd
-from itertools import islice
-from datetime import datetime, timedelta
-import pytz
-import tempfile
+from services.entry_store import EntryStore, read_entry_store_chunked
+from services.dataset_cache import get_dataset_cache
+from services.jobs import get_job_manager, store_job_key
+from services.search_index import get_search_index
+from services.title_index import get_title_index
+from services.snapshot import read_snapshot, write_snapshot, prune_snapshots
+from services.error_handling import logger
+from services.instrumentation import stage_timer, get_performance_recorder
+from utils.file_handling import (
+    save_uploaded_file, remove_temp_file, hash_file_content, combine_content_hashes, cleanup_temp_files
+)
 from importlib import import_module
 
+# Components (and their plotting dependencies) are imported by load_component
+# only once the section that needs them is rendered.
+
 # Initialize session state
 if 'json_data' not in st.session_state:
     st.session_state.json_data = None
 
-@st.cache_data
-def process_data(file_path):
-    df = pd.read_csv(file_path, encoding='utf-8')
-    return df.to_dict('records')
+def get_content_hash(uploaded_file):
+    """Hash the upload once per session instead of on every rerun."""
+    hashes = st.session_state.setdefault('upload_hashes', {})
+    if uploaded_file.file_id not in hashes:
+        hashes[uploaded_file.file_id] = hash_file_content(uploaded_file.getvalue())
+    return hashes[uploaded_file.file_id]
 
-def save_uploaded_file(uploaded_file):
-    """Save the uploaded file to a temporary directory."""
+def snapshot_store(store, content_hash):
+    """Persist a freshly built store and serve it from its memory-mapped snapshot, bodies compressed."""
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            return tmp_file.name
-    except Exception as e:
-        st.error(f"Error saving file: {e}")
-        return None
-
-def load_component(component_name):
+        with stage_timer('snapshot'):
+            write_snapshot(store)
+            prune_snapshots()
+    except OSError as e:
+        logger.error(f"Could not write snapshot for {content_hash}: {e}")
+        # The store stays on the heap; compressed bodies keep it a fraction of the size.
+        return store.compress_text()
+    # Serve from the memory-mapped snapshot so the heap copy can be freed.
+    return read_snapshot(content_hash) or store
+
+def load_upload(job, cache, uploaded_file, content_hash, step=""):
+    """Parse one upload into a store, or load its snapshot, reporting to a job."""
+    def load():
+        # A snapshot from an earlier load of the same content skips CSV parsing entirely.
+        store = read_snapshot(content_hash)
+        if store is not None:
+            return store
+
+        # Errors propagate: the job is marked failed and display_job_status shows them.
+        file_path = save_uploaded_file(uploaded_file, content_hash)
+
+        def show_progress(progress):
+            date_range = f"{progress.min_tarih.date()} - {progress.max_tarih.date()}" if progress.entries else "-"
+            # Raises JobCancelled once the user cancels, which stops the ingest.
+            job.report(progress.fraction, f"Girdiler yükleniyor{step}... {progress.entries:,} girdi · "
+                                          f"Karma: {progress.karma:,} · Tarih aralığı: {date_range}")
+
+        try:
+            with stage_timer('ingest'):
+                store = read_entry_store_chunked(file_path, content_hash, on_progress=show_progress)
+        finally:
+            remove_temp_file(file_path)
+            cleanup_temp_files()
+        return snapshot_store(store, content_hash)
+
+    job.report(0.0, f"Girdiler yükleniyor{step}...")
+    return cache.get_or_load(content_hash, load)
+
+def ingest_uploads(job, cache, uploads, dataset_hash):
+    """
+    Background job: load the uploads and merge them into one dataset.
+
+    Each upload is cached and snapshotted on its own, so adding another
+    backup later only parses the new file. Entries present in several
+    backups are kept once.
+    """
+    if len(uploads) == 1:
+        content_hash, uploaded_file = uploads[0]
+        return index_titles(load_upload(job, cache, uploaded_file, content_hash))
+
+    def load():
+        store = read_snapshot(dataset_hash)
+        if store is not None:
+            return store
+        stores = []
+        for number, (content_hash, uploaded_file) in enumerate(uploads, start=1):
+            stores.append(load_upload(job, cache, uploaded_file, content_hash, step=f" ({number}/{len(uploads)})"))
+        job.report(1.0, "Arşivler birleştiriliyor...")
+        with stage_timer('merge'):
+            store = EntryStore.merge(stores, dataset_hash)
+        return snapshot_store(store, dataset_hash)
+
+    return index_titles(cache.get_or_load(dataset_hash, load))
+
+def index_titles(store):
+    """Build the title index as part of the ingest; it is cheap next to parsing."""
+    if store is not None:
+        get_title_index(store)
+    return store
+
+def build_search_index(job, store):
+    """Background job: build the search index before the first search needs it."""
+    # The index lives in the store's memo; the job does not keep a reference of its own.
+    get_search_index(store)
+
+def process_data(uploaded_files):
+    """
+    Return the dataset for one or more uploads, reusing it across reruns and sessions.
+
+    Parsing runs as a background job; until it is done this shows its
+    progress and returns None.
+    """
+    # Sorted by content so the same set of files always merges in the same order.
+    uploads = sorted({get_content_hash(uploaded_file): uploaded_file for uploaded_file in uploaded_files}.items(),
+                     key=lambda upload: upload[0])
+    dataset_hash = uploads[0][0] if len(uploads) == 1 else combine_content_hashes([upload[0] for upload in uploads])
+    cache = get_dataset_cache()
+    store = cache.get(dataset_hash)
+    if store is None:
+        # The cache is passed in: Streamlit's cached resources are not available to worker threads.
+        job = get_job_manager().submit(f"ingest:{dataset_hash}", ingest_uploads, cache, uploads, dataset_hash,
+                                       label="Girdilerin yüklenmesi")
+        store = load_component("job_component", "display_job_status")(job)
+    if store is not None:
+        key = store_job_key('search_index', store)
+        if store.is_memoized('search_index'):
+            # The index is in the store's memo; nothing reads the finished job.
+            get_job_manager().discard(key)
+        else:
+            # Concurrent searches wait for this build instead of starting their own.
+            get_job_manager().submit(key, build_search_index, store)
+    return store
+
+@st.cache_resource
+def load_component(component_name, entry_point=None):
+    """Import a component on first use and return its entry point, cached across reruns."""
     module = import_module(f"components.{component_name}")
-    return getattr(module, f"run_{component_name}")
+    return getattr(module, entry_point or f"run_{component_name}")
 
 # Main app logic
 def main():
+    # Stage timings of this rerun (including the jobs it starts) are grouped under it.
+    recorder = get_performance_recorder()
+    recorder.start_rerun()
+
     st.title("Asosyal Sözlük CSV Analiz")
 
     # Kullanıcı Kılavuzu ve Geliştirici Bilgileri
@@ -68,26 +173,37 @@ def main():
     Desteğin ve ilgin için teşekkürler!
     """)
 
-    uploaded_file = st.file_uploader("CSV dosyasını yükleyin", type="csv")
+    # Several backups (of the same or different accounts) are merged into one dataset.
+    uploaded_files = st.file_uploader("CSV dosyasını yükleyin", type="csv", accept_multiple_files=True)
 
-    if uploaded_file is not None:
-        file_path = save_uploaded_file(uploaded_file)
-        if file_path:
-            entries = process_data(file_path)
+    if uploaded_files:
+        entries = process_data(uploaded_files)
+        if entries is not None:
             st.write(f"Number of entries loaded: {len(entries)}")
             
+            # The sidebar filters drive both the charts and the entry list
+            filter_options = load_component("search_filter_component", "search_filter_sidebar")(entries)
+            filtered_rows = load_component("search_filter_component", "filter_rows")(entries, filter_options)
+            
             # Data Analysis and Visualization Section
             st.header("Veri Görselleştirme")
             visualization_component = load_component("visualization_component")
-            visualization_component(entries)
+            visualization_component(entries, filtered_rows)
+
+            # Topic rankings and per-title drill-down
+            st.header("Başlıklar")
+            load_component("title_component")(entries, filter_options["display_mode"])
             
             # Entries Display Section
             st.header("Girdiler")
             search_filter_component = load_component("search_filter_component")
-            search_filter_component(entries)
-
+            search_filter_component(entries, filter_options)
     else:
         st.warning("Lütfen bir CSV dosyası yükleyin.")
 
+    load_component("performance_component", "display_performance_panel")(recorder)
+    if uploaded_files:
+        load_component("job_component", "poll_running_jobs")()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
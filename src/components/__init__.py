@@ -1,12 +1,35 @@
-from .display_component import display_entries
-from .search_filter_component import run_search_filter_component
-from .upload_component import upload_csv, display_upload_status
-from .visualization_component import run_visualization_component
+from importlib import import_module
+
+# Components are imported on first use so that loading one of them (or the
+# package) does not pull in the heavy dependencies of the others, e.g. plotly
+# for the visualization component.
+_EXPORTS = {
+    'display_entries': 'display_component',
+    'display_page': 'display_component',
+    'display_job_status': 'job_component',
+    'poll_running_jobs': 'job_component',
+    'display_performance_panel': 'performance_component',
+    'run_search_filter_component': 'search_filter_component',
+    'run_title_component': 'title_component',
+    'upload_csv': 'upload_component',
+    'display_upload_status': 'upload_component',
+    'run_visualization_component': 'visualization_component',
+}
 
 __all__ = [
     'display_entries',
+    'display_page',
+    'display_job_status',
+    'poll_running_jobs',
+    'display_performance_panel',
     'run_search_filter_component',
+    'run_title_component',
     'upload_csv',
     'display_upload_status',
     'run_visualization_component'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -1,8 +1,18 @@
 import streamlit as st
 import json
-from typing import List, Dict, Any
-import datetime
+import html
+from typing import List, Dict, Any, Hashable, Optional, Sequence, Tuple
 from datetime import datetime
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.instrumentation import stage_timer
+from services.relevance_index import highlight, snippet
+from utils.turkish_text import turkish_casefold, turkish_sort_key
+
+DISPLAY_MODES = ["Compact", "Table", "Detailed"]
+# Rendered pages kept per process; a page is a few dozen KB of HTML at most.
+PAGE_CACHE_SIZE = 256
 
 def render_entry(entry: Dict[str, Any]):
     """Render a single blog entry."""
@@ -15,16 +25,27 @@ def render_entry(entry: Dict[str, Any]):
     st.markdown("---")
 
 def sort_entries(entries: List[Dict[str, Any]], sort_by: str, ascending: bool) -> List[Dict[str, Any]]:
-    """Sort entries based on the given criteria."""
+    """
+    Sort entry dictionaries; titles are collated in Turkish alphabetical order.
+
+    Store-backed lists use the presorted permutations of `services.sort_order` instead.
+    """
     if sort_by == 'tarih':
-        return sorted(entries, key=lambda x: datetime.datetime.strptime(x['tarih'], "%Y-%m-%d %H:%M:%S"), reverse=not ascending)
-    elif sort_by in ['skor', 'baslik']:
-        return sorted(entries, key=lambda x: x[sort_by], reverse=not ascending)
+        # ISO 8601, with or without the 'Z' suffix and the 'T' separator; naive times are UTC.
+        # datetime.fromisoformat only accepts 'Z' from Python 3.11 on.
+        keys = pd.to_datetime([x['tarih'] for x in entries], utc=True, format='ISO8601')
+        order = sorted(range(len(entries)), key=lambda i: keys[i], reverse=not ascending)
+        return [entries[i] for i in order]
+    elif sort_by == 'baslik':
+        return sorted(entries, key=lambda x: turkish_sort_key(x['baslik']), reverse=not ascending)
+    elif sort_by == 'skor':
+        return sorted(entries, key=lambda x: x['skor'], reverse=not ascending)
     return entries
 
 def filter_entries(entries: List[Dict[str, Any]], search_term: str, show_deleted: bool) -> List[Dict[str, Any]]:
     """Filter entries based on search term and deletion status."""
-    filtered = [e for e in entries if search_term.lower() in e['baslik'].lower() or search_term.lower() in e['entiri'].lower()]
+    search_term = turkish_casefold(search_term)
+    filtered = [e for e in entries if search_term in turkish_casefold(e['baslik']) or search_term in turkish_casefold(e['entiri'])]
     if not show_deleted:
         filtered = [e for e in filtered if not e['silinmis']]
     return filtered
@@ -36,6 +57,87 @@ def format_date(date_string: str) -> str:
     except ValueError:
         return date_string  # Return original string if parsing fails
 
+def _escape(value: Any) -> str:
+    return html.escape(str(value)).replace('\n', '<br>')
+
+def _marked(segments: List[Tuple[str, bool]]) -> str:
+    return ''.join(f'<mark>{_escape(text)}</mark>' if match else _escape(text) for text, match in segments)
+
+def render_entries_html(entries: List[Dict[str, Any]], terms: Sequence[str] = ()) -> str:
+    """
+    Render a page of entries as one pre-escaped HTML block.
+
+    The block is a single line, so markdown never re-interprets the escaped
+    entry text, and the whole page reaches the browser as one element.
+
+    Args:
+    entries (List[Dict[str, Any]]): The entries of the page.
+    terms (Sequence[str]): Query terms to highlight. If given, each body is
+    cut down to its best-matching snippet.
+
+    Returns:
+    str: HTML for `st.markdown(..., unsafe_allow_html=True)`.
+    """
+    terms = list(terms)
+    parts = []
+    for entry in entries:
+        deleted = '<div><em>(Deleted)</em></div>' if entry['silinmis'] else ''
+        if terms:
+            title, body = _marked(highlight(entry["baslik"], terms)), _marked(snippet(entry["entiri"], terms))
+        else:
+            title, body = _escape(entry["baslik"]), _escape(entry["entiri"])
+        parts.append(
+            '<div style="display:flex;gap:1rem">'
+            f'<div style="min-width:3rem;text-align:center">↑<br>[{_escape(entry["skor"])}]<br>↓</div>'
+            f'<div><h3>{title}</h3><p>{body}</p>'
+            f'<div>Date: {_escape(entry["tarih"])}</div>{deleted}</div>'
+            '</div><hr>'
+        )
+    return ''.join(parts)
+
+@st.cache_data(max_entries=PAGE_CACHE_SIZE, show_spinner=False)
+def cached_page_html(page_key: Hashable, _store: EntryStore, _rows: np.ndarray, terms: Tuple[str, ...] = ()) -> str:
+    """
+    Render a page of a store, cached by `page_key` and `terms`.
+
+    The key must identify the dataset, the filter and the page, e.g.
+    `(store.fingerprint, filter_signature, page, entries_per_page)`; the
+    store and rows themselves are not hashed.
+    """
+    return render_entries_html(_store.records(_rows), terms)
+
+@stage_timer('render')
+def display_page(store: EntryStore, page_rows: np.ndarray, mode: str = "Compact", page_key: Hashable = None,
+                 terms: Optional[Sequence[str]] = None):
+    """
+    Display a page of entries from a store.
+
+    Args:
+    store (EntryStore): The loaded entries.
+    page_rows (np.ndarray): Row ids of the page.
+    mode (str): "Compact" renders one HTML block, "Table" a scrollable grid
+    and "Detailed" the per-entry layout of `display_entries`.
+    page_key (Hashable): Cache key of the page for the compact mode. Pages
+    without a key (e.g. of a store without fingerprint) are not cached.
+    terms (Optional[Sequence[str]]): Query terms of a ranked search. The
+    compact and table modes then show each body's best-matching snippet,
+    computed for this page only; the compact mode highlights the terms.
+    """
+    terms = tuple(terms or ())
+    if mode == "Table":
+        frame = store.frame(page_rows)
+        if terms:
+            frame['entiri'] = [''.join(text for text, _ in snippet(body, list(terms))) for body in frame['entiri']]
+        st.dataframe(frame, hide_index=True, use_container_width=True)
+    elif mode == "Compact":
+        if page_key is None:
+            page_html = render_entries_html(store.records(page_rows), terms)
+        else:
+            page_html = cached_page_html(page_key, store, page_rows, terms)
+        st.markdown(page_html, unsafe_allow_html=True)
+    else:
+        display_entries(store.records(page_rows))
+
 def display_entries(entries: List[Dict[str, Any]]):
     """Display the filtered entries in a format similar to the image."""
     st.write(f"Number of entries received for display: {len(entries)}")  # Debug statement
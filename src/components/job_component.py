@@ -0,0 +1,54 @@
+import time
+import streamlit as st
+from typing import Any, Optional
+from services.jobs import Job, get_job_manager, PENDING, RUNNING, DONE, FAILED
+
+# Delay between reruns while a displayed job is still running.
+POLL_INTERVAL = 0.5
+
+def display_job_status(job: Job) -> Optional[Any]:
+    """
+    Show the state of a background job and return its result once done.
+
+    Running jobs get a progress bar and a cancel button; failed and
+    cancelled jobs can be retried.
+
+    Args:
+    job (Job): The job handle.
+
+    A finished job is forgotten once its result is returned: the caller
+    keeps what it needs (e.g. the dataset cache holds the store), and the
+    session does not keep results alive after those caches evict them.
+
+    Returns:
+    Optional[Any]: The job's result, or None while it is not done.
+    """
+    status = job.status
+    if status == DONE:
+        result = job.result()
+        get_job_manager().discard(job.key)
+        return result
+
+    job.watched = True
+    if status in (PENDING, RUNNING):
+        st.progress(job.progress, text=job.message or job.label)
+        if st.button("İptal", key=f"cancel-{job.key}"):
+            job.cancel()
+            st.rerun()
+        return None
+
+    if status == FAILED:
+        # Logged once by the job manager when it failed; this runs on every rerun.
+        st.error(f"{job.label} başarısız oldu: {job.error()}")
+    else:
+        st.info(f"{job.label} iptal edildi.")
+    if st.button("Tekrar dene", key=f"retry-{job.key}"):
+        get_job_manager().discard(job.key)
+        st.rerun()
+    return None
+
+def poll_running_jobs(interval: float = POLL_INTERVAL):
+    """Rerun the script while a displayed job runs, so its progress and result show up."""
+    if any(job.watched for job in get_job_manager().active()):
+        time.sleep(interval)
+        st.rerun()
@@ -0,0 +1,44 @@
+import streamlit as st
+import pandas as pd
+from services.instrumentation import PerformanceRecorder, set_memory_tracking
+
+_COLUMNS = {
+    'stage': 'Stage',
+    'runs': 'Runs',
+    'wall_ms': 'Wall (ms)',
+    'max_wall_ms': 'Max wall (ms)',
+    'cpu_ms': 'CPU (ms)',
+    'peak_mib': 'Peak (MiB)',
+}
+
+def _summary_table(rows) -> pd.DataFrame:
+    return pd.DataFrame(rows, columns=list(_COLUMNS)).rename(columns=_COLUMNS).round(1)
+
+def display_performance_panel(recorder: PerformanceRecorder):
+    """
+    Show the stage timings of this rerun and of the whole session in the sidebar.
+
+    The panel is opt-in; memory tracking, which slows everything down while
+    it is on, has its own switch. The timings can be downloaded as
+    newline-delimited JSON.
+
+    Args:
+    recorder (PerformanceRecorder): The session's recorder.
+    """
+    if not st.sidebar.checkbox("Show performance panel", value=False):
+        return
+
+    st.sidebar.header("Performance")
+    track_memory = st.sidebar.checkbox("Track peak memory (slower)", value=False)
+    set_memory_tracking(track_memory, recorder)
+
+    st.sidebar.caption(f"This rerun (#{recorder.rerun})")
+    st.sidebar.dataframe(_summary_table(recorder.summary(recorder.rerun)), hide_index=True)
+    st.sidebar.caption("Session")
+    st.sidebar.dataframe(_summary_table(recorder.summary()), hide_index=True)
+    st.sidebar.download_button(
+        "Download timings (NDJSON)",
+        data=recorder.to_ndjson(),
+        file_name="asosyal-performance.ndjson",
+        mime="application/x-ndjson",
+    )
@@ -1,24 +1,47 @@
 import streamlit as st
 import json
-from typing import List, Dict, Any
-from dateutil import parser
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
-from components.display_component import display_entries
+from components.display_component import DISPLAY_MODES, display_page
 from datetime import timedelta
 import math
+import numpy as np
+from services.entry_store import EntryStore
+from services.filter_masks import get_filter_masks
+from services.relevance_index import get_relevance_index, query_terms
+from services.jobs import get_job_manager, store_job_key
+from components.job_component import display_job_status
+from services.export import EXPORT_FORMATS, export_to_buffer
+from utils.turkish_text import turkish_casefold
+
+# Entry list orders, mapped to a sort key (None keeps file order) and direction.
+# 'relevance' ranks the search results by BM25 instead of substring matching.
+RELEVANCE = 'relevance'
+SORT_OPTIONS = {
+    "File order": (None, True),
+    "Relevance (BM25)": (RELEVANCE, False),
+    "Newest first": ('tarih', False),
+    "Oldest first": ('tarih', True),
+    "Highest score": ('skor', False),
+    "Lowest score": ('skor', True),
+    "Title (A-Z)": ('baslik', True),
+    "Title (Z-A)": ('baslik', False),
+}
+# Results of a ranked search; relevance beyond the first pages is noise.
+RANKED_RESULTS = 1000
 
 def parse_date(date_string: str) -> datetime:
     """Parse an ISO 8601 date string into a datetime object."""
+    # Only the list-based helpers need dateutil; keep it off the startup path.
+    from dateutil import parser
     return parser.isoparse(date_string)
 
 def search_entries(entries, query):
-    query = query.lower()
+    query = turkish_casefold(query)
     
     def safe_lower(value):
-        """Safely convert a value to lowercase string."""
-        if value is None:
-            return ""
-        return str(value).lower()
+        """Safely convert a value to a Turkish-casefolded string."""
+        return turkish_casefold(value)
 
     seen_entries = set()
     filtered_entries = []
@@ -26,7 +49,8 @@ def search_entries(entries, query):
     for entry in entries:
         if (query in safe_lower(entry.get('baslik', '')) or 
             query in safe_lower(entry.get('entiri', ''))):
-            entry_id = entry.get('id', entry.get('tarih'))  # Use a unique identifier
+            # Exports carry no id; entries are the same only if their content is
+            entry_id = entry.get('id') or (entry.get('baslik'), entry.get('tarih'), entry.get('entiri'))
             if entry_id not in seen_entries:
                 seen_entries.add(entry_id)
                 filtered_entries.append(entry)
@@ -53,13 +77,10 @@ def filter_deleted(entries: List[Dict[str, Any]], show_deleted: bool) -> List[Di
         return entries
     return [entry for entry in entries if not entry['silinmis']]
 
-def search_filter_sidebar(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+def search_filter_sidebar(store: EntryStore) -> Dict[str, Any]:
     """Create a sidebar for search and filter options, setting default date range based on entries."""
-    if entries:
-        # Extract dates from entries and parse them
-        dates = [parser.isoparse(entry['tarih']) for entry in entries if 'tarih' in entry]
-        min_date = min(dates).date() if dates else datetime.now().date()
-        max_date = max(dates).date() if dates else datetime.now().date()
+    if len(store):
+        min_date, max_date = (bound.date() for bound in store.date_bounds())
     else:
         # Default to last year if no entries are available
         today = datetime.now().date()
@@ -71,54 +92,148 @@ def search_filter_sidebar(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
     search_term = st.sidebar.text_input("Search entries")
     date_range = st.sidebar.date_input("Date range", value=(min_date, max_date))
     show_deleted = st.sidebar.checkbox("Show deleted entries", value=False)
+    sort_by, ascending = SORT_OPTIONS[st.sidebar.selectbox("Sort by", options=list(SORT_OPTIONS), index=0)]
     entries_per_page = st.sidebar.selectbox("Entries per page", options=[10, 20, 50, 100], index=0)
+    display_mode = st.sidebar.selectbox("Display mode", options=DISPLAY_MODES, index=0)
+
+    if sort_by == RELEVANCE and not relevance_index_ready(store, search_term):
+        # Substring matches in file order until the index is built.
+        sort_by, ascending = None, True
 
     return {
         "search_term": search_term,
         "start_date": datetime.combine(date_range[0], datetime.min.time()).replace(tzinfo=timezone.utc),
         "end_date": datetime.combine(date_range[1], datetime.max.time()).replace(tzinfo=timezone.utc),
         "show_deleted": show_deleted,
-        "entries_per_page": entries_per_page
+        "sort_by": sort_by,
+        "ascending": ascending,
+        "entries_per_page": entries_per_page,
+        "display_mode": display_mode
     }
 
-def run_search_filter_component(entries):
+def build_relevance_index(job, store: EntryStore):
+    """Background job: build the BM25 index of a store."""
+    return get_relevance_index(store, on_progress=lambda fraction: job.report(fraction, "Arama dizini hazırlanıyor..."))
+
+def relevance_index_ready(store: EntryStore, search_term: str) -> bool:
+    """
+    Whether a ranked search can run now.
+
+    Starts building the BM25 index on the first ranked search of a dataset
+    and shows its progress in the sidebar meanwhile.
+    """
+    if not search_term:
+        return False
+    if store.is_memoized('relevance_index'):
+        return True
+    job = get_job_manager().submit(store_job_key('relevance_index', store), build_relevance_index, store,
+                                   label="Arama dizini")
+    with st.sidebar:
+        return display_job_status(job) is not None
+
+def filter_signature(filter_options: Dict[str, Any]) -> tuple:
+    """Return a hashable key of the options that decide which rows match, and their order."""
+    return (
+        filter_options["search_term"],
+        filter_options["start_date"].isoformat(),
+        filter_options["end_date"].isoformat(),
+        filter_options["show_deleted"],
+        filter_options.get("sort_by"),
+        filter_options.get("ascending", True),
+    )
+
+def filter_rows(store: EntryStore, filter_options: Dict[str, Any]) -> np.ndarray:
+    """
+    Return the row ids of the entries matching the filter options.
+
+    Each predicate's mask is memoized on its own parameters, and the result
+    on all of them, so a rerun that only changes the page does no filtering.
+    Sorting gathers the matching rows from a permutation computed once per
+    dataset. Sorting by relevance returns the `RANKED_RESULTS` best BM25
+    matches of the search term instead of every substring match.
+
+    Args:
+    store (EntryStore): The loaded entries.
+    filter_options (Dict[str, Any]): Options returned by `search_filter_sidebar`.
+
+    Returns:
+    np.ndarray: Matching row ids in the selected order (read-only).
+    """
+    if filter_options.get("sort_by") == RELEVANCE:
+        if filter_options["search_term"]:
+            return get_filter_masks(store).ranked_rows(
+                filter_options["start_date"],
+                filter_options["end_date"],
+                filter_options["show_deleted"],
+                filter_options["search_term"],
+                RANKED_RESULTS,
+            )
+        filter_options = {**filter_options, "sort_by": None}
+    return get_filter_masks(store).rows(
+        filter_options["start_date"],
+        filter_options["end_date"],
+        show_deleted=filter_options["show_deleted"],
+        search_term=filter_options["search_term"],
+        sort_by=filter_options.get("sort_by"),
+        ascending=filter_options.get("ascending", True),
+    )
+
+def export_controls(store: EntryStore, filtered_rows: np.ndarray):
+    """Offer the filtered result or the whole archive as a streamed download."""
+    with st.expander("Dışa Aktar"):
+        scope = st.radio("Kapsam", ["Filtrelenmiş girdiler", "Tüm arşiv"], horizontal=True)
+        export_format = st.selectbox("Biçim", list(EXPORT_FORMATS))
+        # Only build the file on request; a download button needs its data up front.
+        if st.button("Dosyayı hazırla"):
+            rows = filtered_rows if scope == "Filtrelenmiş girdiler" else None
+            mime, extension = EXPORT_FORMATS[export_format]
+            # The export is streamed to a temp file, so neither the records nor an
+            # intermediate string are held; Streamlit reads the file once itself.
+            with export_to_buffer(store, rows, export_format) as buffer:
+                st.download_button("İndir", data=buffer, file_name=f"asosyal-yedeklerim.{extension}", mime=mime)
+
+def run_search_filter_component(store: EntryStore, filter_options: Optional[Dict[str, Any]] = None):
     st.subheader("Arama ve Filtreleme")
     
-    filter_options = search_filter_sidebar(entries)
-    search_query = filter_options["search_term"]
+    if filter_options is None:
+        filter_options = search_filter_sidebar(store)
     entries_per_page = filter_options.get("entries_per_page", 10)
     
     if 'page' not in st.session_state:
         st.session_state.page = 1
     
-    st.write(f"Total entries before filtering: {len(entries)}")
+    st.write(f"Total entries before filtering: {len(store)}")
     
-    def filter_entry(entry):
-        entry_date = parse_date(entry['tarih'])
-        date_condition = filter_options["start_date"] <= entry_date <= filter_options["end_date"]
-        deleted_condition = filter_options["show_deleted"] or not entry['silinmis']
-        search_condition = (not search_query or 
-                            search_query.lower() in entry['baslik'].lower() or 
-                            search_query.lower() in entry['entiri'].lower())
-        return date_condition and deleted_condition and search_condition
-    
-    filtered_entries = list(filter(filter_entry, entries))
-    st.write(f"Entries after filtering: {len(filtered_entries)}")
+    filtered_rows = filter_rows(store, filter_options)
+    if filter_options.get("sort_by") == RELEVANCE and filter_options["search_term"]:
+        st.write(f"Most relevant entries: {len(filtered_rows)}")
+    else:
+        st.write(f"Entries after filtering: {len(filtered_rows)}")
     
-    if not filtered_entries:
+    if not len(filtered_rows):
         st.warning("No entries found matching the current filters.")
         return
     
+    export_controls(store, filtered_rows)
+    
     # After filtering entries
-    total_pages = math.ceil(len(filtered_entries) / entries_per_page)
+    total_pages = math.ceil(len(filtered_rows) / entries_per_page)
     st.session_state.page = min(st.session_state.page, total_pages)
     
     start_idx = (st.session_state.page - 1) * entries_per_page
     end_idx = start_idx + entries_per_page
-    page_entries = filtered_entries[start_idx:end_idx]
+    page_rows = filtered_rows[start_idx:end_idx]
     
-    # Display entries
-    display_entries(page_entries)
+    # Display entries; only the visible page is materialized, and compact
+    # pages are cached so flipping back and forth skips the rendering
+    page_key = None
+    if store.fingerprint:
+        page_key = (store.fingerprint, filter_signature(filter_options), st.session_state.page, entries_per_page)
+    # Ranked results show highlighted snippets, cut for this page only
+    terms = None
+    if filter_options.get("sort_by") == RELEVANCE and filter_options["search_term"]:
+        terms = query_terms(filter_options["search_term"])
+    display_page(store, page_rows, filter_options.get("display_mode", "Compact"), page_key, terms)
     
     # Pagination controls
     col1, col2, col3 = st.columns([1,2,1])
@@ -0,0 +1,68 @@
+import math
+import streamlit as st
+from services.entry_store import EntryStore
+from services.title_index import get_title_index
+from components.display_component import display_page
+
+# Ranking options, mapped to `TitleIndex.top` keys.
+SORT_OPTIONS = {
+    "Entry count": 'entries',
+    "Total score": 'skor',
+    "Most recent": 'last',
+    "Deleted entries": 'deleted',
+}
+TOP_SIZES = [10, 20, 50, 100]
+DRILLDOWN_PAGE_SIZE = 10
+
+_COLUMN_LABELS = {
+    'baslik': 'Başlık',
+    'entries': 'Entries',
+    'skor': 'Score',
+    'first': 'First entry',
+    'last': 'Last entry',
+    'deleted': 'Deleted',
+}
+
+def run_title_component(store: EntryStore, display_mode: str = "Compact"):
+    """
+    Rank the titles of the archive and show every entry under a chosen one.
+
+    Rankings and drill-downs read the title index built once per dataset.
+
+    Args:
+    store (EntryStore): The loaded entries.
+    display_mode (str): How the drill-down entries are shown; see `display_page`.
+    """
+    index = get_title_index(store)
+    st.write(f"{len(index):,} distinct titles")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        sort_label = st.selectbox("Rank titles by", list(SORT_OPTIONS))
+    with col2:
+        top_size = st.selectbox("Titles shown", TOP_SIZES, index=1)
+    top = index.top(top_size, SORT_OPTIONS[sort_label])
+    st.dataframe(top.rename(columns=_COLUMN_LABELS), hide_index=True, use_container_width=True)
+
+    # None is the placeholder, so a title that is the empty string can still be chosen.
+    title = st.selectbox("Show entries of", [None] + top['baslik'].tolist(), key="title_drilldown",
+                         format_func=lambda option: "—" if option is None else option)
+    if title is None:
+        return
+    group = index.group(title)
+    stats = index.stats.iloc[group]
+    rows = index.title_rows(title)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Entries", f"{stats['entries']:,}")
+    col2.metric("Score", f"{stats['skor']:,}")
+    col3.metric("Deleted", f"{stats['deleted']:,}")
+    col4.metric("Active", f"{stats['first'].date()} - {stats['last'].date()}")
+
+    total_pages = math.ceil(len(rows) / DRILLDOWN_PAGE_SIZE)
+    page = st.number_input("Page", min_value=1, max_value=total_pages, value=1, key=f"title_page-{group}") if total_pages > 1 else 1
+    start = (page - 1) * DRILLDOWN_PAGE_SIZE
+    page_key = None
+    if store.fingerprint:
+        page_key = (store.fingerprint, ('title', group), page, DRILLDOWN_PAGE_SIZE)
+    display_page(store, rows[start:start + DRILLDOWN_PAGE_SIZE], display_mode, page_key)
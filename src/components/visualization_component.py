@@ -2,18 +2,36 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objs as go
 import plotly.express as px
-from typing import List, Dict, Any
-from collections import Counter
-import nltk
-from nltk.corpus import stopwords
+from typing import List, Dict, Any, Union, Optional
 import math
 import datetime
+import numpy as np
+from concurrent.futures.process import BrokenProcessPool
+from services.entry_store import EntryStore
+from services.word_frequency import get_word_counts
+from services.rollups import TimeRollups, get_time_rollups
+from services.ngrams import NgramCounts, get_ngram_counts
+from services.jobs import get_job_manager, get_process_pool, store_job_key
+from services.instrumentation import stage_timer
+from services.error_handling import logger
+from components.job_component import display_job_status
+from utils.downsampling import lttb
 
-# Download NLTK data
-nltk.download('stopwords', quiet=True)
+# Trend charts send at most this many points; longer series are downsampled.
+MAX_CHART_POINTS = 2000
+# Above this many points a trace is drawn with WebGL instead of SVG.
+WEBGL_THRESHOLD = 1000
+WEEKDAY_LABELS = ['Pzt', 'Sal', 'Çar', 'Per', 'Cum', 'Cmt', 'Paz']
 
-def prepare_data(entries: List[Dict[str, Any]]) -> pd.DataFrame:
+def prepare_data(entries: Union[EntryStore, List[Dict[str, Any]]]) -> pd.DataFrame:
     """Prepare data for visualization."""
+    if isinstance(entries, EntryStore):
+        # The store is already typed and cleaned; wrap its columns without copying.
+        df = entries.frame()
+        df['yil'] = df['tarih'].dt.year
+        df['ay'] = df['tarih'].dt.month
+        return df
+
     df = pd.DataFrame(entries)
     df['tarih'] = pd.to_datetime(df['tarih'], errors='coerce')
     
@@ -29,10 +47,9 @@ def prepare_data(entries: List[Dict[str, Any]]) -> pd.DataFrame:
     
     return df
 
-@st.cache_data
-def yearly_entry_count_chart(df: pd.DataFrame) -> go.Figure:
+def yearly_entry_count_chart(rollups: TimeRollups) -> go.Figure:
     """Create a bar chart showing yearly entry counts."""
-    yearly_counts = df.groupby('yil').size().reset_index(name='count')
+    yearly_counts = rollups['year'].frame().rename_axis('yil').reset_index()
     
     fig = px.bar(
         yearly_counts,
@@ -48,12 +65,10 @@ def yearly_entry_count_chart(df: pd.DataFrame) -> go.Figure:
     )
     return fig
 
-def word_frequency_chart(df: pd.DataFrame) -> go.Figure:
-    """Create a bar chart of most frequent words."""
-    stop_words = set(stopwords.words('turkish'))
-    words = ' '.join(df['entiri']).lower().split()
-    word_freq = Counter(word for word in words if word not in stop_words)
-    top_words = dict(word_freq.most_common(20))
+def word_frequency_chart(store: EntryStore, rows: Optional[np.ndarray] = None) -> go.Figure:
+    """Create a bar chart of the most frequent words among the given rows."""
+    # Sums the per-entry counts tokenized once per dataset instead of re-tokenizing.
+    top_words = dict(get_word_counts(store).top_words(rows, n=20))
     
     fig = go.Figure(go.Bar(x=list(top_words.keys()), y=list(top_words.values())))
     fig.update_layout(
@@ -66,18 +81,33 @@ def word_frequency_chart(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
-def monthly_entry_trend_chart(df: pd.DataFrame) -> go.Figure:
-    """Create a line chart showing the trend of entry counts over time (by month)."""
-    monthly_counts = df.groupby(df['tarih'].dt.to_period('M')).size().reset_index(name='count')
-    monthly_counts['tarih'] = monthly_counts['tarih'].dt.to_timestamp()
-    
-    fig = px.line(
-        monthly_counts,
-        x='tarih',
-        y='count',
-        title='Aylık Girdi Sayısı Trendi'
-    )
+def build_word_counts(job, store: EntryStore):
+    """Background job: tokenize the corpus for the word frequency chart."""
+    return get_word_counts(store, on_progress=lambda fraction: job.report(fraction, "Kelimeler sayılıyor..."))
+
+def trend_chart(keys: np.ndarray, counts: np.ndarray, title: str, max_points: int = MAX_CHART_POINTS,
+                webgl_threshold: int = WEBGL_THRESHOLD) -> go.Figure:
+    """
+    Create a line chart of a time series with a bounded payload.
+
+    Series longer than `max_points` are downsampled with LTTB, which keeps
+    peaks and dips; traces above `webgl_threshold` points use WebGL.
+
+    Args:
+    keys (np.ndarray): Ascending bucket timestamps.
+    counts (np.ndarray): Entry count per bucket.
+    title (str): Chart title.
+    max_points (int): Maximum number of points sent to the browser.
+    webgl_threshold (int): Point count from which Scattergl is used.
+
+    Returns:
+    go.Figure: The chart.
+    """
+    keep = lttb(keys, counts, max_points)
+    trace = go.Scattergl if len(keep) > webgl_threshold else go.Scatter
+    fig = go.Figure(trace(x=keys[keep], y=counts[keep], mode='lines'))
     fig.update_layout(
+        title=title,
         xaxis_title='Tarih',
         yaxis_title='Girdi Sayısı',
         width=600,
@@ -85,27 +115,104 @@ def monthly_entry_trend_chart(df: pd.DataFrame) -> go.Figure:
     )
     return fig
 
-def run_visualization_component(entries: List[Dict[str, Any]]):
-    df = prepare_data(entries)
+def ngram_chart(ngrams: NgramCounts, view: str = "Bigrams", k: int = 20) -> go.Figure:
+    """Create a bar chart of the most frequent bigrams or trigrams, or of the strongest collocations."""
+    if view == "Collocations (PMI)":
+        rows = ngrams.collocations(k)
+        labels, values = [row[0] for row in rows], [round(row[1], 2) for row in rows]
+        hover = [f"{count:,} kez" for _, _, count in rows]
+        xaxis_title = 'PMI'
+    else:
+        rows = ngrams.top(3 if view == "Trigrams" else 2, k)
+        labels, values = [row[0] for row in rows], [row[1] for row in rows]
+        hover = None
+        xaxis_title = 'Frekans'
+    # Horizontal bars keep multi-word labels readable; the strongest at the top.
+    fig = go.Figure(go.Bar(x=values[::-1], y=labels[::-1], orientation='h', hovertext=hover[::-1] if hover else None))
+    fig.update_layout(
+        title='Kelime Grupları' if view != "Collocations (PMI)" else 'Birlikte Kullanılan Kelimeler',
+        xaxis_title=xaxis_title,
+        width=600,
+        height=600
+    )
+    return fig
+
+def build_ngram_counts(job, store: EntryStore, executor):
+    """
+    Background job: count n-grams over the process pool.
+
+    A pool whose worker died (e.g. killed for memory) cannot run anything
+    again. It is then dropped from the resource cache, so the next job gets a
+    fresh pool, and this count finishes in the job's own thread.
+    """
+    def on_progress(fraction):
+        job.report(fraction, "Kelime grupları sayılıyor...")
+    try:
+        return get_ngram_counts(store, executor, on_progress)
+    except BrokenProcessPool as error:
+        logger.warning(f"N-gram process pool broken, counting serially: {error}")
+        get_process_pool.clear()
+        executor.shutdown(wait=False, cancel_futures=True)
+        return get_ngram_counts(store, None, on_progress)
+
+def monthly_entry_trend_chart(rollups: TimeRollups) -> go.Figure:
+    """Create a line chart showing the trend of entry counts over time (by month)."""
+    month = rollups['month']
+    return trend_chart(month.keys, month.counts.sum(axis=1), 'Aylık Girdi Sayısı Trendi')
+
+def daily_entry_trend_chart(rollups: TimeRollups) -> go.Figure:
+    """Create a line chart of entry counts per day, days without entries included."""
+    day = rollups['day']
+    counts = np.zeros(0, dtype=np.int64)
+    keys = day.keys
+    if len(keys):
+        keys = np.arange(keys[0], keys[-1] + np.timedelta64(1, 'D'), np.timedelta64(1, 'D'))
+        counts = np.zeros(len(keys), dtype=np.int64)
+        counts[((day.keys - keys[0]) // np.timedelta64(1, 'D')).astype(np.int64)] = day.counts.sum(axis=1)
+    return trend_chart(keys, counts, 'Günlük Girdi Sayısı')
+
+def hourly_entry_trend_chart(rollups: TimeRollups) -> go.Figure:
+    """Create a line chart of entry counts per hour."""
+    hourly = rollups['hourly']
+    return trend_chart(hourly.keys, hourly.counts.sum(axis=1), 'Saatlik Girdi Sayısı (UTC)')
+
+def activity_heatmap(rollups: TimeRollups) -> go.Figure:
+    """Create a weekday by hour heatmap of entry counts; always 7 x 24 cells."""
+    counts = rollups['weekday_hour'].counts.sum(axis=1).reshape(7, 24)
+    fig = go.Figure(go.Heatmap(z=counts, x=list(range(24)), y=WEEKDAY_LABELS, colorscale='Viridis'))
+    fig.update_layout(
+        title='Haftalık Aktivite (UTC)',
+        xaxis_title='Saat',
+        yaxis_title='Gün',
+        yaxis_autorange='reversed',
+        width=600,
+        height=400
+    )
+    return fig
+
+def run_visualization_component(entries: Union[EntryStore, List[Dict[str, Any]]], rows: Optional[np.ndarray] = None):
+    store = entries if isinstance(entries, EntryStore) else EntryStore.from_frame(pd.DataFrame(entries))
+    if not len(store):
+        # E.g. an export whose dates all failed to parse; there is no date range to chart.
+        st.info("No entries to visualize.")
+        return
+    # Aggregated once per dataset; every metric and time chart below is a slice of it.
+    rollups = get_time_rollups(store)
+    first_date, last_date = store.date_bounds()
     
     # Sidebar with user statistics
     st.sidebar.header("User Statistics")
     
     # Calculate user statistics
-    karma_points = df['skor'].sum()
-    days_active = (df['tarih'].max() - df['tarih'].min()).days
-    total_entries = len(df)
+    karma_points = rollups.total_skor
+    days_active = (last_date - first_date).days
+    total_entries = rollups.total_entries
     
     # Display user statistics in sidebar
     st.sidebar.metric("Karma Points", f"{karma_points:,}")
     st.sidebar.metric("Days Active", days_active)
     st.sidebar.metric("Total Entries", total_entries)
     
-    # Check if 'bkz' column exists before calculating total comments
-    if 'bkz' in df.columns:
-        total_comments = df['bkz'].notna().sum()
-        st.sidebar.metric("Total Comments", total_comments)
-    
     # Optional: Add a user generation or level indicator
     st.sidebar.text("2. NESIL")  # Or calculate this based on some criteria
 
@@ -114,27 +221,59 @@ def run_visualization_component(entries: List[Dict[str, Any]]):
     
     # Basic statistics in the main area
     st.write(f"Total Entries: {total_entries}")
-    st.write(f"Date Range: {df['tarih'].min().date()} - {df['tarih'].max().date()}")
+    st.write(f"Date Range: {first_date.date()} - {last_date.date()}")
 
     # Visualization options
     chart_type = st.selectbox(
         "Select Chart Type",
-        ["Yearly Entry Count", "Monthly Entry Trend", "Word Frequency"]
+        ["Yearly Entry Count", "Monthly Entry Trend", "Daily Entry Trend", "Hourly Entry Trend",
+         "Activity Heatmap", "Word Frequency", "Word Pairs and Phrases"]
     )
 
     # Display the selected chart
     if chart_type == "Yearly Entry Count":
         st.subheader("Yearly Entry Count")
-        with st.spinner("Loading chart..."):
-            st.plotly_chart(yearly_entry_count_chart(df))
+        with st.spinner("Loading chart..."), stage_timer('chart:yearly'):
+            st.plotly_chart(yearly_entry_count_chart(rollups))
     elif chart_type == "Monthly Entry Trend":
         st.subheader("Monthly Entry Trend")
-        with st.spinner("Loading chart..."):
-            st.plotly_chart(monthly_entry_trend_chart(df))
+        with st.spinner("Loading chart..."), stage_timer('chart:monthly'):
+            st.plotly_chart(monthly_entry_trend_chart(rollups))
+    elif chart_type == "Daily Entry Trend":
+        st.subheader("Daily Entry Trend")
+        with st.spinner("Loading chart..."), stage_timer('chart:daily'):
+            st.plotly_chart(daily_entry_trend_chart(rollups))
+    elif chart_type == "Hourly Entry Trend":
+        st.subheader("Hourly Entry Trend")
+        with st.spinner("Loading chart..."), stage_timer('chart:hourly'):
+            st.plotly_chart(hourly_entry_trend_chart(rollups))
+    elif chart_type == "Activity Heatmap":
+        st.subheader("Activity by Weekday and Hour")
+        with st.spinner("Loading chart..."), stage_timer('chart:heatmap'):
+            st.plotly_chart(activity_heatmap(rollups))
     elif chart_type == "Word Frequency":
         st.subheader("Most Frequent Words")
-        with st.spinner("Loading chart..."):
-            st.plotly_chart(word_frequency_chart(df))
+        # Tokenizing a large archive takes a while; it runs in the background
+        # once per dataset and the chart appears when it is done.
+        if not store.is_memoized('word_counts'):
+            job = get_job_manager().submit(store_job_key('word_counts', store), build_word_counts, store,
+                                           label="Kelime sayımı")
+            if display_job_status(job) is None:
+                return
+        with stage_timer('chart:word_frequency'):
+            st.plotly_chart(word_frequency_chart(store, rows))
+    elif chart_type == "Word Pairs and Phrases":
+        st.subheader("Word Pairs and Phrases")
+        # Counted across all cores in the background, once per dataset.
+        if not store.is_memoized('ngrams'):
+            # The pool is passed in: Streamlit's cached resources are not available to worker threads.
+            job = get_job_manager().submit(store_job_key('ngrams', store), build_ngram_counts, store,
+                                           get_process_pool(), label="Kelime grubu sayımı")
+            if display_job_status(job) is None:
+                return
+        view = st.radio("Show", ["Bigrams", "Trigrams", "Collocations (PMI)"], horizontal=True)
+        with stage_timer('chart:ngrams'):
+            st.plotly_chart(ngram_chart(get_ngram_counts(store), view))
 
 # Example usage
 if __name__ == "__main__":
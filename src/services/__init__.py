@@ -1,9 +1,49 @@
 from .csv_to_json import process_uploaded_file, csv_to_json
+from .entry_store import EntryStore, read_entry_store
+from .dataset_cache import DatasetCache, get_dataset_cache
 from .error_handling import handle_error, custom_exception_handler
+from .instrumentation import stage_timer, PerformanceRecorder, get_performance_recorder
+from .search_index import SearchIndex, get_search_index
+from .relevance_index import RelevanceIndex, get_relevance_index
+from .filter_masks import FilterMasks, get_filter_masks
+from .export import iter_export, write_export, export_to_buffer
+from .word_frequency import WordCounts, get_word_counts, tokenize
+from .rollups import TimeRollups, get_time_rollups
+from .title_index import TitleIndex, get_title_index
+from .ngrams import NgramCounts, get_ngram_counts
+from .snapshot import read_snapshot, write_snapshot, prune_snapshots
 
 __all__ = [
     'process_uploaded_file',
     'csv_to_json',
+    'EntryStore',
+    'read_entry_store',
+    'DatasetCache',
+    'get_dataset_cache',
     'handle_error',
-    'custom_exception_handler'
+    'custom_exception_handler',
+    'stage_timer',
+    'PerformanceRecorder',
+    'get_performance_recorder',
+    'SearchIndex',
+    'get_search_index',
+    'RelevanceIndex',
+    'get_relevance_index',
+    'FilterMasks',
+    'get_filter_masks',
+    'iter_export',
+    'write_export',
+    'export_to_buffer',
+    'WordCounts',
+    'get_word_counts',
+    'tokenize',
+    'TimeRollups',
+    'get_time_rollups',
+    'TitleIndex',
+    'get_title_index',
+    'NgramCounts',
+    'get_ngram_counts',
+    'read_snapshot',
+    'write_snapshot',
+    'prune_snapshots'
 ]
\ No newline at end of file
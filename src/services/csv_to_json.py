@@ -1,8 +1,10 @@
 import csv
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, IO
 import streamlit as st
 import pandas as pd
+from services.entry_store import iter_csv_chunks
+from services.export import iter_json_array, write_export
 
 def csv_to_json(csv_content: str) -> List[Dict[str, Any]]:
     """
@@ -14,8 +16,18 @@ def csv_to_json(csv_content: str) -> List[Dict[str, Any]]:
     Returns:
     List[Dict[str, Any]]: A list of dictionaries, each representing a blog post.
     """
-    blog_posts = []
+    return list(iter_blog_posts(csv_content))
+
+def iter_blog_posts(csv_content: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily convert CSV content to blog post dictionaries, one row at a time.
+    
+    Args:
+    csv_content (str): The content of the CSV file as a string.
     
+    Yields:
+    Dict[str, Any]: A dictionary representing a blog post.
+    """
     # Use StringIO to create a file-like object from the string
     from io import StringIO
     csv_file = StringIO(csv_content)
@@ -23,16 +35,13 @@ def csv_to_json(csv_content: str) -> List[Dict[str, Any]]:
     csv_reader = csv.DictReader(csv_file)
     
     for row in csv_reader:
-        post = {
+        yield {
             "skor": int(row["skor"]),
             "baslik": row["baslik"],
             "entiri": row["entiri"],
             "silinmis": row["silinmis"].lower() == "true",
             "tarih": row["tarih"]
         }
-        blog_posts.append(post)
-    
-    return blog_posts
 
 def convert_csv_to_json(csv_content: str) -> str:
     """
@@ -44,17 +53,28 @@ def convert_csv_to_json(csv_content: str) -> str:
     Returns:
     str: JSON string representation of the data.
     """
-    blog_posts = csv_to_json(csv_content)
-    return json.dumps(blog_posts, ensure_ascii=False, indent=2)
+    return ''.join(iter_json_array(([post] for post in iter_blog_posts(csv_content)), indent=2))
+
+def stream_csv_to_json(csv_content: str, fileobj: IO) -> int:
+    """
+    Convert CSV content to JSON and write it to a file object piece by piece.
+    
+    Args:
+    csv_content (str): The content of the CSV file as a string.
+    fileobj (IO): A text or binary file object to write to.
+    
+    Returns:
+    int: The number of characters or bytes written.
+    """
+    return write_export(iter_json_array(([post] for post in iter_blog_posts(csv_content)), indent=2), fileobj)
 
 # Example usage within Streamlit app
 def process_uploaded_file(file_path):
     try:
-        # Read the CSV file
-        df = pd.read_csv(file_path)
-        
-        # Convert DataFrame to list of dictionaries
-        json_data = df.to_dict('records')
+        # Read the CSV file in chunks so the raw frame never holds the whole export
+        json_data = []
+        for chunk, _ in iter_csv_chunks(file_path):
+            json_data.extend(chunk.to_dict('records'))
         
         return json_data
     except Exception as e:
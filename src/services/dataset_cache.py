@@ -0,0 +1,92 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+import streamlit as st
+from services.entry_store import EntryStore
+
+class DatasetCache:
+    """
+    Process-wide LRU of loaded datasets keyed by upload content hash.
+
+    Streamlit reruns the script on every interaction and every session gets
+    its own UploadedFile object, so the cache is keyed on the bytes rather
+    than on a file path or object identity. It is shared by all sessions.
+    """
+
+    def __init__(self, max_entries: int = 4):
+        self.max_entries = max_entries
+        self._stores: 'OrderedDict[str, EntryStore]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+    def get(self, content_hash: str) -> Optional[EntryStore]:
+        """
+        Return the cached store for a content hash, if any.
+
+        Args:
+        content_hash (str): The content hash of the upload.
+
+        Returns:
+        Optional[EntryStore]: The store, or None on a cache miss.
+        """
+        with self._lock:
+            store = self._stores.get(content_hash)
+            if store is not None:
+                self._stores.move_to_end(content_hash)
+            return store
+
+    def put(self, content_hash: str, store: EntryStore) -> None:
+        """
+        Cache a store, evicting the least recently used one if full.
+
+        Args:
+        content_hash (str): The content hash of the upload.
+        store (EntryStore): The parsed dataset.
+        """
+        with self._lock:
+            self._stores[content_hash] = store
+            self._stores.move_to_end(content_hash)
+            while len(self._stores) > self.max_entries:
+                self._stores.popitem(last=False)
+
+    def get_or_load(self, content_hash: str, loader: Callable[[], Optional[EntryStore]]) -> Optional[EntryStore]:
+        """
+        Return the cached store for a content hash, loading it on a miss.
+
+        Concurrent sessions uploading the same file wait for a single load
+        instead of parsing it in parallel.
+
+        Args:
+        content_hash (str): The content hash of the upload.
+        loader (Callable[[], Optional[EntryStore]]): Builds the store; may return None on failure.
+
+        Returns:
+        Optional[EntryStore]: The store, or None if loading failed.
+        """
+        store = self.get(content_hash)
+        if store is not None:
+            return store
+        with self._lock:
+            load_lock = self._load_locks.setdefault(content_hash, threading.Lock())
+        with load_lock:
+            store = self.get(content_hash)
+            if store is None:
+                store = loader()
+                if store is not None:
+                    self.put(content_hash, store)
+        with self._lock:
+            self._load_locks.pop(content_hash, None)
+        return store
+
+    def __contains__(self, content_hash: str) -> bool:
+        with self._lock:
+            return content_hash in self._stores
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._stores)
+
+@st.cache_resource
+def get_dataset_cache() -> DatasetCache:
+    """Return the dataset cache shared by every session of this server."""
+    return DatasetCache()
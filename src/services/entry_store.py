@@ -0,0 +1,433 @@
+from dataclasses import dataclass
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
+import os
+import threading
+import numpy as np
+import pandas as pd
+from services.instrumentation import stage_timer
+from services.text_store import CompressedText, DEFAULT_BLOCK_SIZE, text_array
+
+COLUMNS = ['skor', 'baslik', 'entiri', 'silinmis', 'tarih']
+DEFAULT_CHUNK_SIZE = 50000
+
+
+class EntryStore:
+    """
+    Typed, column-oriented container for one loaded archive.
+
+    The store is built once per upload and shared read-only by the
+    visualization, search/filter and display components. Consumers select
+    entries through integer row-index arrays; records are only materialized
+    for the rows that are actually rendered.
+
+    Columns:
+    skor (np.ndarray): int64 scores.
+    baslik (pd.Categorical): entry titles.
+    entiri (pd.arrays.ArrowStringArray or CompressedText): entry bodies;
+    see `compress_text`.
+    silinmis (np.ndarray): bool deletion mask.
+    tarih (np.ndarray): int64 UTC timestamps in epoch nanoseconds.
+    entry_id (np.ndarray): uint64 content hash of (`baslik`, `tarih`, `entiri`),
+    stable across uploads and processes; see `entry_ids`.
+
+    Timestamp index:
+    date_order (np.ndarray): Permutation that sorts the rows by `tarih`.
+    sorted_tarih (np.ndarray): `tarih` in ascending order, as datetime64[ns].
+
+    fingerprint (Optional[str]): Content hash of the source upload, if known.
+    """
+
+    def __init__(self, skor: np.ndarray, baslik: pd.Categorical, entiri: pd.api.extensions.ExtensionArray,
+                 silinmis: np.ndarray, tarih: np.ndarray, fingerprint: Optional[str] = None,
+                 date_order: Optional[np.ndarray] = None, entry_id: Optional[np.ndarray] = None):
+        self.skor = skor
+        self.baslik = baslik
+        self.entiri = entiri
+        self.silinmis = silinmis
+        self.tarih = tarih
+        self.entry_id = entry_ids(baslik, tarih, entiri) if entry_id is None else entry_id
+        self.date_order = np.argsort(tarih, kind='stable') if date_order is None else date_order
+        self.sorted_tarih = tarih[self.date_order].view('datetime64[ns]')
+        self.fingerprint = fingerprint
+        self._memo: Dict[str, Any] = {}
+        self._memo_lock = threading.Lock()
+        self._memo_build_locks: Dict[str, threading.Lock] = {}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, fingerprint: Optional[str] = None) -> 'EntryStore':
+        """
+        Build a store from a raw export DataFrame.
+
+        Rows whose `tarih` cannot be parsed are dropped, mirroring `clean_data`.
+
+        Args:
+        df (pd.DataFrame): DataFrame with the export columns.
+        fingerprint (Optional[str]): Content hash of the source upload.
+
+        Returns:
+        EntryStore: The columnar store.
+        """
+        tarih = pd.to_datetime(df['tarih'], errors='coerce', utc=True)
+        valid = tarih.notna().to_numpy()
+
+        skor = pd.to_numeric(df['skor'], errors='coerce').fillna(0).to_numpy(dtype=np.int64)[valid]
+        silinmis = _to_bool(df['silinmis']).to_numpy(dtype=bool)[valid]
+        baslik = pd.Categorical(df['baslik'].fillna('').astype(str).to_numpy()[valid])
+        entiri = pd.array(df['entiri'].fillna('').astype(str).to_numpy()[valid], dtype='string[pyarrow]')
+        tarih_ns = tarih[valid].dt.tz_localize(None).to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+        return cls(skor, baslik, entiri, silinmis, tarih_ns, fingerprint)
+
+    @classmethod
+    def concat(cls, stores: List['EntryStore'], fingerprint: Optional[str] = None) -> 'EntryStore':
+        """
+        Concatenate stores in order into a single store.
+
+        Title categories are unioned and the Arrow-backed bodies are chained
+        without copying their buffers.
+
+        Args:
+        stores (List[EntryStore]): The stores to concatenate.
+        fingerprint (Optional[str]): Fingerprint of the combined dataset.
+
+        Returns:
+        EntryStore: The combined store.
+        """
+        if not stores:
+            return cls.from_frame(pd.DataFrame(columns=COLUMNS), fingerprint)
+        return cls(
+            np.concatenate([store.skor for store in stores]),
+            pd.api.types.union_categoricals([store.baslik for store in stores]),
+            pd.concat([pd.Series(text_array(store.entiri)) for store in stores], ignore_index=True).array,
+            np.concatenate([store.silinmis for store in stores]),
+            np.concatenate([store.tarih for store in stores]),
+            fingerprint,
+            entry_id=np.concatenate([store.entry_id for store in stores]),
+        )
+
+    @classmethod
+    def merge(cls, stores: List['EntryStore'], fingerprint: Optional[str] = None) -> 'EntryStore':
+        """
+        Combine archives, keeping the first copy of entries present in several.
+
+        Overlapping backups of the same account repeat entries verbatim;
+        they are recognized by `entry_id` in a single hash-table pass.
+
+        Args:
+        stores (List[EntryStore]): The stores to merge, in priority order.
+        fingerprint (Optional[str]): Fingerprint of the merged dataset.
+
+        Returns:
+        EntryStore: The merged store.
+        """
+        combined = cls.concat(stores)
+        unique = ~pd.Series(combined.entry_id).duplicated().to_numpy()
+        if unique.all():
+            combined.fingerprint = fingerprint
+            return combined
+        return combined.take(np.flatnonzero(unique), fingerprint)
+
+    def take(self, rows: np.ndarray, fingerprint: Optional[str] = None) -> 'EntryStore':
+        """
+        Build a new store from a subset of rows.
+
+        Args:
+        rows (np.ndarray): Row ids to keep, in the new order.
+        fingerprint (Optional[str]): Fingerprint of the new dataset.
+
+        Returns:
+        EntryStore: The subset.
+        """
+        return EntryStore(
+            self.skor.take(rows),
+            self.baslik.take(rows),
+            self.entiri.take(rows),
+            self.silinmis.take(rows),
+            self.tarih.take(rows),
+            fingerprint,
+            entry_id=self.entry_id.take(rows),
+        )
+
+    def __len__(self) -> int:
+        return len(self.skor)
+
+    def all_rows(self) -> np.ndarray:
+        """Return the row ids of every entry, in file order."""
+        return np.arange(len(self), dtype=np.int64)
+
+    def date_bounds(self) -> Tuple[pd.Timestamp, pd.Timestamp]:
+        """Return the earliest and latest entry timestamps."""
+        return pd.Timestamp(self.sorted_tarih[0]), pd.Timestamp(self.sorted_tarih[-1])
+
+    def rows_between(self, start: pd.Timestamp, end: pd.Timestamp) -> np.ndarray:
+        """
+        Return the rows whose `tarih` lies in [start, end], in date order.
+
+        Both bounds are located by binary search on the sorted timestamps, so
+        the result is a contiguous slice of `date_order`.
+
+        Args:
+        start (pd.Timestamp): Inclusive lower bound; naive values are taken as UTC.
+        end (pd.Timestamp): Inclusive upper bound; naive values are taken as UTC.
+
+        Returns:
+        np.ndarray: Row ids, sorted by date.
+        """
+        lo = np.searchsorted(self.sorted_tarih, _to_utc_naive(start), side='left')
+        hi = np.searchsorted(self.sorted_tarih, _to_utc_naive(end), side='right')
+        return self.date_order[lo:hi]
+
+    def frame(self, rows: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Return a DataFrame view over the store.
+
+        Without `rows` the columns are wrapped without copying (compressed
+        bodies are decoded in full). With `rows` only the selected entries
+        are gathered.
+
+        Args:
+        rows (Optional[np.ndarray]): Row ids to select.
+
+        Returns:
+        pd.DataFrame: Frame with `tarih` as naive UTC datetime64[ns].
+        """
+        columns = {
+            'skor': self.skor,
+            'baslik': self.baslik,
+            'entiri': self.entiri if rows is not None else text_array(self.entiri),
+            'silinmis': self.silinmis,
+            'tarih': self.tarih.view('datetime64[ns]'),
+        }
+        if rows is not None:
+            columns = {name: values.take(rows) for name, values in columns.items()}
+        return pd.DataFrame(columns, copy=False)
+
+    def records(self, rows: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Materialize the given rows as entry dictionaries.
+
+        Only meant for the handful of rows that are rendered at once.
+
+        Args:
+        rows (np.ndarray): Row ids to materialize.
+
+        Returns:
+        List[Dict[str, Any]]: Entries in the order of `rows`.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        tarih = pd.to_datetime(self.tarih.take(rows)).strftime('%Y-%m-%dT%H:%M:%S.%f')
+        baslik = self.baslik.take(rows).tolist()
+        entiri = self.entiri.take(rows).tolist()
+        return [
+            {
+                'skor': int(self.skor[row]),
+                'baslik': baslik[i],
+                'entiri': entiri[i],
+                'silinmis': bool(self.silinmis[row]),
+                'tarih': tarih[i][:-3] + 'Z',
+            }
+            for i, row in enumerate(rows)
+        ]
+
+    def compress_text(self, block_size: int = DEFAULT_BLOCK_SIZE) -> 'EntryStore':
+        """
+        Return a store whose bodies are kept as compressed blocks.
+
+        Titles stay a categorical and the other columns are shared. Scans
+        such as index builds decode the bodies chunk by chunk; rendering a
+        page decodes only the blocks holding its rows.
+
+        Args:
+        block_size (int): Entries per compressed block.
+
+        Returns:
+        EntryStore: The compact store, with the same fingerprint.
+        """
+        if isinstance(self.entiri, CompressedText):
+            return self
+        return EntryStore(
+            self.skor, self.baslik, CompressedText.from_arrow(self.entiri, block_size), self.silinmis, self.tarih,
+            self.fingerprint, date_order=self.date_order, entry_id=self.entry_id,
+        )
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        Return the bytes held by each column and by the timestamp index.
+
+        Memory-mapped columns (see `services.snapshot`) are counted as well,
+        although their pages belong to the OS file cache.
+
+        Returns:
+        Dict[str, int]: Bytes per column.
+        """
+        return {
+            'skor': self.skor.nbytes,
+            'baslik': int(self.baslik.codes.nbytes + self.baslik.categories.memory_usage(deep=True)),
+            'entiri': int(self.entiri.nbytes),
+            'silinmis': self.silinmis.nbytes,
+            'tarih': self.tarih.nbytes,
+            'entry_id': self.entry_id.nbytes,
+            'date_index': self.date_order.nbytes + self.sorted_tarih.nbytes,
+        }
+
+    def memo(self, key: str, builder: Callable[['EntryStore'], Any]) -> Any:
+        """
+        Return a structure derived from this store, building it on first use.
+
+        Derived indexes live and die with the store they describe. The store
+        is shared by sessions and background jobs, so concurrent callers of
+        the same key wait for a single build.
+
+        Args:
+        key (str): Name of the derived structure.
+        builder (Callable[[EntryStore], Any]): Function that builds it.
+
+        Returns:
+        Any: The cached structure.
+        """
+        if key in self._memo:
+            return self._memo[key]
+        with self._memo_lock:
+            build_lock = self._memo_build_locks.setdefault(key, threading.Lock())
+        with build_lock:
+            if key not in self._memo:
+                self._memo[key] = builder(self)
+        return self._memo[key]
+
+    def is_memoized(self, key: str) -> bool:
+        """Check whether a derived structure has already been built."""
+        return key in self._memo
+
+
+def entry_ids(baslik: Any, tarih: np.ndarray, entiri: Any) -> np.ndarray:
+    """
+    Derive stable entry ids from entry content.
+
+    Exports carry no id, so an entry is identified by its title, timestamp
+    and body. The columns are hashed vectorized with pandas' fixed-key
+    SipHash, which gives the same id for the same entry in every upload,
+    process and column representation (object, categorical, Arrow or
+    compressed; compressed bodies are decoded first).
+
+    Args:
+    baslik (Any): Entry titles.
+    tarih (np.ndarray): int64 UTC timestamps in epoch nanoseconds.
+    entiri (Any): Entry bodies.
+
+    Returns:
+    np.ndarray: uint64 id per entry.
+    """
+    if isinstance(entiri, CompressedText):
+        entiri = entiri.to_array()
+    frame = pd.DataFrame({'baslik': baslik, 'tarih': tarih, 'entiri': entiri}, copy=False)
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def _to_utc_naive(value: Any) -> np.datetime64:
+    """Convert a date bound to a naive UTC datetime64[ns] comparable with the index."""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+    return timestamp.to_datetime64().astype('datetime64[ns]')
+
+
+def _to_bool(values: pd.Series) -> pd.Series:
+    """Coerce a `silinmis` column that may hold bools or 'true'/'false' strings."""
+    if values.dtype == bool:
+        return values
+    return values.astype(str).str.strip().str.lower().isin(['true', '1'])
+
+
+@dataclass
+class IngestProgress:
+    """Running statistics reported after each chunk of a streaming ingest."""
+    entries: int = 0
+    karma: int = 0
+    min_tarih: Optional[pd.Timestamp] = None
+    max_tarih: Optional[pd.Timestamp] = None
+    bytes_read: int = 0
+    total_bytes: int = 0
+
+    @property
+    def fraction(self) -> float:
+        """Share of the file consumed so far, between 0 and 1."""
+        if not self.total_bytes:
+            return 1.0
+        return min(self.bytes_read / self.total_bytes, 1.0)
+
+    def update(self, chunk: EntryStore, bytes_read: int) -> None:
+        """Fold a freshly parsed chunk into the running statistics."""
+        self.entries += len(chunk)
+        self.karma += int(chunk.skor.sum())
+        self.bytes_read = bytes_read
+        if len(chunk):
+            first, last = chunk.date_bounds()
+            self.min_tarih = first if self.min_tarih is None else min(self.min_tarih, first)
+            self.max_tarih = last if self.max_tarih is None else max(self.max_tarih, last)
+
+
+def iter_csv_chunks(file_path: str, chunksize: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[pd.DataFrame, int]]:
+    """
+    Read a CSV export in bounded chunks of rows.
+
+    The pandas parser keeps its state between chunks, so quoted `entiri`
+    fields spanning several lines are never split.
+
+    Args:
+    file_path (str): The path to the CSV file.
+    chunksize (int): Maximum number of rows per chunk.
+
+    Yields:
+    Tuple[pd.DataFrame, int]: Each chunk with the number of bytes consumed so far.
+    """
+    with open(file_path, 'rb') as f:
+        with pd.read_csv(f, encoding='utf-8', chunksize=chunksize) as reader:
+            for chunk in reader:
+                # Position of the underlying file; the parser reads ahead in blocks.
+                yield chunk, f.tell()
+
+
+def read_entry_store_chunked(file_path: str, fingerprint: Optional[str] = None,
+                             chunksize: int = DEFAULT_CHUNK_SIZE,
+                             on_progress: Optional[Callable[[IngestProgress], None]] = None) -> EntryStore:
+    """
+    Stream a CSV export into an EntryStore chunk by chunk.
+
+    Each chunk is converted to typed columns straight away, so the raw text
+    of at most one chunk is alive at a time.
+
+    Args:
+    file_path (str): The path to the CSV file.
+    fingerprint (Optional[str]): Content hash of the file.
+    chunksize (int): Maximum number of rows per chunk.
+    on_progress (Optional[Callable[[IngestProgress], None]]): Called after every chunk.
+
+    Returns:
+    EntryStore: The columnar store.
+    """
+    progress = IngestProgress(total_bytes=os.path.getsize(file_path))
+    parts: List[EntryStore] = []
+    for chunk, bytes_read in iter_csv_chunks(file_path, chunksize):
+        with stage_timer('clean'):
+            part = EntryStore.from_frame(chunk)
+        del chunk
+        parts.append(part)
+        progress.update(part, bytes_read)
+        if on_progress is not None:
+            on_progress(progress)
+    return EntryStore.concat(parts, fingerprint)
+
+
+def read_entry_store(file_path: str, fingerprint: Optional[str] = None) -> EntryStore:
+    """
+    Read an asosyal sözlük CSV export into an EntryStore.
+
+    Args:
+    file_path (str): The path to the CSV file.
+    fingerprint (Optional[str]): Content hash of the file.
+
+    Returns:
+    EntryStore: The columnar store.
+    """
+    df = pd.read_csv(file_path, encoding='utf-8')
+    return EntryStore.from_frame(df, fingerprint)
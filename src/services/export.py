@@ -0,0 +1,157 @@
+import io
+import csv
+import json
+import tempfile
+import textwrap
+from typing import List, Dict, Any, Iterable, Iterator, Optional, IO
+import numpy as np
+from services.entry_store import EntryStore, COLUMNS
+
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'json': ('application/json', 'json'),
+    'csv': ('text/csv', 'csv'),
+}
+DEFAULT_BATCH_SIZE = 1000
+
+
+def iter_records(store: EntryStore, rows: Optional[np.ndarray] = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Materialize the selected rows of a store in bounded batches.
+
+    Args:
+    store (EntryStore): The loaded entries.
+    rows (Optional[np.ndarray]): Row ids to export. Defaults to every entry.
+    batch_size (int): Number of records per batch.
+
+    Yields:
+    List[Dict[str, Any]]: Consecutive batches of entry dictionaries.
+    """
+    rows = store.all_rows() if rows is None else rows
+    for start in range(0, len(rows), batch_size):
+        yield store.records(rows[start:start + batch_size])
+
+
+def iter_ndjson(batches: Iterable[List[Dict[str, Any]]]) -> Iterator[str]:
+    """Serialize batches of records as newline-delimited JSON."""
+    for batch in batches:
+        yield ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in batch)
+
+
+def iter_json_array(batches: Iterable[List[Dict[str, Any]]], indent: Optional[int] = None) -> Iterator[str]:
+    """
+    Serialize batches of records as one JSON array.
+
+    The output is identical to `json.dumps(records, ensure_ascii=False, indent=indent)`
+    for indented output, and uses compact separators otherwise.
+
+    Args:
+    batches (Iterable[List[Dict[str, Any]]]): Batches of records.
+    indent (Optional[int]): Indentation, or None for compact output.
+
+    Yields:
+    str: Consecutive pieces of the JSON document.
+    """
+    separators = None if indent is not None else (',', ':')
+    padding = ' ' * indent if indent is not None else ''
+    first = True
+    yield '['
+    for batch in batches:
+        pieces = []
+        for record in batch:
+            text = json.dumps(record, ensure_ascii=False, indent=indent, separators=separators)
+            if indent is not None:
+                text = '\n' + textwrap.indent(text, padding)
+            pieces.append(text if first else ',' + text)
+            first = False
+        if pieces:
+            yield ''.join(pieces)
+    yield ']' if first or indent is None else '\n]'
+
+
+def iter_csv(batches: Iterable[List[Dict[str, Any]]]) -> Iterator[str]:
+    """Serialize batches of records as CSV in the export's column order."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=COLUMNS, quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+    writer.writeheader()
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_export(store: EntryStore, rows: Optional[np.ndarray] = None, fmt: str = 'ndjson',
+                batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[str]:
+    """
+    Stream the selected entries in an export format.
+
+    Args:
+    store (EntryStore): The loaded entries.
+    rows (Optional[np.ndarray]): Row ids to export, e.g. a filtered result. Defaults to every entry.
+    fmt (str): One of 'ndjson', 'json' or 'csv'.
+    batch_size (int): Number of records serialized per chunk.
+
+    Yields:
+    str: Consecutive chunks of the export.
+    """
+    batches = iter_records(store, rows, batch_size)
+    if fmt == 'ndjson':
+        return iter_ndjson(batches)
+    if fmt == 'json':
+        return iter_json_array(batches)
+    if fmt == 'csv':
+        return iter_csv(batches)
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+def write_export(chunks: Iterable[str], fileobj: IO, encoding: str = 'utf-8') -> int:
+    """
+    Write streamed export chunks to a file object.
+
+    Binary writes are repeated until the whole chunk is written, since a raw
+    file's `write` may take only part of it.
+
+    Args:
+    chunks (Iterable[str]): Chunks produced by `iter_export`.
+    fileobj (IO): A text or binary file object.
+    encoding (str): Encoding used for binary file objects.
+
+    Returns:
+    int: The number of characters or bytes written.
+    """
+    binary = not isinstance(fileobj, io.TextIOBase)
+    written = 0
+    for chunk in chunks:
+        if not binary:
+            written += fileobj.write(chunk)
+            continue
+        data = memoryview(chunk.encode(encoding))
+        while data:
+            count = fileobj.write(data) or 0
+            data = data[count:]
+            written += count
+    return written
+
+
+def export_to_buffer(store: EntryStore, rows: Optional[np.ndarray] = None, fmt: str = 'ndjson') -> IO[bytes]:
+    """
+    Export entries into a rewound binary buffer suitable for a download.
+
+    Args:
+    store (EntryStore): The loaded entries.
+    rows (Optional[np.ndarray]): Row ids to export. Defaults to every entry.
+    fmt (str): One of 'ndjson', 'json' or 'csv'.
+
+    Returns:
+    IO[bytes]: An unbuffered temporary file positioned at the start; being
+    a raw file, it can be passed to `st.download_button` as is.
+    """
+    # Unbuffered, because st.download_button rejects BufferedRandom files.
+    buffer = tempfile.TemporaryFile(mode='w+b', buffering=0)
+    write_export(iter_export(store, rows, fmt), buffer)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,140 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.search_index import get_search_index
+from services.relevance_index import get_relevance_index
+from services.sort_order import get_sort_order, sorted_rows
+from services.instrumentation import stage_timer
+
+
+class FilterMasks:
+    """
+    Memoized boolean row masks of one store, one per filter predicate.
+
+    Each predicate (date range, deletion state, search term) keeps its own
+    masks keyed by its own parameters, and the matching rows are memoized
+    per combination and sort order. Changing one widget rebuilds only that
+    predicate's mask and a bitwise AND; sorting gathers the mask over a
+    presorted permutation; rerunning with unchanged filters, e.g. when
+    paging, is a dictionary lookup. Returned arrays are read-only.
+    """
+
+    def __init__(self, store: EntryStore, max_entries: int = 16):
+        # A weak reference keeps the store collectable while it owns this object.
+        self._store = weakref.ref(store)
+        self.max_entries = max_entries
+        self._cache: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _memo(self, key: Hashable, builder: Callable[[EntryStore], Any]) -> Any:
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        # Built outside the lock; a concurrent duplicate build is harmless.
+        value = builder(self._store())
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+        with self._lock:
+            self._cache[key] = value
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return value
+
+    def date_mask(self, start: Any, end: Any) -> np.ndarray:
+        """Mask of the rows whose `tarih` lies in [start, end]."""
+        def build(store: EntryStore) -> np.ndarray:
+            mask = np.zeros(len(store), dtype=bool)
+            mask[store.rows_between(start, end)] = True
+            return mask
+        return self._memo(('date', pd.Timestamp(start), pd.Timestamp(end)), build)
+
+    def live_mask(self) -> np.ndarray:
+        """Mask of the entries that are not deleted."""
+        return self._memo(('live',), lambda store: ~np.asarray(store.silinmis))
+
+    def search_mask(self, query: str) -> np.ndarray:
+        """Mask of the entries matching a search query."""
+        def build(store: EntryStore) -> np.ndarray:
+            mask = np.zeros(len(store), dtype=bool)
+            mask[get_search_index(store).search(query)] = True
+            return mask
+        return self._memo(('search', query), build)
+
+    def mask(self, start: Any, end: Any, show_deleted: bool = True, search_term: Optional[str] = None) -> np.ndarray:
+        """Mask of the rows matching every active predicate; see `rows`."""
+        def build(store: EntryStore) -> np.ndarray:
+            mask = self.date_mask(start, end).copy()
+            if not show_deleted:
+                mask &= self.live_mask()
+            if search_term:
+                mask &= self.search_mask(search_term)
+            return mask
+        key = ('mask', pd.Timestamp(start), pd.Timestamp(end), bool(show_deleted), search_term or '')
+        return self._memo(key, build)
+
+    @stage_timer('filter')
+    def rows(self, start: Any, end: Any, show_deleted: bool = True, search_term: Optional[str] = None,
+             sort_by: Optional[str] = None, ascending: bool = True) -> np.ndarray:
+        """
+        Return the row ids matching every active predicate.
+
+        Args:
+        start (Any): Inclusive lower bound of `tarih`.
+        end (Any): Inclusive upper bound of `tarih`.
+        show_deleted (bool): Whether deleted entries are included.
+        search_term (Optional[str]): Search query; empty or None disables the search.
+        sort_by (Optional[str]): Sort key, one of `services.sort_order.SORT_KEYS`. Defaults to file order.
+        ascending (bool): Sort direction.
+
+        Returns:
+        np.ndarray: Matching row ids, sorted.
+        """
+        def build(store: EntryStore) -> np.ndarray:
+            mask = self.mask(start, end, show_deleted, search_term)
+            if sort_by is None:
+                return np.flatnonzero(mask)
+            return sorted_rows(get_sort_order(store, sort_by), mask, ascending)
+        key = ('rows', pd.Timestamp(start), pd.Timestamp(end), bool(show_deleted), search_term or '',
+               sort_by, bool(ascending) or sort_by is None)
+        return self._memo(key, build)
+
+    @stage_timer('filter')
+    def ranked_rows(self, start: Any, end: Any, show_deleted: bool, query: str, k: int) -> np.ndarray:
+        """
+        Return the k entries most relevant to a query among those matching the filters.
+
+        Builds the store's BM25 index if it is missing; see
+        `services.relevance_index.RelevanceIndex.search`.
+
+        Args:
+        start (Any): Inclusive lower bound of `tarih`.
+        end (Any): Inclusive upper bound of `tarih`.
+        show_deleted (bool): Whether deleted entries are included.
+        query (str): Search query.
+        k (int): Number of results.
+
+        Returns:
+        np.ndarray: Row ids, most relevant first.
+        """
+        def build(store: EntryStore) -> np.ndarray:
+            return get_relevance_index(store).search(query, k, self.mask(start, end, show_deleted))[0]
+        key = ('ranked', pd.Timestamp(start), pd.Timestamp(end), bool(show_deleted), query, k)
+        return self._memo(key, build)
+
+
+def get_filter_masks(store: EntryStore) -> FilterMasks:
+    """
+    Return the filter mask cache of a store, creating it on first use.
+
+    Args:
+    store (EntryStore): The loaded entries.
+
+    Returns:
+    FilterMasks: The cache kept alongside the store.
+    """
+    return store.memo('filter_masks', FilterMasks)
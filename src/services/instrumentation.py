@@ -0,0 +1,231 @@
+import os
+import json
+import time
+import logging
+import threading
+import tracemalloc
+import weakref
+from collections import deque
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from typing import Any, Deque, Dict, List, Optional
+import streamlit as st
+
+# Structured stage timings, one JSON object per line. Set ASOSYAL_PERF_LOG to
+# a file path to collect them; otherwise they follow the root logging setup.
+perf_logger = logging.getLogger('asosyal.performance')
+if os.environ.get('ASOSYAL_PERF_LOG'):
+    _handler = logging.FileHandler(os.environ['ASOSYAL_PERF_LOG'], encoding='utf-8')
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    perf_logger.addHandler(_handler)
+    perf_logger.setLevel(logging.INFO)
+    perf_logger.propagate = False
+
+# Records kept per session; older ones are dropped first.
+MAX_RECORDS = 5000
+
+
+@dataclass
+class StageTiming:
+    """
+    One measured run of a pipeline stage.
+
+    wall_s and cpu_s are seconds; cpu_s counts the running thread only, so
+    background jobs do not inflate a rerun's stages. peak_bytes is the peak
+    of traced allocations above the stage's starting point, or None when
+    memory tracking is off. tracemalloc keeps one peak for the whole
+    process, so while stages run in several threads at once their peaks are
+    approximate: they can include the other threads' allocations.
+    """
+    stage: str
+    rerun: int
+    started_at: float
+    wall_s: float
+    cpu_s: float
+    peak_bytes: Optional[int] = None
+    thread: str = ''
+
+
+class PerformanceRecorder:
+    """
+    Stage timings of one session, grouped by the rerun that started them.
+
+    Stages submitted as background jobs are attributed to the rerun that
+    submitted them, even if they finish several reruns later.
+    """
+
+    def __init__(self, max_records: int = MAX_RECORDS):
+        self.rerun = 0
+        self._records: Deque[StageTiming] = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def start_rerun(self) -> int:
+        """Begin a new rerun and make this recorder the current one."""
+        with self._lock:
+            self.rerun += 1
+        _current_recorder.set(self)
+        return self.rerun
+
+    def record(self, timing: StageTiming) -> None:
+        with self._lock:
+            self._records.append(timing)
+
+    def records(self, rerun: Optional[int] = None) -> List[StageTiming]:
+        """Return the recorded timings, optionally of one rerun only."""
+        with self._lock:
+            records = list(self._records)
+        return records if rerun is None else [record for record in records if record.rerun == rerun]
+
+    def summary(self, rerun: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Aggregate the timings per stage.
+
+        Args:
+        rerun (Optional[int]): Only this rerun. Defaults to the whole session.
+
+        Returns:
+        List[Dict[str, Any]]: One row per stage with `stage`, `runs`,
+        `wall_ms` (total), `max_wall_ms`, `cpu_ms` (total) and `peak_mib`
+        (largest peak, None if untracked), slowest first.
+        """
+        stages: Dict[str, Dict[str, Any]] = {}
+        for record in self.records(rerun):
+            row = stages.setdefault(record.stage, {
+                'stage': record.stage, 'runs': 0, 'wall_ms': 0.0, 'max_wall_ms': 0.0, 'cpu_ms': 0.0, 'peak_mib': None
+            })
+            row['runs'] += 1
+            row['wall_ms'] += record.wall_s * 1000
+            row['max_wall_ms'] = max(row['max_wall_ms'], record.wall_s * 1000)
+            row['cpu_ms'] += record.cpu_s * 1000
+            if record.peak_bytes is not None:
+                row['peak_mib'] = max(row['peak_mib'] or 0.0, record.peak_bytes / 2 ** 20)
+        return sorted(stages.values(), key=lambda row: -row['wall_ms'])
+
+    def to_ndjson(self) -> str:
+        """Return every timing as newline-delimited JSON."""
+        return ''.join(json.dumps(asdict(record)) + '\n' for record in self.records())
+
+
+_current_recorder: ContextVar[Optional[PerformanceRecorder]] = ContextVar('performance_recorder', default=None)
+# Open stages of each thread, used to carry memory peaks out of nested stages.
+_open_stages = threading.local()
+# Guards tracemalloc's process-wide peak and the count of stages measuring it.
+_tracing_lock = threading.Lock()
+_traced_stages = 0
+# The sessions that asked for memory tracking; it is on while any of them is alive and asks.
+_memory_tracking_users: 'weakref.WeakSet[Any]' = weakref.WeakSet()
+
+
+class stage_timer(ContextDecorator):
+    """
+    Measure a pipeline stage: wall time, CPU time and, while memory tracking
+    is on, the peak of traced allocations.
+
+    Works as a context manager or a decorator, and nests. The timing goes to
+    the current session's recorder, if any, and to the performance log.
+
+    Usage:
+    with stage_timer('filter'):
+        rows = filter_rows(store, options)
+
+    @stage_timer('chart:yearly')
+    def yearly_entry_count_chart(rollups):
+        ...
+    """
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self) -> 'stage_timer':
+        global _traced_stages
+        stack = _stack()
+        frame = {'carried_peak': 0}
+        with _tracing_lock:
+            if tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                if stack:
+                    stack[-1]['carried_peak'] = max(stack[-1]['carried_peak'], peak)
+                # Resetting the peak would lose the readings of stages open in
+                # other threads; then this stage's peak may start out too high.
+                if _traced_stages == sum('base' in open_frame for open_frame in stack):
+                    tracemalloc.reset_peak()
+                frame['base'] = current
+                _traced_stages += 1
+        frame['cpu'] = time.thread_time()
+        frame['started_at'] = time.time()
+        frame['wall'] = time.perf_counter()
+        stack.append(frame)
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        global _traced_stages
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        stack = _stack()
+        frame = stack.pop()
+        peak_bytes = None
+        if 'base' in frame:
+            with _tracing_lock:
+                _traced_stages -= 1
+                if tracemalloc.is_tracing():
+                    peak = max(tracemalloc.get_traced_memory()[1], frame['carried_peak'])
+                    peak_bytes = max(peak - frame['base'], 0)
+                    # The enclosing stage's peak includes this one.
+                    if stack:
+                        stack[-1]['carried_peak'] = max(stack[-1]['carried_peak'], peak)
+
+        recorder = _current_recorder.get()
+        timing = StageTiming(
+            stage=self.stage,
+            rerun=recorder.rerun if recorder is not None else 0,
+            started_at=frame['started_at'],
+            wall_s=wall - frame['wall'],
+            cpu_s=cpu - frame['cpu'],
+            peak_bytes=peak_bytes,
+            thread=threading.current_thread().name,
+        )
+        if recorder is not None:
+            recorder.record(timing)
+        if perf_logger.isEnabledFor(logging.INFO):
+            perf_logger.info(json.dumps(asdict(timing)))
+        return False
+
+
+def _stack() -> List[Dict[str, Any]]:
+    if not hasattr(_open_stages, 'stack'):
+        _open_stages.stack = []
+    return _open_stages.stack
+
+
+def set_memory_tracking(enabled: bool, user: Any) -> None:
+    """
+    Ask for peak-memory measurement on behalf of one session, or stop asking.
+
+    tracemalloc is process-wide, so tracking stays on while any session
+    asks for it; sessions that ended without switching it off are dropped
+    on the next call. Tracing every allocation slows Python code down
+    noticeably, so it is off unless a performance panel asks for it. Peaks
+    are process-wide too: a stage that overlaps a running job or another
+    session's stage includes their allocations.
+
+    Args:
+    enabled (bool): Whether this session wants memory tracking.
+    user (Any): The asking session's object, e.g. its PerformanceRecorder; held weakly.
+    """
+    with _tracing_lock:
+        if enabled:
+            _memory_tracking_users.add(user)
+        else:
+            _memory_tracking_users.discard(user)
+        if len(_memory_tracking_users) and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif not len(_memory_tracking_users) and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def get_performance_recorder() -> PerformanceRecorder:
+    """Return the stage timing recorder of the current session."""
+    if 'performance_recorder' not in st.session_state:
+        st.session_state.performance_recorder = PerformanceRecorder()
+    return st.session_state.performance_recorder
@@ -0,0 +1,194 @@
+import os
+import threading
+import contextvars
+import multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, Executor
+from typing import Any, Callable, Dict, List, Optional
+import streamlit as st
+from services.error_handling import logger
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function once cancellation has been requested."""
+
+
+class Job:
+    """
+    Handle of a function running on the background job pool.
+
+    The function receives the job as its first argument and reports
+    progress through `report`, which is also where a requested cancellation
+    takes effect. Reruns read `status`, `progress` and `message` and pick up
+    `result()` once the job is done.
+    """
+
+    def __init__(self, key: str, label: str = ''):
+        self.key = key
+        self.label = label
+        self.progress = 0.0
+        self.message = ''
+        self.future: Optional[Future] = None
+        # Set once the UI shows the job; only watched jobs keep the page polling.
+        self.watched = False
+        self._cancel = threading.Event()
+
+    def report(self, fraction: Optional[float] = None, message: Optional[str] = None) -> None:
+        """
+        Publish progress from inside the job.
+
+        Args:
+        fraction (Optional[float]): Share of the work done, between 0 and 1.
+        message (Optional[str]): Short status text.
+
+        Raises:
+        JobCancelled: If the job has been cancelled.
+        """
+        if self._cancel.is_set():
+            raise JobCancelled(self.key)
+        if fraction is not None:
+            self.progress = min(max(float(fraction), 0.0), 1.0)
+        if message is not None:
+            self.message = message
+
+    def cancel(self) -> None:
+        """Request cancellation; a job that has not started yet never runs."""
+        self._cancel.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    @property
+    def status(self) -> str:
+        if self.future.cancelled():
+            return CANCELLED
+        if not self.future.done():
+            return RUNNING if self.future.running() else PENDING
+        error = self.future.exception()
+        if isinstance(error, JobCancelled):
+            return CANCELLED
+        return FAILED if error is not None else DONE
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    def result(self) -> Any:
+        """Return the job's result; raises its exception if it failed."""
+        return self.future.result()
+
+    def error(self) -> Optional[BaseException]:
+        """Return the exception of a failed job, if any."""
+        return None if self.status != FAILED else self.future.exception()
+
+
+class JobManager:
+    """
+    The background jobs of one session, keyed by what they compute.
+
+    Submitting a key that already has a job returns the existing handle, so
+    a rerun attaches to the running or finished work instead of starting it
+    again. Jobs stay until they are discarded; `display_job_status` discards
+    a finished job once it has handed out the result, so the session never
+    holds results (stores, indexes) that their caches have evicted.
+    """
+
+    def __init__(self, executor: Executor):
+        self._executor = executor
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: Any, label: str = '', **kwargs: Any) -> Job:
+        """
+        Run `fn(job, *args, **kwargs)` in the background, once per key.
+
+        Args:
+        key (str): Identity of the work, e.g. 'ingest:<content hash>'.
+        fn (Callable[..., Any]): The job function.
+        label (str): Human-readable description.
+
+        Returns:
+        Job: The new or existing job.
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None:
+                job = Job(key, label)
+                # Run in a copy of the caller's context, so e.g. stage timings
+                # reach the recorder of the session that submitted the job.
+                context = contextvars.copy_context()
+                job.future = self._executor.submit(context.run, _run_job, fn, job, *args, **kwargs)
+                self._jobs[key] = job
+            return job
+
+    def get(self, key: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(key)
+
+    def discard(self, key: str) -> None:
+        """Cancel a job if it is still running and forget it."""
+        with self._lock:
+            job = self._jobs.pop(key, None)
+        if job is not None and not job.finished:
+            job.cancel()
+
+    def active(self) -> List[Job]:
+        """Return the jobs that are pending or running."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job for job in jobs if not job.finished]
+
+
+def store_job_key(name: str, store: Any) -> str:
+    """
+    Return the key of a job that memoizes `name` on a store.
+
+    The key names the store object as well as its content: a store reloaded
+    after an eviction has the same fingerprint but an empty memo, so it needs
+    a job of its own rather than the finished one of its predecessor.
+
+    Args:
+    name (str): The memo key, e.g. 'search_index'.
+    store (Any): The EntryStore the job works on.
+
+    Returns:
+    str: The job key.
+    """
+    return f"{name}:{store.fingerprint}:{id(store)}"
+
+
+def _run_job(fn: Callable[..., Any], job: Job, *args: Any, **kwargs: Any) -> Any:
+    """Run a job function, logging its failure once, where it happens."""
+    try:
+        return fn(job, *args, **kwargs)
+    except JobCancelled:
+        raise
+    except Exception:
+        logger.exception(f"Job {job.key} failed")
+        raise
+
+
+@st.cache_resource
+def get_job_executor() -> ThreadPoolExecutor:
+    """Return the worker pool shared by every session of this server."""
+    # Parsing and tokenizing spend much of their time in pandas, pyarrow and
+    # regex code; two workers keep the server responsive for other sessions.
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix='asosyal-job')
+
+
+@st.cache_resource
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the process pool for CPU-bound analytics, one worker per core."""
+    # Spawned rather than forked: forking the threaded server can deadlock the children.
+    return ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=multiprocessing.get_context('spawn'))
+
+
+def get_job_manager() -> JobManager:
+    """Return the job manager of the current session."""
+    if 'job_manager' not in st.session_state:
+        st.session_state.job_manager = JobManager(get_job_executor())
+    return st.session_state.job_manager
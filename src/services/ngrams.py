@@ -0,0 +1,180 @@
+import math
+from collections import Counter
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+import numpy as np
+from services.entry_store import EntryStore
+from services.instrumentation import stage_timer
+from services.stopwords import TURKISH_STOPWORDS
+from services.word_frequency import NO_STOPWORDS, tokenize
+
+# Entries per map task; large enough that pickling the texts is cheap next to tokenizing them.
+SHARD_SIZE = 5000
+MAX_N = 3
+# N-grams seen fewer times than this are dropped after the reduce step.
+MIN_COUNT = 2
+
+
+def count_shard(texts: List[str], max_n: int = MAX_N) -> Tuple[List[Counter], int]:
+    """
+    Map step: count the 1- to `max_n`-grams of a shard of entry bodies.
+
+    N-grams never span two entries, and those containing a stopword are
+    skipped, so "bir gün" does not count but "zor hafta" does.
+
+    Args:
+    texts (List[str]): Entry bodies.
+    max_n (int): Longest n-gram.
+
+    Returns:
+    Tuple[List[Counter], int]: A counter per n (index 0 holds the words),
+    with n-grams joined by spaces, and the number of word tokens.
+    """
+    grams: List[List[str]] = [[] for _ in range(max_n)]
+    for text in texts:
+        # Stopwords become gaps that break n-grams instead of joining their neighbours.
+        words = [None if token in TURKISH_STOPWORDS else token for token in tokenize(text, NO_STOPWORDS)]
+        grams[0].extend(word for word in words if word)
+        for n in range(2, max_n + 1):
+            grams[n - 1].extend(' '.join(gram) for gram in zip(*(words[i:] for i in range(n))) if all(gram))
+    # One C-level count per shard is much faster than updating per entry.
+    return [Counter(gram_list) for gram_list in grams], len(grams[0])
+
+
+def _shards(store: EntryStore, shard_size: int) -> Iterator[List[str]]:
+    for start in range(0, len(store), shard_size):
+        yield store.entiri.take(np.arange(start, min(start + shard_size, len(store)))).tolist()
+
+
+class NgramCounts:
+    """
+    Corpus-wide word, bigram and trigram counts of a dataset.
+
+    `counts[n - 1]` maps each n-gram (words joined by spaces) to its count;
+    `total_tokens` is the number of non-stopword tokens. Built by a
+    map-reduce over shards of entries, which a process pool runs on every
+    core.
+    """
+
+    def __init__(self, counts: List[Dict[str, int]], total_tokens: int):
+        self.counts = counts
+        self.total_tokens = total_tokens
+
+    @classmethod
+    @stage_timer('ngrams')
+    def from_store(cls, store: EntryStore, executor: Optional[Executor] = None, max_n: int = MAX_N,
+                   shard_size: int = SHARD_SIZE, min_count: int = MIN_COUNT,
+                   on_progress: Optional[Callable[[float], None]] = None) -> 'NgramCounts':
+        """
+        Count the n-grams of every entry body of a store.
+
+        Shards are submitted to `executor` as workers free up, at most two
+        per worker at a time, so the pickled text in flight stays bounded;
+        partial counters are merged as they arrive. Without an executor the
+        shards are counted in this thread.
+
+        Args:
+        store (EntryStore): The loaded entries.
+        executor (Optional[Executor]): Pool running `count_shard`, e.g. `services.jobs.get_process_pool()`.
+        max_n (int): Longest n-gram.
+        shard_size (int): Entries per map task.
+        min_count (int): N-grams (n > 1) rarer than this are dropped.
+        on_progress (Optional[Callable[[float], None]]): Called with the share of shards done.
+
+        Returns:
+        NgramCounts: The counts.
+        """
+        merged = [Counter() for _ in range(max_n)]
+        total = 0
+        shard_count = max(math.ceil(len(store) / shard_size), 1)
+        done = 0
+
+        def reduce(result: Tuple[List[Counter], int]) -> None:
+            nonlocal total, done
+            counters, tokens = result
+            for target, counter in zip(merged, counters):
+                target.update(counter)
+            total += tokens
+            done += 1
+            if on_progress:
+                on_progress(done / shard_count)
+
+        if executor is None:
+            for texts in _shards(store, shard_size):
+                reduce(count_shard(texts, max_n))
+        else:
+            max_in_flight = 2 * (getattr(executor, '_max_workers', None) or 1)
+            pending: Set[Future] = set()
+            try:
+                for texts in _shards(store, shard_size):
+                    if len(pending) >= max_in_flight:
+                        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            reduce(future.result())
+                    pending.add(executor.submit(count_shard, texts, max_n))
+                for future in wait(pending).done:
+                    reduce(future.result())
+            finally:
+                # On cancellation or failure, drop the shards that have not started.
+                for future in pending:
+                    future.cancel()
+
+        counts = [dict(merged[0])] + [
+            {gram: count for gram, count in counter.items() if count >= min_count} for counter in merged[1:]
+        ]
+        return cls(counts, total)
+
+    def top(self, n: int = 2, k: int = 20) -> List[Tuple[str, int]]:
+        """
+        Return the most frequent n-grams.
+
+        Args:
+        n (int): N-gram length.
+        k (int): Number of n-grams.
+
+        Returns:
+        List[Tuple[str, int]]: (n-gram, count) pairs, most frequent first.
+        """
+        return Counter(self.counts[n - 1]).most_common(k)
+
+    def collocations(self, k: int = 20, min_count: int = 5) -> List[Tuple[str, float, int]]:
+        """
+        Rank bigrams by pointwise mutual information.
+
+        PMI = log2(p(x y) / (p(x) p(y))) with probabilities relative to the
+        token count. It favours rare pairs, so bigrams seen fewer than
+        `min_count` times are ignored.
+
+        Args:
+        k (int): Number of bigrams.
+        min_count (int): Minimum bigram count.
+
+        Returns:
+        List[Tuple[str, float, int]]: (bigram, PMI, count), highest PMI first.
+        """
+        words = self.counts[0]
+        total = self.total_tokens
+        scored = []
+        for bigram, count in self.counts[1].items():
+            if count < min_count:
+                continue
+            first, second = bigram.split(' ')
+            scored.append((bigram, math.log2(count * total / (words[first] * words[second])), count))
+        scored.sort(key=lambda item: (-item[1], -item[2]))
+        return scored[:k]
+
+
+def get_ngram_counts(store: EntryStore, executor: Optional[Executor] = None,
+                     on_progress: Optional[Callable[[float], None]] = None) -> NgramCounts:
+    """
+    Return the n-gram counts of a store, building them on first use.
+
+    Args:
+    store (EntryStore): The loaded entries.
+    executor (Optional[Executor]): Pool used if the counts are built by this call.
+    on_progress (Optional[Callable[[float], None]]): Progress callback used if the counts are built by this call.
+
+    Returns:
+    NgramCounts: The counts cached alongside the store.
+    """
+    return store.memo('ngrams', lambda store: NgramCounts.from_store(store, executor, on_progress=on_progress))
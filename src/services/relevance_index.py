@@ -0,0 +1,299 @@
+import re
+import unicodedata
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from services.entry_store import EntryStore
+from services.instrumentation import stage_timer
+from services.word_frequency import NO_STOPWORDS, TOKEN_RE, URL_RE, tokenize
+from utils.turkish_text import turkish_casefold
+
+# BM25 parameters: term-frequency saturation and document-length normalization.
+K1 = 1.2
+B = 0.75
+# Characters of body text around the matches shown for a result.
+SNIPPET_WIDTH = 240
+_BUILD_CHUNK_SIZE = 20000
+
+
+def query_terms(query: str) -> List[str]:
+    """Return the distinct index terms of a query, in order of appearance."""
+    return list(dict.fromkeys(tokenize(query, NO_STOPWORDS)))
+
+
+class RelevanceIndex:
+    """
+    BM25 inverted index over the words of every entry's title and body.
+
+    Terms are the tokens of `services.word_frequency.tokenize`, stopwords
+    included: their low IDF ranks them down, and the top-k pruning skips
+    their long posting lists. Postings are stored in CSR form:
+    `docs[offsets[t]:offsets[t + 1]]` are the ascending row ids containing term t and `impacts` their
+    precomputed BM25 term scores, so a query only gathers and adds floats.
+    `max_impacts[t]` bounds the score term t can add to any entry, which lets
+    `search` stop reading posting lists that cannot change the top k.
+    """
+
+    def __init__(self, vocabulary: Dict[str, int], offsets: np.ndarray, docs: np.ndarray,
+                 impacts: np.ndarray, doc_lengths: np.ndarray):
+        self.vocabulary = vocabulary
+        self.offsets = offsets
+        self.docs = docs
+        self.impacts = impacts
+        self.doc_lengths = doc_lengths
+        if len(impacts):
+            self.max_impacts = np.maximum.reduceat(impacts, offsets[:-1]).astype(np.float64)
+        else:
+            self.max_impacts = np.empty(0, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    @classmethod
+    @stage_timer('relevance_index')
+    def from_store(cls, store: EntryStore, k1: float = K1, b: float = B,
+                   on_progress: Optional[Callable[[float], None]] = None) -> 'RelevanceIndex':
+        """
+        Tokenize and score every entry of a store once.
+
+        Args:
+        store (EntryStore): The loaded entries.
+        k1 (float): BM25 term-frequency saturation.
+        b (float): BM25 length normalization.
+        on_progress (Optional[Callable[[float], None]]): Called with the share of rows done after each chunk.
+
+        Returns:
+        RelevanceIndex: The index.
+        """
+        title_tokens = [tokenize(title, NO_STOPWORDS) for title in store.baslik.categories]
+        codes = store.baslik.codes
+        vocabulary: Dict[str, int] = {}
+        doc_lengths = np.zeros(len(store), dtype=np.int32)
+        term_chunks: List[np.ndarray] = []
+        tf_chunks: List[np.ndarray] = []
+        doc_chunks: List[np.ndarray] = []
+        for start in range(0, len(store), _BUILD_CHUNK_SIZE):
+            rows = np.arange(start, min(start + _BUILD_CHUNK_SIZE, len(store)))
+            chunk_terms: List[int] = []
+            chunk_tfs: List[int] = []
+            chunk_docs: List[int] = []
+            for row, text in zip(rows.tolist(), store.entiri.take(rows).tolist()):
+                tokens = tokenize(text, NO_STOPWORDS)
+                if codes[row] >= 0:
+                    tokens += title_tokens[codes[row]]
+                doc_lengths[row] = len(tokens)
+                for token, tf in Counter(tokens).items():
+                    chunk_terms.append(vocabulary.setdefault(token, len(vocabulary)))
+                    chunk_tfs.append(tf)
+                    chunk_docs.append(row)
+            term_chunks.append(np.array(chunk_terms, dtype=np.int32))
+            tf_chunks.append(np.array(chunk_tfs, dtype=np.int32))
+            doc_chunks.append(np.array(chunk_docs, dtype=np.int32))
+            if on_progress:
+                on_progress((rows[-1] + 1) / len(store))
+
+        empty = np.empty(0, dtype=np.int32)
+        terms = np.concatenate(term_chunks) if term_chunks else empty
+        tfs = np.concatenate(tf_chunks) if tf_chunks else empty
+        docs = np.concatenate(doc_chunks) if doc_chunks else empty
+        # Postings were collected in row order, so a stable sort keeps each list ascending.
+        order = np.argsort(terms, kind='stable')
+        terms, tfs, docs = terms[order], tfs[order], docs[order]
+        df = np.bincount(terms, minlength=len(vocabulary))
+        offsets = np.concatenate(([0], np.cumsum(df))).astype(np.int64)
+
+        # Lucene's IDF, which stays positive for terms in most entries.
+        idf = np.log1p((len(store) - df + 0.5) / (df + 0.5))
+        average_length = doc_lengths.mean() if len(store) else 0.0
+        norms = k1 * (1 - b + b * doc_lengths / max(average_length, 1e-9))
+        impacts = (idf[terms] * tfs * (k1 + 1) / (tfs + norms[docs])).astype(np.float32)
+        return cls(vocabulary, offsets, docs, impacts, doc_lengths)
+
+    def postings(self, term: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the ascending row ids containing a term id and their term scores."""
+        lo, hi = self.offsets[term], self.offsets[term + 1]
+        return self.docs[lo:hi], self.impacts[lo:hi]
+
+    def _term_ids(self, query: str) -> List[int]:
+        return [self.vocabulary[term] for term in query_terms(query) if term in self.vocabulary]
+
+    def scores(self, query: str) -> np.ndarray:
+        """
+        Score every entry against a query without pruning.
+
+        Args:
+        query (str): The query text.
+
+        Returns:
+        np.ndarray: BM25 score per row; 0 for rows matching no term.
+        """
+        scores = np.zeros(len(self), dtype=np.float64)
+        for term in self._term_ids(query):
+            docs, impacts = self.postings(term)
+            scores[docs] += impacts
+        return scores
+
+    @stage_timer('relevance_search')
+    def search(self, query: str, k: int = 100, mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the k entries scoring highest against a query.
+
+        Posting lists are read term at a time, highest `max_impacts` first.
+        Once the k-th best partial score exceeds what the unread terms could
+        add, unseen entries can no longer make the top k: the remaining lists
+        only update the current candidates, and candidates that cannot reach
+        the k-th score are dropped (MaxScore). The result equals ranking
+        `scores(query)`.
+
+        Args:
+        query (str): The query text; entries matching any of its terms qualify.
+        k (int): Number of results.
+        mask (Optional[np.ndarray]): Boolean row mask of the entries eligible, e.g. the date filter.
+
+        Returns:
+        Tuple[np.ndarray, np.ndarray]: Row ids and their scores, best first;
+        ties are broken by row id.
+        """
+        terms = sorted(self._term_ids(query), key=lambda term: -self.max_impacts[term])
+        candidates = np.empty(0, dtype=np.int64)
+        scores = np.empty(0, dtype=np.float64)
+        if k <= 0 or not terms:
+            return candidates, scores
+
+        # remaining[i]: the most the terms from i on can add to one entry.
+        remaining = np.append(np.cumsum(self.max_impacts[terms][::-1])[::-1], 0.0)
+        threshold = -np.inf
+        for i, term in enumerate(terms):
+            docs, impacts = self.postings(term)
+            if mask is not None:
+                eligible = mask[docs]
+                docs, impacts = docs[eligible], impacts[eligible]
+            if len(candidates) >= k and remaining[i] < threshold:
+                # Only the current candidates can still make the top k.
+                found = np.searchsorted(docs, candidates)
+                found[found == len(docs)] = 0
+                hit = docs[found] == candidates if len(docs) else np.zeros(len(candidates), dtype=bool)
+                scores[hit] += impacts[found[hit]]
+            else:
+                merged, inverse = np.unique(np.concatenate((candidates, docs)), return_inverse=True)
+                scores = np.bincount(inverse, weights=np.concatenate((scores, impacts)), minlength=len(merged))
+                candidates = merged
+            if len(candidates) >= k:
+                threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+                keep = scores + remaining[i + 1] >= threshold
+                candidates, scores = candidates[keep], scores[keep]
+
+        top = np.lexsort((candidates, -scores))[:k]
+        return candidates[top], scores[top]
+
+
+def _word_spans(text: str) -> List[Tuple[int, int, str]]:
+    """Return the (start, end, term) of every word of `text`, URLs skipped."""
+    text = URL_RE.sub(lambda match: ' ' * len(match.group()), text)
+    spans = []
+    for match in TOKEN_RE.finditer(text):
+        word = re.split(r"['’]", match.group(), maxsplit=1)[0]
+        term = turkish_casefold(word)
+        if len(term) > 1:
+            spans.append((match.start(), match.start() + len(word), term))
+    return spans
+
+
+def _matches(text: str, terms: List[str]) -> List[Tuple[int, int, str]]:
+    wanted = set(terms)
+    return [span for span in _word_spans(text) if span[2] in wanted] if wanted else []
+
+
+def _segments(text: str, spans: List[Tuple[int, int, str]], start: int, end: int) -> List[Tuple[str, bool]]:
+    """Split text[start:end] into plain and matched segments."""
+    segments: List[Tuple[str, bool]] = []
+    position = start
+    for lo, hi, _ in spans:
+        if lo < position or hi > end:
+            continue
+        if lo > position:
+            segments.append((text[position:lo], False))
+        segments.append((text[lo:hi], True))
+        position = hi
+    if end > position:
+        segments.append((text[position:end], False))
+    return segments
+
+
+def highlight(text: str, terms: List[str]) -> List[Tuple[str, bool]]:
+    """
+    Mark the query terms in a whole text, e.g. a title.
+
+    Args:
+    text (str): The text.
+    terms (List[str]): Query terms, as returned by `query_terms`.
+
+    Returns:
+    List[Tuple[str, bool]]: (text, is_match) segments.
+    """
+    text = unicodedata.normalize('NFC', text or '')
+    return _segments(text, _matches(text, terms), 0, len(text))
+
+
+def snippet(text: str, terms: List[str], width: int = SNIPPET_WIDTH) -> List[Tuple[str, bool]]:
+    """
+    Cut the passage of an entry body that best matches a query.
+
+    The window of `width` characters holding the most distinct query terms
+    is kept, with some context before its first match, widened to word
+    boundaries and split into segments.
+
+    Args:
+    text (str): The entry body.
+    terms (List[str]): Query terms, as returned by `query_terms`.
+    width (int): Approximate snippet length in characters.
+
+    Returns:
+    List[Tuple[str, bool]]: (text, is_match) segments; cut ends are marked with '…'.
+    """
+    text = unicodedata.normalize('NFC', text or '')
+    spans = _matches(text, terms)
+
+    start = 0
+    if spans:
+        # Sliding window over the matches, counting the distinct terms inside.
+        best, best_covered, ahead = 0, 0, 0
+        inside: Counter = Counter()
+        for i, (lo, _, term) in enumerate(spans):
+            while ahead < len(spans) and spans[ahead][0] < lo + width:
+                inside[spans[ahead][2]] += 1
+                ahead += 1
+            if len(inside) > best_covered:
+                best, best_covered = i, len(inside)
+            inside[term] -= 1
+            if not inside[term]:
+                del inside[term]
+        start = max(spans[best][0] - width // 4, 0)
+    end = min(start + width, len(text))
+    if start > 0:
+        boundary = text.rfind(' ', 0, start)
+        start = boundary + 1 if boundary >= 0 else 0
+    if end < len(text):
+        boundary = text.find(' ', end)
+        end = boundary if boundary >= 0 else len(text)
+
+    segments = _segments(text, spans, start, end)
+    if start > 0:
+        segments.insert(0, ('…', False))
+    if end < len(text):
+        segments.append(('…', False))
+    return segments
+
+
+def get_relevance_index(store: EntryStore, on_progress: Optional[Callable[[float], None]] = None) -> RelevanceIndex:
+    """
+    Return the BM25 index of a store, building it on first use.
+
+    Args:
+    store (EntryStore): The loaded entries.
+    on_progress (Optional[Callable[[float], None]]): Progress callback used if the index is built by this call.
+
+    Returns:
+    RelevanceIndex: The index cached alongside the store.
+    """
+    return store.memo('relevance_index', lambda store: RelevanceIndex.from_store(store, on_progress=on_progress))
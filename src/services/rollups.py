@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.instrumentation import stage_timer
+
+GRANULARITIES = ('year', 'month', 'day', 'hourly', 'weekday', 'hour', 'weekday_hour')
+
+_NS_PER_HOUR = 3600 * 10 ** 9
+_NS_PER_DAY = 24 * _NS_PER_HOUR
+# 1970-01-01 was a Thursday; weekdays are numbered from Monday = 0.
+_EPOCH_WEEKDAY = 3
+
+
+@dataclass
+class Rollup:
+    """
+    Entry counts and score sums per time bucket, split by deletion state.
+
+    keys (np.ndarray): Bucket labels in ascending order.
+    counts (np.ndarray): (len(keys), 2) entry counts; column 0 holds live
+    entries and column 1 deleted (`silinmis`) ones.
+    scores (np.ndarray): (len(keys), 2) `skor` sums, laid out like `counts`.
+    """
+    keys: np.ndarray
+    counts: np.ndarray
+    scores: np.ndarray
+
+    def frame(self, silinmis: Optional[bool] = None) -> pd.DataFrame:
+        """
+        Return the rollup as a DataFrame.
+
+        Args:
+        silinmis (Optional[bool]): Only live (False) or deleted (True) entries. Defaults to both.
+
+        Returns:
+        pd.DataFrame: `count` and `skor` columns indexed by bucket.
+        """
+        if silinmis is None:
+            counts, scores = self.counts.sum(axis=1), self.scores.sum(axis=1)
+        else:
+            counts, scores = self.counts[:, int(silinmis)], self.scores[:, int(silinmis)]
+        return pd.DataFrame({'count': counts, 'skor': scores}, index=pd.Index(self.keys))
+
+
+def _dense_bucket(values: np.ndarray, silinmis: np.ndarray, skor: np.ndarray) -> Rollup:
+    """Sum rows per integer value over the full range between the smallest and largest, empty buckets included."""
+    if not len(values):
+        return _bucket(values, silinmis, skor, np.empty(0, dtype=np.int64))
+    low = values.min()
+    rollup = _bucket(values - low, silinmis, skor, np.arange(values.max() - low + 1))
+    rollup.keys = rollup.keys + low
+    return rollup
+
+
+def _bucket(values: np.ndarray, silinmis: np.ndarray, skor: np.ndarray,
+            keys: Optional[np.ndarray] = None) -> Rollup:
+    """Sum rows per bucket value; `keys` fixes the bucket set (e.g. 0..23 for hours)."""
+    if keys is None:
+        keys, inverse = np.unique(values, return_inverse=True)
+    else:
+        inverse = values
+    cells = inverse * 2 + silinmis
+    size = 2 * len(keys)
+    counts = np.bincount(cells, minlength=size).reshape(-1, 2).astype(np.int64)
+    scores = np.bincount(cells, weights=skor, minlength=size).reshape(-1, 2).astype(np.int64)
+    return Rollup(keys, counts, scores)
+
+
+class TimeRollups:
+    """
+    Precomputed time-bucket aggregates of a dataset.
+
+    One pass over the timestamp column fills a rollup per granularity:
+    'year' (int years), 'month' and 'day' (bucket start timestamps of the
+    non-empty buckets), 'hourly' (every hour from the first entry to the
+    last, empty ones included), 'weekday' (0 = Monday), 'hour' (0-23, UTC)
+    and 'weekday_hour' (weekday * 24 + hour). Charts and summary metrics
+    slice these tables instead of grouping the entries.
+    """
+
+    def __init__(self, rollups: Dict[str, Rollup]):
+        self.rollups = rollups
+        day = rollups['day']
+        self.total_entries = int(day.counts.sum())
+        self.total_skor = int(day.scores.sum())
+        self.deleted_entries = int(day.counts[:, 1].sum())
+
+    def __getitem__(self, granularity: str) -> Rollup:
+        return self.rollups[granularity]
+
+    @classmethod
+    @stage_timer('rollups')
+    def from_store(cls, store: EntryStore, rows: Optional[np.ndarray] = None) -> 'TimeRollups':
+        """
+        Aggregate the entries of a store.
+
+        Args:
+        store (EntryStore): The loaded entries.
+        rows (Optional[np.ndarray]): Row ids to aggregate. Defaults to every entry.
+
+        Returns:
+        TimeRollups: The aggregates.
+        """
+        tarih, silinmis, skor = store.tarih, store.silinmis, store.skor
+        if rows is not None:
+            tarih, silinmis, skor = tarih.take(rows), silinmis.take(rows), skor.take(rows)
+        silinmis = silinmis.astype(np.int64)
+
+        hours = tarih // _NS_PER_HOUR
+        days = tarih // _NS_PER_DAY
+        weekdays = (days + _EPOCH_WEEKDAY) % 7
+        months = tarih.view('datetime64[ns]').astype('datetime64[M]').astype(np.int64)
+
+        year = _bucket(months // 12, silinmis, skor)
+        year.keys = year.keys + 1970
+        month = _bucket(months, silinmis, skor)
+        month.keys = month.keys.astype('datetime64[M]').astype('datetime64[ns]')
+        day = _bucket(days, silinmis, skor)
+        day.keys = day.keys.astype('datetime64[D]').astype('datetime64[ns]')
+        # Bincounts over the hour range, which stays small next to the row count.
+        hourly = _dense_bucket(hours, silinmis, skor)
+        hourly.keys = hourly.keys.astype('datetime64[h]').astype('datetime64[ns]')
+
+        return cls({
+            'year': year,
+            'month': month,
+            'day': day,
+            'hourly': hourly,
+            'weekday': _bucket(weekdays, silinmis, skor, np.arange(7)),
+            'hour': _bucket(hours % 24, silinmis, skor, np.arange(24)),
+            'weekday_hour': _bucket(weekdays * 24 + hours % 24, silinmis, skor, np.arange(7 * 24)),
+        })
+
+
+def get_time_rollups(store: EntryStore) -> TimeRollups:
+    """
+    Return the time rollups of a store, building them on first use.
+
+    The rollups live with the store, which the dataset cache keys by the
+    upload's content hash, so a rerun never re-aggregates or hashes the data.
+
+    Args:
+    store (EntryStore): The loaded entries.
+
+    Returns:
+    TimeRollups: The rollups cached alongside the store.
+    """
+    return store.memo('time_rollups', TimeRollups.from_store)
@@ -0,0 +1,168 @@
+from typing import List
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.instrumentation import stage_timer
+from services.text_store import CompressedText, DEFAULT_BLOCK_SIZE
+from utils.turkish_text import turkish_casefold
+
+# Separates the title from the body inside an indexed document; trigrams that
+# span it are never indexed and queries cannot contain it.
+_FIELD_SEPARATOR = '\x00'
+# A whole number of compressed blocks, so the chunks' texts concatenate as they are.
+_BUILD_CHUNK_SIZE = 80 * DEFAULT_BLOCK_SIZE
+
+
+def _trigram_keys(codepoints: np.ndarray) -> np.ndarray:
+    """Pack every run of three code points (21 bits each) into one uint64 key."""
+    cp = codepoints.astype(np.uint64)
+    return (cp[:-2] << np.uint64(42)) | (cp[1:-1] << np.uint64(21)) | cp[2:]
+
+
+def _normalize(text: str) -> str:
+    """Casefold a field and drop any separator characters it contains."""
+    return turkish_casefold(text).replace(_FIELD_SEPARATOR, ' ')
+
+
+def _text_trigrams(text: str) -> np.ndarray:
+    """Return the unique trigram keys of a normalized text."""
+    codepoints = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    return np.unique(_trigram_keys(codepoints))
+
+
+class SearchIndex:
+    """
+    Trigram posting-list index over the Turkish-casefolded entries.
+
+    Every document is `baslik` and `entiri` joined by a separator. Postings
+    are stored in CSR form: `gram_keys` holds the sorted unique trigram keys
+    and `docs[offsets[i]:offsets[i + 1]]` the ascending row ids containing
+    the i-th trigram. A substring query intersects the postings of its
+    trigrams, starting with the shortest list, and verifies the remaining
+    candidates against the normalized text. The normalized texts are kept
+    compressed, and verification decodes only the blocks of the candidates.
+    """
+
+    def __init__(self, texts: CompressedText, gram_keys: np.ndarray,
+                 offsets: np.ndarray, docs: np.ndarray):
+        self.texts = texts
+        self.gram_keys = gram_keys
+        self.offsets = offsets
+        self.docs = docs
+
+    @classmethod
+    @stage_timer('search_index')
+    def from_store(cls, store: EntryStore) -> 'SearchIndex':
+        """
+        Build the index for every entry of a store.
+
+        Args:
+        store (EntryStore): The loaded entries.
+
+        Returns:
+        SearchIndex: The index.
+        """
+        titles = np.array([_normalize(title) for title in store.baslik.categories], dtype=object)
+
+        text_chunks: List[CompressedText] = []
+        key_chunks: List[np.ndarray] = []
+        doc_chunks: List[np.ndarray] = []
+        for start in range(0, len(store), _BUILD_CHUNK_SIZE):
+            rows = np.arange(start, min(start + _BUILD_CHUNK_SIZE, len(store)))
+            texts = [
+                title + _FIELD_SEPARATOR + _normalize(body)
+                for title, body in zip(titles[store.baslik.codes[rows]], store.entiri.take(rows).tolist())
+            ]
+            keys, docs = cls._chunk_postings(texts, start)
+            text_chunks.append(CompressedText.from_arrow(pd.array(texts, dtype='string[pyarrow]')))
+            key_chunks.append(keys)
+            doc_chunks.append(docs)
+
+        keys = np.concatenate(key_chunks) if key_chunks else np.empty(0, dtype=np.uint64)
+        docs = np.concatenate(doc_chunks) if doc_chunks else np.empty(0, dtype=np.int32)
+        # Chunks are in row order, so a stable sort keeps each posting list ascending.
+        order = np.argsort(keys, kind='stable')
+        keys, docs = keys[order], docs[order]
+        gram_keys, starts = np.unique(keys, return_index=True)
+        offsets = np.append(starts, len(keys)).astype(np.int64)
+
+        return cls(CompressedText.concat(text_chunks), gram_keys, offsets, docs)
+
+    @staticmethod
+    def _chunk_postings(texts: List[str], first_row: int):
+        """Return the unique (trigram key, row id) pairs of a chunk of documents."""
+        if not texts:
+            return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int32)
+        corpus = _FIELD_SEPARATOR.join(texts) + _FIELD_SEPARATOR
+        codepoints = np.frombuffer(corpus.encode('utf-32-le'), dtype=np.uint32)
+        lengths = np.fromiter((len(text) + 1 for text in texts), dtype=np.int64, count=len(texts))
+        doc_of_position = np.repeat(np.arange(first_row, first_row + len(texts), dtype=np.int32), lengths)
+
+        keys = _trigram_keys(codepoints)
+        docs = doc_of_position[:-2]
+        valid = (codepoints[:-2] != 0) & (codepoints[1:-1] != 0) & (codepoints[2:] != 0)
+        keys, docs = keys[valid], docs[valid]
+
+        order = np.lexsort((keys, docs))
+        keys, docs = keys[order], docs[order]
+        keep = np.ones(len(keys), dtype=bool)
+        keep[1:] = (keys[1:] != keys[:-1]) | (docs[1:] != docs[:-1])
+        return keys[keep], docs[keep]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def postings(self, key: np.uint64) -> np.ndarray:
+        """Return the ascending row ids containing a trigram key."""
+        i = np.searchsorted(self.gram_keys, key)
+        if i == len(self.gram_keys) or self.gram_keys[i] != key:
+            return np.empty(0, dtype=np.int32)
+        return self.docs[self.offsets[i]:self.offsets[i + 1]]
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        Return the rows whose title or body contains `query`.
+
+        Matching is case-insensitive under Turkish rules.
+
+        Args:
+        query (str): The substring to look for.
+
+        Returns:
+        np.ndarray: Matching row ids in ascending order.
+        """
+        query = turkish_casefold(query).replace(_FIELD_SEPARATOR, '')
+        if not query:
+            return np.arange(len(self), dtype=np.int64)
+
+        if len(query) < 3:
+            candidates = None
+        else:
+            lists = [self.postings(key) for key in _text_trigrams(query)]
+            lists.sort(key=len)
+            candidates = lists[0]
+            for postings in lists[1:]:
+                if not len(candidates):
+                    break
+                candidates = np.intersect1d(candidates, postings, assume_unique=True)
+            if not len(candidates):
+                return np.empty(0, dtype=np.int64)
+
+        texts = self.texts.to_array() if candidates is None else self.texts.take(candidates)
+        verified = pd.Series(texts).str.contains(query, regex=False).to_numpy(dtype=bool)
+        if candidates is None:
+            return np.flatnonzero(verified)
+        return candidates[verified].astype(np.int64)
+
+
+def get_search_index(store: EntryStore) -> SearchIndex:
+    """
+    Return the search index of a store, building it on first use.
+
+    Args:
+    store (EntryStore): The loaded entries.
+
+    Returns:
+    SearchIndex: The index cached alongside the store.
+    """
+    return store.memo('search_index', SearchIndex.from_store)
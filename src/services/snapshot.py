@@ -0,0 +1,198 @@
+import os
+import shutil
+import logging
+import tempfile
+from typing import Optional
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from services.entry_store import EntryStore
+from services.text_store import CompressedText
+from utils.file_handling import get_file_size
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 3
+SNAPSHOT_DIR_ENV = 'ASOSYAL_SNAPSHOT_DIR'
+
+# Fixed-width columns are stored as .npy files and memory-mapped with np.load;
+# titles are stored as an Arrow IPC file (UTF-8 buffer plus offsets), and
+# bodies as their compressed blocks (see `services.text_store.CompressedText`).
+_NUMPY_COLUMNS = ['skor', 'silinmis', 'tarih', 'baslik_codes', 'date_order', 'entry_id']
+_TEXT_COLUMNS = ['entiri_data', 'entiri_block_offsets', 'entiri_offsets', 'entiri_block_size']
+
+
+def get_snapshot_dir() -> str:
+    """Return the directory holding dataset snapshots."""
+    return os.environ.get(SNAPSHOT_DIR_ENV) or os.path.join(tempfile.gettempdir(), 'asosyal-snapshots')
+
+
+def get_snapshot_path(fingerprint: str, directory: Optional[str] = None) -> str:
+    """
+    Get the snapshot directory of a dataset.
+
+    Args:
+    fingerprint (str): Content hash of the dataset.
+    directory (Optional[str]): The snapshot root. Defaults to `get_snapshot_dir()`.
+
+    Returns:
+    str: The path of the snapshot.
+    """
+    return os.path.join(directory or get_snapshot_dir(), f"{fingerprint}.v{SNAPSHOT_VERSION}")
+
+
+def has_snapshot(fingerprint: str, directory: Optional[str] = None) -> bool:
+    """Check whether a complete snapshot exists for a dataset."""
+    return os.path.isdir(get_snapshot_path(fingerprint, directory))
+
+
+def _write_strings(path: str, values: pa.ChunkedArray) -> None:
+    table = pa.table({'value': values})
+    with pa.OSFile(path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def _read_strings(path: str) -> pa.ChunkedArray:
+    # Buffers of a memory-mapped IPC file point straight into the mapping,
+    # which stays open for as long as they are referenced.
+    source = pa.memory_map(path, 'r')
+    return pa.ipc.open_file(source).read_all().column('value')
+
+
+def write_snapshot(store: EntryStore, fingerprint: Optional[str] = None, directory: Optional[str] = None) -> str:
+    """
+    Write a store to a columnar snapshot.
+
+    Entry bodies are written compressed, so a store read back from the
+    snapshot keeps them compact and decodes only the blocks it reads.
+    The snapshot is written to a scratch directory and renamed into place, so
+    readers never see a partial snapshot. If another process finished the
+    same snapshot first, its copy is kept.
+
+    Args:
+    store (EntryStore): The validated and cleaned dataset.
+    fingerprint (Optional[str]): Content hash of the dataset. Defaults to `store.fingerprint`.
+    directory (Optional[str]): The snapshot root. Defaults to `get_snapshot_dir()`.
+
+    Returns:
+    str: The path of the snapshot.
+    """
+    fingerprint = fingerprint or store.fingerprint
+    if not fingerprint:
+        raise ValueError("A fingerprint is required to write a snapshot")
+
+    path = get_snapshot_path(fingerprint, directory)
+    if os.path.isdir(path):
+        return path
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    scratch = tempfile.mkdtemp(prefix=f"{os.path.basename(path)}.", suffix='.part', dir=os.path.dirname(path))
+    try:
+        entiri = store.compress_text().entiri
+        data, block_offsets = entiri.to_buffers()
+        columns = {
+            'skor': store.skor,
+            'silinmis': store.silinmis,
+            'tarih': store.tarih,
+            'baslik_codes': store.baslik.codes,
+            'date_order': store.date_order,
+            'entry_id': store.entry_id,
+            'entiri_data': data,
+            'entiri_block_offsets': block_offsets,
+            'entiri_offsets': entiri.offsets,
+            'entiri_block_size': np.array([entiri.block_size], dtype=np.int64),
+        }
+        for name, values in columns.items():
+            np.save(os.path.join(scratch, f"{name}.npy"), np.ascontiguousarray(values), allow_pickle=False)
+        titles = pa.chunked_array([pa.array(store.baslik.categories.to_numpy(dtype=object), type=pa.string())])
+        _write_strings(os.path.join(scratch, 'baslik.arrow'), titles)
+        os.replace(scratch, path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+        # Lost the race against another writer; its snapshot is equivalent.
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return path
+
+
+def read_snapshot(fingerprint: str, directory: Optional[str] = None) -> Optional[EntryStore]:
+    """
+    Load a snapshot by memory-mapping its column files.
+
+    Fixed-width columns, title strings and compressed body blocks are read
+    without copying, and the pages are shared with every other process
+    mapping the same snapshot.
+
+    Args:
+    fingerprint (str): Content hash of the dataset.
+    directory (Optional[str]): The snapshot root. Defaults to `get_snapshot_dir()`.
+
+    Returns:
+    Optional[EntryStore]: The store, or None if there is no usable snapshot.
+    """
+    path = get_snapshot_path(fingerprint, directory)
+    if not os.path.isdir(path):
+        return None
+    try:
+        columns = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r', allow_pickle=False)
+            for name in _NUMPY_COLUMNS + _TEXT_COLUMNS
+        }
+        titles = _read_strings(os.path.join(path, 'baslik.arrow'))
+        entiri = CompressedText.from_buffers(columns['entiri_data'], columns['entiri_block_offsets'],
+                                             columns['entiri_offsets'], int(columns['entiri_block_size'][0]))
+    except (OSError, ValueError, pa.ArrowException) as e:
+        logger.warning(f"Ignoring unreadable snapshot {path}: {e}")
+        return None
+
+    baslik = pd.Categorical.from_codes(columns['baslik_codes'], categories=pd.Index(titles.to_pylist(), dtype=object))
+    # Record the access so pruning keeps recently used snapshots.
+    os.utime(path)
+    return EntryStore(columns['skor'], baslik, entiri, columns['silinmis'], columns['tarih'],
+                      fingerprint, date_order=columns['date_order'], entry_id=columns['entry_id'])
+
+
+def prune_snapshots(max_total_bytes: int = 2 * 1024 ** 3, directory: Optional[str] = None) -> int:
+    """
+    Remove the least recently used snapshots beyond a disk budget.
+
+    Snapshots of older format versions are always removed.
+
+    Args:
+    max_total_bytes (int): Total size the snapshots may occupy.
+    directory (Optional[str]): The snapshot root. Defaults to `get_snapshot_dir()`.
+
+    Returns:
+    int: The number of bytes freed.
+    """
+    root = directory or get_snapshot_dir()
+    if not os.path.isdir(root):
+        return 0
+
+    snapshots = []
+    freed = 0
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        stem, _, version = name.rpartition('.v')
+        if not stem or not version.isdigit() or not os.path.isdir(path):
+            continue
+        try:
+            size = sum(get_file_size(os.path.join(path, file_name)) for file_name in os.listdir(path))
+            mtime = os.path.getmtime(path)
+        except OSError:
+            continue
+        if int(version) != SNAPSHOT_VERSION:
+            shutil.rmtree(path, ignore_errors=True)
+            freed += size
+        else:
+            snapshots.append((mtime, size, path))
+
+    total = sum(size for _, size, _ in snapshots) + freed
+    for _, size, path in sorted(snapshots):
+        if total - freed <= max_total_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        freed += size
+    return freed
@@ -0,0 +1,13 @@
+# Turkish stopwords bundled with the app so that no corpus has to be
+# downloaded at runtime. Based on the NLTK Turkish list, extended with a few
+# high-frequency function words and sözlük markup that carry no meaning on
+# their own. All entries are Turkish-casefolded.
+TURKISH_STOPWORDS = frozenset("""
+acaba ama aslında az bazı belki biri birkaç birşey biz bu çok çünkü da daha de defa diye eğer en
+gibi hem hep hepsi her hiç için ile ise kez ki kim mı mu mü nasıl ne neden nerde nerede nereye
+niçin niye o sanki şey siz şu tüm ve veya ya yani
+bir bi ben sen onlar bunu buna bunlar şunu ona onu onun benim senin bizim sizin
+beni bana seni sana bize size böyle şöyle öyle fakat ancak
+mi var yok değil olan olarak kadar sonra önce artık zaten sadece bile
+bkz http https www com
+""".split())
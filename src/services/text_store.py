@@ -0,0 +1,161 @@
+import zlib
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Entries per compressed block; a page of entries touches one or two blocks.
+DEFAULT_BLOCK_SIZE = 256
+
+
+class CompressedText:
+    """
+    Entry bodies as zlib-compressed blocks of UTF-8 text.
+
+    The bodies are one contiguous UTF-8 buffer with an offsets array, as in
+    Arrow; the buffer is cut into blocks of `block_size` entries and each
+    block is compressed on its own. `take` decompresses only the blocks that
+    hold the requested rows, so rendering a page decodes a few kilobytes.
+
+    blocks (List[bytes]): The compressed blocks; any bytes-like objects,
+    e.g. slices of a memory-mapped snapshot file.
+    offsets (np.ndarray): int64 start of every entry in the uncompressed
+    buffer, plus its total length.
+    block_size (int): Entries per block.
+    """
+
+    def __init__(self, blocks: List[bytes], offsets: np.ndarray, block_size: int = DEFAULT_BLOCK_SIZE):
+        self.blocks = blocks
+        self.offsets = offsets
+        self.block_size = block_size
+
+    @classmethod
+    def from_arrow(cls, values: pd.api.extensions.ExtensionArray, block_size: int = DEFAULT_BLOCK_SIZE,
+                   level: int = 6) -> 'CompressedText':
+        """
+        Compress an Arrow-backed string array.
+
+        Args:
+        values (pd.api.extensions.ExtensionArray): The bodies, e.g. `EntryStore.entiri`.
+        block_size (int): Entries per block.
+        level (int): zlib compression level.
+
+        Returns:
+        CompressedText: The compressed bodies; missing values become ''.
+        """
+        array = values.__arrow_array__()
+        if isinstance(array, pa.ChunkedArray):
+            array = array.combine_chunks() if array.num_chunks else pa.array([], type=pa.string())
+        array = array.fill_null('').cast(pa.large_string())
+        offsets = np.frombuffer(array.buffers()[1], dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+        data = array.buffers()[2]
+        data = memoryview(data) if data is not None else memoryview(b'')
+
+        blocks = []
+        for lo in range(0, len(array), block_size):
+            hi = min(lo + block_size, len(array))
+            blocks.append(zlib.compress(data[int(offsets[lo]):int(offsets[hi])], level))
+        return cls(blocks, offsets - offsets[0], block_size)
+
+    @classmethod
+    def from_buffers(cls, data: np.ndarray, block_offsets: np.ndarray, offsets: np.ndarray,
+                     block_size: int = DEFAULT_BLOCK_SIZE) -> 'CompressedText':
+        """
+        Wrap blocks stored back to back in one buffer, as written by `to_buffers`.
+
+        The blocks are views into `data`, so a memory-mapped buffer is not read
+        until a block is decoded.
+
+        Args:
+        data (np.ndarray): uint8 buffer of the concatenated blocks.
+        block_offsets (np.ndarray): int64 start of every block in `data`, plus its end.
+        offsets (np.ndarray): Entry offsets, see the class docstring.
+        block_size (int): Entries per block.
+
+        Returns:
+        CompressedText: The compressed bodies.
+        """
+        bounds = np.asarray(block_offsets).tolist()
+        return cls([data[lo:hi] for lo, hi in zip(bounds[:-1], bounds[1:])], offsets, block_size)
+
+    def to_buffers(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the blocks as one uint8 buffer and the int64 block offsets into it."""
+        block_offsets = np.zeros(len(self.blocks) + 1, dtype=np.int64)
+        np.cumsum([len(block) for block in self.blocks], out=block_offsets[1:])
+        data = np.frombuffer(b''.join(bytes(block) for block in self.blocks), dtype=np.uint8)
+        return data, block_offsets
+
+    @classmethod
+    def concat(cls, parts: List['CompressedText']) -> 'CompressedText':
+        """
+        Join compressed arrays without recompressing them.
+
+        Every part but the last must hold a whole number of blocks, all of the
+        same block size, e.g. chunks of a multiple of `block_size` entries.
+
+        Args:
+        parts (List[CompressedText]): The arrays, in order.
+
+        Returns:
+        CompressedText: The concatenation.
+        """
+        if not parts:
+            return cls([], np.zeros(1, dtype=np.int64))
+        block_size = parts[0].block_size
+        if any(part.block_size != block_size or len(part) % block_size for part in parts[:-1]) \
+                or parts[-1].block_size != block_size:
+            raise ValueError("Only whole blocks of the same size can be concatenated")
+        blocks = [block for part in parts for block in part.blocks]
+        offsets = [parts[0].offsets[:1]]
+        base = 0
+        for part in parts:
+            offsets.append(part.offsets[1:] + base)
+            base += int(part.offsets[-1])
+        return cls(blocks, np.concatenate(offsets).astype(np.int64), block_size)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(block) for block in self.blocks) + self.offsets.nbytes
+
+    def _block(self, index: int) -> pa.StringArray:
+        lo = index * self.block_size
+        hi = min(lo + self.block_size, len(self))
+        data = zlib.decompress(self.blocks[index])
+        offsets = (self.offsets[lo:hi + 1] - self.offsets[lo]).astype(np.int32)
+        return pa.StringArray.from_buffers(hi - lo, pa.py_buffer(offsets), pa.py_buffer(data))
+
+    def take(self, rows: np.ndarray) -> pd.arrays.ArrowStringArray:
+        """
+        Decode the given rows.
+
+        Args:
+        rows (np.ndarray): Row ids, in the wanted order.
+
+        Returns:
+        pd.arrays.ArrowStringArray: The bodies of `rows`.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if not len(rows):
+            return pd.arrays.ArrowStringArray(pa.chunked_array([], type=pa.string()))
+        needed, inverse = np.unique(rows // self.block_size, return_inverse=True)
+        decoded = [self._block(index) for index in needed]
+        starts = np.concatenate(([0], np.cumsum([len(block) for block in decoded])[:-1]))
+        local = rows - needed[inverse] * self.block_size + starts[inverse]
+        taken = pa.concat_arrays(decoded).take(pa.array(local))
+        return pd.arrays.ArrowStringArray(pa.chunked_array([taken]))
+
+    def __arrow_array__(self, type=None) -> pa.ChunkedArray:
+        """Decode every entry, one block per chunk."""
+        return pa.chunked_array([self._block(index) for index in range(len(self.blocks))], type=pa.string())
+
+    def to_array(self) -> pd.arrays.ArrowStringArray:
+        """Decode every entry into an Arrow-backed string array."""
+        return pd.arrays.ArrowStringArray(self.__arrow_array__())
+
+
+def text_array(values) -> pd.arrays.ArrowStringArray:
+    """Return bodies as an Arrow-backed string array, decoding compressed ones."""
+    return values.to_array() if isinstance(values, CompressedText) else values
@@ -0,0 +1,132 @@
+from typing import Dict, Optional
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.instrumentation import stage_timer
+from utils.turkish_text import turkish_casefold
+
+# Ranking keys of `TitleIndex.top`: the aggregate columns of `stats` to sort by.
+SORT_KEYS = ('entries', 'skor', 'last', 'deleted')
+
+
+def normalize_title(title: str) -> str:
+    """Casefold a title and collapse its whitespace, so spelling variants group together."""
+    return ' '.join(turkish_casefold(title).split())
+
+
+class TitleIndex:
+    """
+    Rows and aggregates of every title (`baslik`) of a dataset.
+
+    Titles are grouped by their normalized form. `lookup` maps a normalized
+    title to its group; the rows of group g are `rows[offsets[g]:offsets[g + 1]]`
+    in date order. `stats` holds one row per group with the display title,
+    `entries`, `skor` (sum), `first` and `last` dates and `deleted` count,
+    so rankings and drill-downs never scan the entries.
+    """
+
+    def __init__(self, lookup: Dict[str, int], rows: np.ndarray, offsets: np.ndarray, stats: pd.DataFrame):
+        self.lookup = lookup
+        self.rows = rows
+        self.offsets = offsets
+        self.stats = stats
+
+    def __len__(self) -> int:
+        return len(self.stats)
+
+    @classmethod
+    @stage_timer('title_index')
+    def from_store(cls, store: EntryStore) -> 'TitleIndex':
+        """
+        Index the titles of a store.
+
+        Args:
+        store (EntryStore): The loaded entries.
+
+        Returns:
+        TitleIndex: The index.
+        """
+        categories = store.baslik.categories
+        normalized, group_of_code = np.unique(
+            np.array([normalize_title(title) for title in categories], dtype=object), return_inverse=True
+        )
+        codes = store.baslik.codes
+        groups = group_of_code[codes] if len(codes) else np.empty(0, dtype=np.int64)
+
+        # Grouped by title, each group in date order.
+        rows = np.lexsort((store.tarih, groups))
+        counts = np.bincount(groups, minlength=len(normalized))
+        offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+        sorted_tarih = store.tarih[rows]
+        nonempty = counts > 0
+        first = np.zeros(len(normalized), dtype=np.int64)
+        last = np.zeros(len(normalized), dtype=np.int64)
+        first[nonempty] = sorted_tarih[offsets[:-1][nonempty]]
+        last[nonempty] = sorted_tarih[offsets[1:][nonempty] - 1]
+
+        # The spelling of a title's earliest entry stands for its group.
+        titles = np.array(categories, dtype=object)[codes[rows[offsets[:-1][nonempty]]]]
+        stats = pd.DataFrame({
+            'baslik': titles,
+            'entries': counts[nonempty],
+            'skor': np.bincount(groups, weights=store.skor, minlength=len(normalized))[nonempty].astype(np.int64),
+            'first': first[nonempty].view('datetime64[ns]'),
+            'last': last[nonempty].view('datetime64[ns]'),
+            'deleted': np.bincount(groups, weights=store.silinmis, minlength=len(normalized))[nonempty].astype(np.int64),
+        })
+        # Titles only present as unused categories are dropped; renumber the groups.
+        kept = np.flatnonzero(nonempty)
+        lookup = {normalized[group]: index for index, group in enumerate(kept)}
+        offsets = np.concatenate(([0], np.cumsum(counts[nonempty]))).astype(np.int64)
+        return cls(lookup, rows, offsets, stats)
+
+    def group(self, title: str) -> Optional[int]:
+        """Return the group of a title, matched in normalized form."""
+        return self.lookup.get(normalize_title(title))
+
+    def title_rows(self, title: str) -> np.ndarray:
+        """
+        Return the rows of every entry under a title.
+
+        Args:
+        title (str): The title, in any spelling variant.
+
+        Returns:
+        np.ndarray: Row ids in date order; empty if the title is unknown.
+        """
+        group = self.group(title)
+        if group is None:
+            return np.empty(0, dtype=np.int64)
+        return self.rows[self.offsets[group]:self.offsets[group + 1]]
+
+    def top(self, n: int = 20, by: str = 'entries') -> pd.DataFrame:
+        """
+        Rank the titles by an aggregate.
+
+        Args:
+        n (int): Number of titles.
+        by (str): One of `SORT_KEYS`.
+
+        Returns:
+        pd.DataFrame: The top rows of `stats`, ties broken by entry count.
+
+        Raises:
+        ValueError: If `by` is not a sort key.
+        """
+        if by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key: {by}")
+        return self.stats.sort_values([by, 'entries'], ascending=False, kind='stable').head(n)
+
+
+def get_title_index(store: EntryStore) -> TitleIndex:
+    """
+    Return the title index of a store, building it on first use.
+
+    Args:
+    store (EntryStore): The loaded entries.
+
+    Returns:
+    TitleIndex: The index cached alongside the store.
+    """
+    return store.memo('title_index', TitleIndex.from_store)
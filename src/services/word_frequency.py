@@ -0,0 +1,159 @@
+import re
+from collections import Counter
+from typing import List, Dict, Tuple, Optional, Callable
+import numpy as np
+from services.entry_store import EntryStore
+from services.instrumentation import stage_timer
+from services.stopwords import TURKISH_STOPWORDS
+from utils.turkish_text import turkish_casefold
+
+URL_RE = re.compile(r'https?://\S+|www\.\S+', re.IGNORECASE)
+# Runs of letters, optionally followed by an apostrophe suffix ("türkiye'nin").
+# A suffix after a number ("2023'te") is not a word of its own.
+TOKEN_RE = re.compile(r"(?<!['’])[^\W\d_]+(?:['’][^\W\d_]+)*")
+# Pass as `stopwords` to keep every word, e.g. for indexes where low IDF ranks stopwords down.
+NO_STOPWORDS: frozenset = frozenset()
+_BUILD_CHUNK_SIZE = 20000
+
+
+def tokenize(text: str, stopwords: frozenset = TURKISH_STOPWORDS) -> List[str]:
+    """
+    Split text into Turkish-casefolded word tokens.
+
+    URLs, digits and punctuation are dropped, apostrophe suffixes are cut off
+    ("türkiye'nin" becomes "türkiye"), and stopwords and single letters are
+    removed.
+
+    Args:
+    text (str): The text to tokenize.
+    stopwords (frozenset): Casefolded words to drop.
+
+    Returns:
+    List[str]: The tokens in order of appearance.
+    """
+    text = URL_RE.sub(' ', turkish_casefold(text))
+    tokens = []
+    for match in TOKEN_RE.finditer(text):
+        token = re.split(r"['’]", match.group(), maxsplit=1)[0]
+        if len(token) > 1 and token not in stopwords:
+            tokens.append(token)
+    return tokens
+
+
+class WordCounts:
+    """
+    Per-entry token counts for a dataset, stored as a sparse CSR matrix.
+
+    `token_ids[indptr[row]:indptr[row + 1]]` are the distinct tokens of a row
+    and `counts` their frequencies; `vocabulary[token_id]` is the word. The
+    corpus-wide totals are precomputed, and any row subset is summed with a
+    single vectorized `bincount` instead of re-tokenizing the text.
+    """
+
+    def __init__(self, vocabulary: np.ndarray, indptr: np.ndarray, token_ids: np.ndarray, counts: np.ndarray):
+        self.vocabulary = vocabulary
+        self.indptr = indptr
+        self.token_ids = token_ids
+        self.counts = counts
+        self.row_of_token = np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+        self.totals = np.bincount(token_ids, weights=counts, minlength=len(vocabulary)).astype(np.int64)
+
+    @classmethod
+    @stage_timer('word_counts')
+    def from_store(cls, store: EntryStore, on_progress: Optional[Callable[[float], None]] = None) -> 'WordCounts':
+        """
+        Tokenize every entry body of a store once.
+
+        Args:
+        store (EntryStore): The loaded entries.
+        on_progress (Optional[Callable[[float], None]]): Called with the share of rows done after each chunk.
+
+        Returns:
+        WordCounts: The token-count table.
+        """
+        vocabulary: Dict[str, int] = {}
+        lengths = np.zeros(len(store), dtype=np.int64)
+        token_chunks: List[np.ndarray] = []
+        count_chunks: List[np.ndarray] = []
+        for start in range(0, len(store), _BUILD_CHUNK_SIZE):
+            rows = np.arange(start, min(start + _BUILD_CHUNK_SIZE, len(store)))
+            chunk_tokens: List[int] = []
+            chunk_counts: List[int] = []
+            for row, text in zip(rows, store.entiri.take(rows).tolist()):
+                row_counts = Counter(tokenize(text))
+                lengths[row] = len(row_counts)
+                for token, count in row_counts.items():
+                    chunk_tokens.append(vocabulary.setdefault(token, len(vocabulary)))
+                    chunk_counts.append(count)
+            token_chunks.append(np.array(chunk_tokens, dtype=np.int32))
+            count_chunks.append(np.array(chunk_counts, dtype=np.int32))
+            if on_progress:
+                on_progress((rows[-1] + 1) / len(store))
+
+        indptr = np.zeros(len(store) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        words = np.empty(len(vocabulary), dtype=object)
+        words[list(vocabulary.values())] = list(vocabulary.keys())
+        empty = np.empty(0, dtype=np.int32)
+        return cls(
+            words,
+            indptr,
+            np.concatenate(token_chunks) if token_chunks else empty,
+            np.concatenate(count_chunks) if count_chunks else empty,
+        )
+
+    def totals_for(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Sum the token counts of a subset of rows.
+
+        Args:
+        rows (Optional[np.ndarray]): Row ids or a boolean row mask. Defaults to every row.
+
+        Returns:
+        np.ndarray: Count per vocabulary id.
+        """
+        if rows is None:
+            return self.totals
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            selected = rows
+        else:
+            selected = np.zeros(len(self.indptr) - 1, dtype=bool)
+            selected[rows] = True
+        picked = selected[self.row_of_token]
+        return np.bincount(self.token_ids[picked], weights=self.counts[picked],
+                           minlength=len(self.vocabulary)).astype(np.int64)
+
+    def top_words(self, rows: Optional[np.ndarray] = None, n: int = 20) -> List[Tuple[str, int]]:
+        """
+        Return the most frequent words of a subset of rows.
+
+        Args:
+        rows (Optional[np.ndarray]): Row ids or a boolean row mask. Defaults to every row.
+        n (int): Number of words to return.
+
+        Returns:
+        List[Tuple[str, int]]: (word, count) pairs, most frequent first.
+        """
+        totals = self.totals_for(rows)
+        n = min(n, int(np.count_nonzero(totals)))
+        if n <= 0:
+            return []
+        top = np.argpartition(totals, -n)[-n:]
+        # Ties are broken by vocabulary id, i.e. by first appearance.
+        top = top[np.lexsort((top, -totals[top]))]
+        return [(self.vocabulary[i], int(totals[i])) for i in top]
+
+
+def get_word_counts(store: EntryStore, on_progress: Optional[Callable[[float], None]] = None) -> WordCounts:
+    """
+    Return the token-count table of a store, building it on first use.
+
+    Args:
+    store (EntryStore): The loaded entries.
+    on_progress (Optional[Callable[[float], None]]): Progress callback used if the table is built by this call.
+
+    Returns:
+    WordCounts: The table cached alongside the store.
+    """
+    return store.memo('word_counts', lambda store: WordCounts.from_store(store, on_progress))
@@ -1,5 +1,9 @@
 from .data_validation import validate_csv_structure, clean_data, validate_and_clean_data
-from .file_handling import save_uploaded_file, remove_temp_file, get_file_size, is_file_empty
+from .file_handling import (
+    save_uploaded_file, remove_temp_file, get_file_size, is_file_empty,
+    hash_file_content, combine_content_hashes, get_temp_file_path, cleanup_temp_files
+)
+from .turkish_text import turkish_casefold, turkish_sort_key
 
 __all__ = [
     'validate_csv_structure',
@@ -8,5 +12,11 @@ __all__ = [
     'save_uploaded_file',
     'remove_temp_file',
     'get_file_size',
-    'is_file_empty'
+    'is_file_empty',
+    'hash_file_content',
+    'combine_content_hashes',
+    'get_temp_file_path',
+    'cleanup_temp_files',
+    'turkish_casefold',
+    'turkish_sort_key'
 ]
\ No newline at end of file
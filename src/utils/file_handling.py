@@ -1,38 +1,105 @@
 import os
+import glob
+import time
+import logging
+import hashlib
 import tempfile
-from typing import Union
-import streamlit as st
+from typing import List, Optional
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
-def save_uploaded_file(uploaded_file: UploadedFile) -> Union[str, None]:
+TEMP_FILE_PREFIX = 'asosyal-'
+logger = logging.getLogger(__name__)
+
+def hash_file_content(data: bytes) -> str:
+    """
+    Compute the content hash used to key uploads.
+    
+    Args:
+    data (bytes): The raw file content.
+    
+    Returns:
+    str: The SHA-256 hex digest of the content.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+def combine_content_hashes(content_hashes: List[str]) -> str:
+    """
+    Compute the key of a dataset merged from several uploads.
+    
+    The key does not depend on the upload order, and duplicate uploads count once.
+    
+    Args:
+    content_hashes (List[str]): Content hashes of the merged uploads.
+    
+    Returns:
+    str: The SHA-256 hex digest identifying the merged dataset.
+    """
+    return hashlib.sha256(('merge:' + ','.join(sorted(set(content_hashes)))).encode()).hexdigest()
+
+def get_temp_file_path(content_hash: str, directory: Optional[str] = None) -> str:
+    """
+    Get the content-addressed temporary path for an upload.
+    
+    Args:
+    content_hash (str): The content hash of the upload.
+    directory (Optional[str]): The directory to use. Defaults to the system temp directory.
+    
+    Returns:
+    str: The path of the temporary file.
+    """
+    return os.path.join(directory or tempfile.gettempdir(), f"{TEMP_FILE_PREFIX}{content_hash}.csv")
+
+def save_uploaded_file(uploaded_file: UploadedFile, content_hash: Optional[str] = None,
+                       directory: Optional[str] = None) -> str:
     """
     Save the uploaded file to a temporary directory.
     
+    The file is stored under a path derived from its content hash, so saving
+    the same upload again reuses the existing file instead of creating a new one.
+    This runs on the ingest worker thread, so errors are raised for the job
+    to report rather than shown here.
+    
     Args:
     uploaded_file (st.UploadedFile): The uploaded file object from Streamlit.
+    content_hash (Optional[str]): The content hash, if already computed.
+    directory (Optional[str]): The directory to use. Defaults to the system temp directory.
     
     Returns:
-    Union[str, None]: The path to the saved file, or None if an error occurred.
+    str: The path to the saved file.
+    
+    Raises:
+    OSError: If the file cannot be written.
     """
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            return tmp_file.name
-    except Exception as e:
-        st.error(f"Error saving file: {e}")
-        return None
+    data = uploaded_file.getvalue()
+    file_path = get_temp_file_path(content_hash or hash_file_content(data), directory)
+    if os.path.exists(file_path) and get_file_size(file_path) == len(data):
+        os.utime(file_path)
+        return file_path
+    # Write next to the target and rename, so concurrent sessions never see a partial file.
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.part', dir=os.path.dirname(file_path)) as tmp_file:
+        try:
+            tmp_file.write(data)
+        except BaseException:
+            tmp_file.close()
+            os.remove(tmp_file.name)
+            raise
+    os.replace(tmp_file.name, file_path)
+    return file_path
 
 def remove_temp_file(file_path: str) -> None:
     """
-    Remove a temporary file.
+    Remove a temporary file; a file already removed (e.g. by another session) is ignored.
     
     Args:
     file_path (str): The path to the file to be removed.
+    
+    Raises:
+    OSError: If the file exists but cannot be removed.
     """
     try:
         os.remove(file_path)
-    except Exception as e:
-        st.warning(f"Error removing temporary file: {e}")
+    except FileNotFoundError:
+        pass
 
 def get_file_size(file_path: str) -> int:
     """
@@ -57,3 +124,34 @@ def is_file_empty(file_path: str) -> bool:
     bool: True if the file is empty, False otherwise.
     """
     return get_file_size(file_path) == 0
+
+def cleanup_temp_files(max_age_seconds: float = 3600, directory: Optional[str] = None) -> int:
+    """
+    Remove upload temp files that have not been used for a while.
+    
+    Args:
+    max_age_seconds (float): Files last touched longer ago than this are removed.
+    directory (Optional[str]): The directory to clean. Defaults to the system temp directory.
+    
+    Returns:
+    int: The number of bytes freed.
+    """
+    pattern = os.path.join(directory or tempfile.gettempdir(), f"{TEMP_FILE_PREFIX}*.csv")
+    cutoff = time.time() - max_age_seconds
+    freed = 0
+    for file_path in glob.glob(pattern):
+        try:
+            if os.path.getmtime(file_path) >= cutoff:
+                continue
+            size = get_file_size(file_path)
+        except OSError:
+            # Another session removed it in the meantime
+            continue
+        try:
+            remove_temp_file(file_path)
+        except OSError as e:
+            # A best-effort sweep; the next one tries again.
+            logger.warning(f"Could not remove stale temp file {file_path}: {e}")
+            continue
+        freed += size
+    return freed
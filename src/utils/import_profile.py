@@ -0,0 +1,138 @@
+"""
+Startup-time report based on `python -X importtime`.
+
+Usage:
+python -m utils.import_profile app
+python -m utils.import_profile app --json --budget-ms 1500 --forbid plotly.express
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from typing import List, Dict, Any, Optional
+
+_LINE_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_imports(module: str, python: str = sys.executable, cwd: str = SRC_DIR) -> List[Dict[str, Any]]:
+    """
+    Import a module in a fresh interpreter and record the import timings.
+
+    Args:
+    module (str): The module to import, e.g. 'app'.
+    python (str): The interpreter to use.
+    cwd (str): Working directory, which is also put on the import path.
+
+    Returns:
+    List[Dict[str, Any]]: One record per imported module with `module`,
+    `self_us`, `cumulative_us` and `depth`, in import order.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [cwd, os.environ.get('PYTHONPATH')])))
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=cwd, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+
+    records = []
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            records.append({
+                'module': name,
+                'self_us': int(self_us),
+                'cumulative_us': int(cumulative_us),
+                'depth': len(indent) // 2,
+            })
+    return records
+
+
+def import_time_report(module: str, top: int = 15) -> Dict[str, Any]:
+    """
+    Summarize the import cost of a module.
+
+    Args:
+    module (str): The module to import, e.g. 'app'.
+    top (int): Number of top-level packages and modules to list.
+
+    Returns:
+    Dict[str, Any]: Total time, self time per top-level package, the most
+    expensive modules by cumulative time, and the set of imported modules.
+    """
+    records = measure_imports(module)
+    packages: Dict[str, int] = {}
+    for record in records:
+        package = record['module'].split('.')[0]
+        packages[package] = packages.get(package, 0) + record['self_us']
+
+    target = next((record for record in records if record['module'] == module), None)
+    return {
+        'module': module,
+        'total_ms': round((target['cumulative_us'] if target else sum(packages.values())) / 1000, 1),
+        'packages_ms': {
+            name: round(us / 1000, 1)
+            for name, us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+        },
+        'slowest_modules_ms': {
+            record['module']: round(record['cumulative_us'] / 1000, 1)
+            for record in sorted(records, key=lambda record: -record['cumulative_us'])[:top]
+        },
+        'imported': sorted({record['module'] for record in records}),
+    }
+
+
+def check_report(report: Dict[str, Any], budget_ms: Optional[float] = None, forbid: Optional[List[str]] = None) -> List[str]:
+    """
+    Compare a report with a startup budget.
+
+    Args:
+    report (Dict[str, Any]): Output of `import_time_report`.
+    budget_ms (Optional[float]): Maximum total import time.
+    forbid (Optional[List[str]]): Modules (and their submodules) that must not be imported at startup.
+
+    Returns:
+    List[str]: Human-readable violations; empty if the budget is met.
+    """
+    problems = []
+    if budget_ms is not None and report['total_ms'] > budget_ms:
+        problems.append(f"import of {report['module']} took {report['total_ms']} ms (budget {budget_ms} ms)")
+    for forbidden in forbid or []:
+        if any(name == forbidden or name.startswith(forbidden + '.') for name in report['imported']):
+            problems.append(f"{forbidden} is imported at startup")
+    return problems
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report the import-time breakdown of a module.")
+    parser.add_argument('module', nargs='?', default='app')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--budget-ms', type=float, help="fail if the total import time exceeds this")
+    parser.add_argument('--forbid', action='append', default=[], help="fail if this module is imported")
+    args = parser.parse_args(argv)
+
+    report = import_time_report(args.module, args.top)
+    if args.json:
+        print(json.dumps({key: value for key, value in report.items() if key != 'imported'}, indent=2))
+    else:
+        print(f"import {report['module']}: {report['total_ms']} ms")
+        print("\nSelf time by package:")
+        for name, ms in report['packages_ms'].items():
+            print(f"  {ms:8.1f} ms  {name}")
+        print("\nSlowest modules (cumulative):")
+        for name, ms in report['slowest_modules_ms'].items():
+            print(f"  {ms:8.1f} ms  {name}")
+
+    problems = check_report(report, args.budget_ms, args.forbid)
+    for problem in problems:
+        print(f"FAIL: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
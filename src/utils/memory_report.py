@@ -0,0 +1,103 @@
+"""
+Memory-footprint report of an archive in its different in-memory forms.
+
+Compares the former representation (a list of entry dictionaries plus the
+`prepare_data` DataFrame of Python strings) with the columnar EntryStore,
+with and without compressed bodies.
+
+Usage:
+python -m utils.memory_report asosyal-yedeklerim.csv
+python -m utils.memory_report asosyal-yedeklerim.csv --json --block-size 512
+"""
+import sys
+import json
+import argparse
+from typing import Any, Dict, List, Optional
+from services.entry_store import read_entry_store_chunked
+from services.text_store import DEFAULT_BLOCK_SIZE
+
+
+def records_nbytes(records: List[Dict[str, Any]]) -> int:
+    """
+    Estimate the bytes held by a list of entry dictionaries.
+
+    Counts the list, every dictionary and every value object; keys are
+    interned and shared, and booleans are singletons.
+
+    Args:
+    records (List[Dict[str, Any]]): The entries.
+
+    Returns:
+    int: Approximate size in bytes.
+    """
+    total = sys.getsizeof(records)
+    for record in records:
+        total += sys.getsizeof(record)
+        total += sum(sys.getsizeof(value) for value in record.values() if not isinstance(value, bool))
+    return total
+
+
+def memory_report(file_path: str, block_size: int = DEFAULT_BLOCK_SIZE, legacy: bool = True) -> Dict[str, Any]:
+    """
+    Load an archive in each representation and measure it.
+
+    Args:
+    file_path (str): Path of a CSV export.
+    block_size (int): Entries per compressed block.
+    legacy (bool): Whether to measure the former records + DataFrame form,
+    which needs several times the archive size in memory.
+
+    Returns:
+    Dict[str, Any]: `entries`, and per representation its total bytes,
+    bytes per entry and (for the stores) bytes per column.
+    """
+    store = read_entry_store_chunked(file_path)
+    compact = store.compress_text(block_size)
+    representations: Dict[str, Dict[str, Any]] = {}
+
+    if legacy:
+        # Imported here: the former path pulls in the plotting component.
+        from services.csv_to_json import csv_to_json
+        from components.visualization_component import prepare_data
+        with open(file_path, 'r', encoding='utf-8') as f:
+            records = csv_to_json(f.read())
+        frame = prepare_data(records)
+        representations['records + DataFrame'] = {
+            'bytes': records_nbytes(records) + int(frame.memory_usage(deep=True).sum()),
+        }
+        del records, frame
+
+    for name, variant in (('EntryStore', store), (f'EntryStore, compressed bodies ({block_size}/block)', compact)):
+        columns = variant.memory_usage()
+        representations[name] = {'bytes': sum(columns.values()), 'columns': columns}
+
+    for representation in representations.values():
+        representation['bytes_per_entry'] = round(representation['bytes'] / max(len(store), 1), 1)
+    return {'entries': len(store), 'representations': representations}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the memory footprint of an archive's representations.")
+    parser.add_argument('file_path')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument('--skip-legacy', action='store_true', help="do not build the former records + DataFrame form")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = memory_report(args.file_path, args.block_size, legacy=not args.skip_legacy)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{report['entries']:,} entries")
+    baseline = next(iter(report['representations'].values()))['bytes']
+    for name, representation in report['representations'].items():
+        print(f"\n{name}: {representation['bytes'] / 2 ** 20:.1f} MiB, "
+              f"{representation['bytes_per_entry']} B/entry ({representation['bytes'] / baseline:.0%})")
+        for column, nbytes in representation.get('columns', {}).items():
+            print(f"  {nbytes / 2 ** 20:8.1f} MiB  {column}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
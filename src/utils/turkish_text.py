@@ -0,0 +1,45 @@
+import unicodedata
+
+# str.lower() maps 'I' to 'i' and 'İ' to 'i' plus a combining dot, which is
+# wrong for Turkish. Map the dotted/dotless capitals first.
+_TURKISH_UPPER = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+def turkish_casefold(text: str) -> str:
+    """
+    Normalize text for case-insensitive Turkish matching.
+
+    The text is NFC-normalized so that decomposed characters compare equal to
+    their precomposed forms, then lowercased with Turkish İ/ı rules.
+
+    Args:
+    text (str): The text to normalize.
+
+    Returns:
+    str: The normalized text.
+    """
+    if text is None:
+        return ""
+    return unicodedata.normalize('NFC', str(text)).translate(_TURKISH_UPPER).lower()
+
+# Turkish alphabetical order, with q, w and x (used in loanwords) at their
+# Latin positions. Each letter is mapped to a private-use character in this
+# order, which sorts after digits and punctuation.
+TURKISH_ALPHABET = 'abcçdefgğhıijklmnoöpqrsştuüvwxyz'
+_COLLATION = str.maketrans({letter: chr(0xE000 + i) for i, letter in enumerate(TURKISH_ALPHABET)})
+# Circumflexed vowels sort with their plain forms.
+_CIRCUMFLEX = str.maketrans({'â': 'a', 'î': 'i', 'û': 'u'})
+
+def turkish_sort_key(text: str) -> str:
+    """
+    Return a key that sorts strings in Turkish alphabetical order.
+
+    Comparison is case-insensitive, and ç, ğ, ı, ö, ş and ü sort right after
+    c, g, h, o, s and u instead of after z.
+
+    Args:
+    text (str): The text to collate.
+
+    Returns:
+    str: The collation key.
+    """
+    return turkish_casefold(text).translate(_CIRCUMFLEX).translate(_COLLATION)
@@ -0,0 +1,33 @@
+import os
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+from generate_archive import generate_archive, parse_size
+from run_benchmarks import compare
+from services.entry_store import read_entry_store_chunked
+
+class TestBenchmarks(unittest.TestCase):
+    def test_generated_archive_loads(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'archive.csv')
+            generate_archive(path, 2000, seed=1, chunk_size=700)
+            store = read_entry_store_chunked(path, 'bench')
+        self.assertEqual(len(store), 2000)
+        self.assertTrue(0 < store.silinmis.sum() < 400)
+        self.assertTrue(any('\n' in text for text in store.entiri[:200].tolist()))
+
+    def test_parse_size(self):
+        self.assertEqual(parse_size('10k'), 10_000)
+        self.assertEqual(parse_size('5M'), 5_000_000)
+        self.assertEqual(parse_size('1234'), 1234)
+
+    def test_compare_flags_regressions(self):
+        baseline = {'1000': {'ingest_csv': 0.1, 'filter_cold': 0.001}}
+        results = {'1000': {'ingest_csv': 0.2, 'filter_cold': 0.003, 'new': 1.0}}
+        regressions = compare(results, baseline, threshold=1.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('ingest_csv', regressions[0])
+
+if __name__ == '__main__':
+    unittest.main()
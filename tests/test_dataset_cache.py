@@ -0,0 +1,36 @@
+import unittest
+import pandas as pd
+from services.entry_store import EntryStore
+from services.dataset_cache import DatasetCache
+
+class TestDatasetCache(unittest.TestCase):
+    def setUp(self):
+        self.store = EntryStore.from_frame(pd.DataFrame([
+            {"skor": 1, "baslik": "a", "entiri": "b", "silinmis": False, "tarih": "2023-01-01T00:00:00.000Z"}
+        ]))
+
+    def test_get_or_load_loads_once(self):
+        cache = DatasetCache()
+        calls = []
+        loader = lambda: calls.append(1) or self.store
+        self.assertIs(cache.get_or_load("abc", loader), self.store)
+        self.assertIs(cache.get_or_load("abc", loader), self.store)
+        self.assertEqual(len(calls), 1)
+
+    def test_failed_load_is_not_cached(self):
+        cache = DatasetCache()
+        self.assertIsNone(cache.get_or_load("abc", lambda: None))
+        self.assertNotIn("abc", cache)
+
+    def test_lru_eviction(self):
+        cache = DatasetCache(max_entries=2)
+        cache.put("a", self.store)
+        cache.put("b", self.store)
+        cache.get("a")
+        cache.put("c", self.store)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch
 import json
-from components.display_component import render_entry, sort_entries, filter_entries
+from components.display_component import render_entry, sort_entries, filter_entries, render_entries_html
 
 class TestDisplayComponent(unittest.TestCase):
     def setUp(self):
@@ -35,6 +35,22 @@ class TestDisplayComponent(unittest.TestCase):
         sorted_entries = sort_entries(self.sample_entries, 'baslik', True)
         self.assertEqual(sorted_entries[0]['baslik'], "Another Test")
         self.assertEqual(sorted_entries[1]['baslik'], "Test Başlık")
+
+        sorted_entries = sort_entries(self.sample_entries, 'tarih', False)
+        self.assertEqual(sorted_entries[0]['tarih'], "2023-01-02 13:00:00")
+
+    def test_sort_entries_utc_suffix(self):
+        # The format of the archives and of EntryStore.records().
+        entries = [{"tarih": tarih} for tarih in
+                   ["2023-01-02T13:00:00.000Z", "2022-12-31T23:59:59.999Z", "2023-01-02 14:00:00", "2023-01-02T12:00:00+03:00"]]
+        dates = [entry["tarih"] for entry in sort_entries(entries, 'tarih', True)]
+        self.assertEqual(dates, ["2022-12-31T23:59:59.999Z", "2023-01-02T12:00:00+03:00",
+                                 "2023-01-02T13:00:00.000Z", "2023-01-02 14:00:00"])
+
+    def test_sort_entries_turkish_collation(self):
+        entries = [{"baslik": title} for title in ["zeytin", "Çay", "cam", "ılık", "İnce", "şeker", "sabah"]]
+        titles = [entry["baslik"] for entry in sort_entries(entries, 'baslik', True)]
+        self.assertEqual(titles, ["cam", "Çay", "ılık", "İnce", "sabah", "şeker", "zeytin"])
     
     def test_filter_entries(self):
         filtered = filter_entries(self.sample_entries, "Test", True)
@@ -46,5 +62,19 @@ class TestDisplayComponent(unittest.TestCase):
         filtered = filter_entries(self.sample_entries, "Another", True)
         self.assertEqual(len(filtered), 1)
 
+    def test_render_entries_html(self):
+        entry = dict(self.sample_entries[1], entiri="<script>x</script>\n**bold**")
+        page = render_entries_html([self.sample_entries[0], entry])
+        self.assertEqual(page.count('<hr>'), 2)
+        self.assertIn("&lt;script&gt;x&lt;/script&gt;<br>**bold**", page)
+        self.assertNotIn("\n", page)
+        self.assertEqual(page.count("(Deleted)"), 1)
+
+    def test_render_entries_html_highlights_terms(self):
+        entry = dict(self.sample_entries[0], entiri="<b>içerik</b> burada")
+        page = render_entries_html([entry], ["içerik"])
+        self.assertIn("<h3>Test Başlık</h3>", page)
+        self.assertIn("&lt;b&gt;<mark>içerik</mark>&lt;/b&gt; burada", page)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+from utils.downsampling import lttb
+from components.visualization_component import trend_chart
+
+class TestDownsampling(unittest.TestCase):
+    def test_lttb_keeps_endpoints_and_peaks(self):
+        x = np.arange(10000)
+        y = np.sin(x / 300.0)
+        y[4321] = 50
+        y[7777] = -50
+        keep = lttb(x, y, 500)
+        self.assertEqual(len(keep), 500)
+        self.assertEqual((keep[0], keep[-1]), (0, 9999))
+        self.assertTrue(np.all(np.diff(keep) > 0))
+        self.assertIn(4321, keep)
+        self.assertIn(7777, keep)
+
+    def test_lttb_short_series(self):
+        self.assertEqual(lttb(np.arange(5), np.arange(5), 10).tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(lttb(np.arange(5), np.arange(5), 3).tolist()[::2], [0, 4])
+
+    def test_trend_chart_payload_is_bounded(self):
+        keys = np.arange('2017-01-01T00', '2024-01-01T00', dtype='datetime64[h]').astype('datetime64[ns]')
+        counts = np.random.default_rng(0).poisson(2, len(keys))
+        fig = trend_chart(keys, counts, 'Saatlik', max_points=1500, webgl_threshold=1000)
+        self.assertEqual(len(fig.data[0].x), 1500)
+        self.assertEqual(type(fig.data[0]).__name__, 'Scattergl')
+        small = trend_chart(keys[:100], counts[:100], 'Saatlik')
+        self.assertEqual(type(small.data[0]).__name__, 'Scatter')
+        self.assertEqual(len(small.data[0].x), 100)
+
+if __name__ == '__main__':
+    unittest.main()
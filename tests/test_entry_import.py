@@ -0,0 +1,75 @@
+import io
+import os
+import sys
+import unittest
+import pandas as pd
+from sqlalchemy import inspect
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import create_app, db
+sys.path.pop(0)
+from app.models import Entry
+from app.services.entry_import import import_entries
+
+def export_csv(rows):
+    return pd.DataFrame(rows, columns=['skor', 'baslik', 'entiri', 'silinmis', 'tarih']).to_csv(index=False).encode('utf-8')
+
+class TestEntryImport(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+        self.context = self.app.app_context()
+        self.context.push()
+        self.rows = [
+            (i - 10, f"başlık {i % 3}", f"girdi {i}", i % 4 == 0, f"2023-01-{i % 28 + 1:02d}T12:00:00.000Z")
+            for i in range(25)
+        ]
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def index_names(self):
+        return {index['name'] for index in inspect(db.engine).get_indexes('entry')}
+
+    def test_import_route(self):
+        rows = self.rows + [(7, "bozuk", "tarihsiz", False, "dün")]
+        response = self.app.test_client().post('/entries/import', data={'file': (io.BytesIO(export_csv(rows)), 'yedek.csv')})
+        self.assertEqual(response.status_code, 201)
+        # The row whose date cannot be parsed is dropped.
+        self.assertEqual(response.get_json(), {'imported': len(self.rows)})
+        entries = Entry.query.order_by(Entry.id).all()
+        self.assertEqual(len(entries), len(self.rows))
+        for entry, (skor, baslik, entiri, silinmis, tarih) in zip(entries, self.rows):
+            self.assertEqual((entry.title, entry.content, entry.deleted), (baslik, entiri, silinmis))
+            self.assertEqual((entry.upvotes, entry.downvotes), (max(skor, 0), max(-skor, 0)))
+            self.assertEqual(entry.created_at.isoformat() + '.000Z', tarih)
+
+    def test_import_route_rejects_bad_uploads(self):
+        client = self.app.test_client()
+        self.assertEqual(client.post('/entries/import').status_code, 400)
+        response = client.post('/entries/import', data={'file': (io.BytesIO(b'a,b\n1,2\n'), 'yedek.csv')})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Entry.query.count(), 0)
+
+    def test_indexes_stay_in_place_by_default(self):
+        expected = self.index_names()
+        seen = []
+        import_entries(io.BytesIO(export_csv(self.rows)), batch_size=10, on_batch=lambda total: seen.append(self.index_names()))
+        self.assertEqual(seen, [expected] * 3)
+
+    def test_rebuild_indexes_for_offline_loads(self):
+        expected = self.index_names()
+        seen = []
+        import_entries(io.BytesIO(export_csv(self.rows)), batch_size=10, on_batch=lambda total: seen.append(self.index_names()),
+                       rebuild_indexes=True)
+        self.assertEqual(seen[0], set())
+        self.assertEqual(self.index_names(), expected)
+        # A table that already holds entries keeps its indexes.
+        seen.clear()
+        import_entries(io.BytesIO(export_csv(self.rows)), batch_size=10, on_batch=lambda total: seen.append(self.index_names()),
+                       rebuild_indexes=True)
+        self.assertEqual(seen, [expected] * 3)
+        self.assertEqual(Entry.query.count(), 50)
+
+if __name__ == '__main__':
+    unittest.main()
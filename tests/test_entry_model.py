@@ -0,0 +1,62 @@
+import io
+import os
+import sys
+import unittest
+from datetime import datetime
+import pandas as pd
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import create_app, db
+sys.path.pop(0)
+from app.models import Entry
+from app.models.entry import HOT_EPOCH, HOT_DECAY_SECONDS, hot_score
+from app.services.entry_import import import_entries
+
+class TestEntryModel(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+        self.context = self.app.app_context()
+        self.context.push()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def test_hot_score(self):
+        self.assertEqual(hot_score(0, 0), 0)
+        self.assertAlmostEqual(hot_score(100, HOT_DECAY_SECONDS), 3.0)
+        self.assertAlmostEqual(hot_score(-10, 0), -1.0)
+        # A tenfold score is worth HOT_DECAY_SECONDS of recency.
+        self.assertAlmostEqual(hot_score(10, 0), hot_score(1, HOT_DECAY_SECONDS))
+
+    def test_score_and_hot_follow_the_votes(self):
+        entry = Entry(content="girdi", upvotes=12, downvotes=2, created_at=datetime(2023, 1, 1))
+        db.session.add(entry)
+        db.session.commit()
+        seconds = (datetime(2023, 1, 1) - HOT_EPOCH).total_seconds()
+        self.assertEqual(entry.score, 10)
+        self.assertAlmostEqual(entry.hot, hot_score(10, seconds))
+
+        entry.downvotes = 112
+        db.session.commit()
+        db.session.expire_all()
+        entry = db.session.get(Entry, entry.id)
+        self.assertEqual(entry.score, -100)
+        self.assertAlmostEqual(entry.hot, hot_score(-100, seconds))
+
+    def test_imported_rows_get_score_and_hot(self):
+        csv = pd.DataFrame({
+            'skor': [5, -3, 0],
+            'baslik': ['a', 'b', 'c'],
+            'entiri': ['x', 'y', 'z'],
+            'silinmis': [False, False, True],
+            'tarih': ['2023-01-01T00:00:00.000Z', '2023-06-01T12:30:00.000Z', '2017-01-01T00:00:00.000Z'],
+        }).to_csv(index=False).encode('utf-8')
+        self.assertEqual(import_entries(io.BytesIO(csv)), 3)
+        entries = Entry.query.order_by(Entry.id).all()
+        self.assertEqual([entry.score for entry in entries], [5, -3, 0])
+        for entry in entries:
+            self.assertAlmostEqual(entry.hot, entry.compute_hot())
+
+if __name__ == '__main__':
+    unittest.main()
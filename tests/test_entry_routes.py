@@ -0,0 +1,89 @@
+import os
+import sys
+import random
+import unittest
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app import create_app, db
+sys.path.pop(0)
+from app.models import Entry
+from app.routes.entry_routes import SORT_COLUMNS, MAX_LIMIT
+
+class TestEntryRoutes(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+        self.client = self.app.test_client()
+        rng = random.Random(0)
+        with self.app.app_context():
+            # Few distinct vote counts, so pages split runs of ties.
+            db.session.add_all([
+                Entry(content=f"girdi {i}", upvotes=rng.randint(0, 5), downvotes=rng.randint(0, 5),
+                      created_at=datetime(2023, 1, 1) + timedelta(hours=rng.randint(0, 500)))
+                for i in range(137)
+            ])
+            db.session.commit()
+            self.entries = [entry.to_dict() for entry in Entry.query.all()]
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def walk(self, sort_by, limit):
+        entries, cursor, pages = [], None, 0
+        while True:
+            params = {'sort_by': sort_by, 'limit': limit}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get('/entries/sort', query_string=params)
+            self.assertEqual(response.status_code, 200)
+            page = response.get_json()
+            self.assertLessEqual(len(page['entries']), limit)
+            entries.extend(page['entries'])
+            pages += 1
+            cursor = page['next_cursor']
+            if cursor is None:
+                return entries, pages
+
+    def test_pages_cover_every_sort_mode_in_order(self):
+        for sort_by, column in SORT_COLUMNS.items():
+            expected = sorted(self.entries, key=lambda entry: (entry[column], entry['id']), reverse=True)
+            for limit in [1, 10, 50, MAX_LIMIT]:
+                with self.subTest(sort_by=sort_by, limit=limit):
+                    entries, pages = self.walk(sort_by, limit)
+                    ids = [entry['id'] for entry in entries]
+                    self.assertEqual(len(ids), len(set(ids)))
+                    self.assertEqual(ids, [entry['id'] for entry in expected])
+                    self.assertEqual(pages, -(-len(expected) // limit))
+
+    def test_default_sort_and_empty_table(self):
+        page = self.client.get('/entries/sort', query_string={'limit': 5}).get_json()
+        self.assertEqual([entry['upvotes'] for entry in page['entries']],
+                         sorted((entry['upvotes'] for entry in self.entries), reverse=True)[:5])
+        with self.app.app_context():
+            Entry.query.delete()
+            db.session.commit()
+        self.assertEqual(self.client.get('/entries/sort').get_json(), {'entries': [], 'next_cursor': None})
+
+    def test_invalid_parameters(self):
+        for params in [
+            {'sort_by': 'newest'},
+            {'limit': 0},
+            {'limit': MAX_LIMIT + 1},
+            {'limit': 'abc'},
+            {'limit': ''},
+            {'cursor': 'abc'},
+            {'cursor': '3'},
+            {'cursor': '3:x'},
+            {'sort_by': 'best', 'cursor': '1.5:2'},
+            {'sort_by': 'hot', 'cursor': 'sıcak:2'},
+            {'sort_by': 'hot', 'cursor': 'nan:2'},
+            {'sort_by': 'hot', 'cursor': 'inf:2'},
+        ]:
+            with self.subTest(params=params):
+                response = self.client.get('/entries/sort', query_string=params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', response.get_json())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore, entry_ids, read_entry_store, read_entry_store_chunked
+from services.text_store import CompressedText
+
+class TestEntryStore(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame([
+            {
+                "skor": 10,
+                "baslik": "Test Başlık",
+                "entiri": "Test İçerik",
+                "silinmis": False,
+                "tarih": "2023-01-01T12:00:00.000Z"
+            },
+            {
+                "skor": 5,
+                "baslik": "Another Test",
+                "entiri": "More Content",
+                "silinmis": True,
+                "tarih": "2023-01-02T13:00:00.500Z"
+            },
+            {
+                "skor": 1,
+                "baslik": "Broken",
+                "entiri": "No date",
+                "silinmis": False,
+                "tarih": "not a date"
+            }
+        ])
+        self.store = EntryStore.from_frame(self.df)
+
+    def test_column_types(self):
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.store.skor.dtype, np.int64)
+        self.assertEqual(self.store.silinmis.dtype, bool)
+        self.assertEqual(self.store.tarih.dtype, np.int64)
+        self.assertIsInstance(self.store.baslik, pd.Categorical)
+        self.assertEqual(self.store.tarih[0], pd.Timestamp("2023-01-01T12:00:00Z").value)
+
+    def test_records(self):
+        records = self.store.records(np.array([1]))
+        self.assertEqual(records, [{
+            "skor": 5,
+            "baslik": "Another Test",
+            "entiri": "More Content",
+            "silinmis": True,
+            "tarih": "2023-01-02T13:00:00.500Z"
+        }])
+
+    def test_frame_rows(self):
+        df = self.store.frame(np.array([1, 0]))
+        self.assertEqual(df['skor'].tolist(), [5, 10])
+        self.assertEqual(str(df['tarih'].dtype), 'datetime64[ns]')
+
+    def test_rows_between(self):
+        start, end = self.store.date_bounds()
+        self.assertEqual(start, pd.Timestamp("2023-01-01 12:00:00"))
+        self.assertEqual(end, pd.Timestamp("2023-01-02 13:00:00.500"))
+        self.assertEqual(self.store.rows_between(start, end).tolist(), [0, 1])
+        self.assertEqual(self.store.rows_between(pd.Timestamp("2023-01-02", tz="UTC"), end).tolist(), [1])
+        self.assertEqual(self.store.rows_between(pd.Timestamp("2024-01-01"), pd.Timestamp("2025-01-01")).tolist(), [])
+
+    def test_memo(self):
+        calls = []
+        build = lambda store: calls.append(store) or len(calls)
+        self.assertEqual(self.store.memo('x', build), 1)
+        self.assertEqual(self.store.memo('x', build), 1)
+        self.assertEqual(len(calls), 1)
+
+    def test_entry_ids(self):
+        self.assertEqual(self.store.entry_id.dtype, np.uint64)
+        # Same content, different row order and column representation.
+        reordered = EntryStore.from_frame(self.df.iloc[[1, 0]].astype({'baslik': object}))
+        np.testing.assert_array_equal(reordered.entry_id, self.store.entry_id[[1, 0]])
+        compressed = CompressedText.from_arrow(self.store.entiri)
+        np.testing.assert_array_equal(entry_ids(self.store.baslik, self.store.tarih, compressed), self.store.entry_id)
+        np.testing.assert_array_equal(entry_ids(self.store.baslik, self.store.tarih, np.array(self.store.entiri.tolist(), dtype=object)),
+                                      self.store.entry_id)
+        # Entries sharing a timestamp still get distinct ids.
+        twins = EntryStore.from_frame(self.df.assign(tarih="2023-01-01T12:00:00.000Z"))
+        self.assertNotEqual(twins.entry_id[0], twins.entry_id[1])
+
+    def test_merge(self):
+        other = EntryStore.from_frame(pd.DataFrame([
+            dict(self.df.iloc[1]),
+            {"skor": 3, "baslik": "New", "entiri": "Only here", "silinmis": False, "tarih": "2023-01-03T00:00:00.000Z"}
+        ]))
+        merged = EntryStore.merge([self.store, other], fingerprint="both")
+        self.assertEqual(len(merged), 3)
+        self.assertEqual(merged.fingerprint, "both")
+        self.assertEqual(list(merged.baslik), ["Test Başlık", "Another Test", "New"])
+        self.assertEqual(len(set(merged.entry_id.tolist())), 3)
+        self.assertEqual(merged.rows_between(pd.Timestamp("2023-01-02"), pd.Timestamp("2023-01-04")).tolist(), [1, 2])
+
+class TestChunkedIngest(unittest.TestCase):
+    def setUp(self):
+        rows = ['"skor","baslik","entiri","silinmis","tarih"']
+        for i in range(25):
+            rows.append(f'{i},"başlık {i % 4}","satır bir\nsatır, iki {i}",{"true" if i % 5 == 0 else "false"},"2023-01-{i + 1:02d}T10:00:00.000Z"')
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write('\n'.join(rows))
+            self.file_path = f.name
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def test_chunked_matches_full_read(self):
+        reports = []
+        chunked = read_entry_store_chunked(self.file_path, chunksize=7,
+                                           on_progress=lambda progress: reports.append(progress.entries))
+        full = read_entry_store(self.file_path)
+        self.assertEqual(reports, [7, 14, 21, 25])
+        self.assertEqual(chunked.entiri.tolist(), full.entiri.tolist())
+        self.assertEqual(chunked.entiri[3], "satır bir\nsatır, iki 3")
+        self.assertEqual(list(chunked.baslik), list(full.baslik))
+        np.testing.assert_array_equal(chunked.tarih, full.tarih)
+        np.testing.assert_array_equal(chunked.silinmis, full.silinmis)
+
+    def test_progress_stats(self):
+        reports = []
+        read_entry_store_chunked(self.file_path, chunksize=10, on_progress=reports.append)
+        progress = reports[-1]
+        self.assertEqual(progress.karma, sum(range(25)))
+        self.assertEqual(progress.min_tarih, pd.Timestamp("2023-01-01 10:00"))
+        self.assertEqual(progress.max_tarih, pd.Timestamp("2023-01-25 10:00"))
+        self.assertEqual(progress.fraction, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import io
+import csv
+import json
+import unittest
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.export import iter_export, write_export, export_to_buffer, iter_json_array
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.store = EntryStore.from_frame(pd.DataFrame([
+            {"skor": 10, "baslik": "Test Başlık", "entiri": "Çok satırlı\n\"İçerik\"", "silinmis": False,
+             "tarih": "2023-01-01T12:00:00.000Z"},
+            {"skor": 5, "baslik": "Another Test", "entiri": "More Content", "silinmis": True,
+             "tarih": "2023-01-02T13:00:00.000Z"}
+        ]))
+        self.records = self.store.records(self.store.all_rows())
+
+    def test_ndjson_in_batches(self):
+        chunks = list(iter_export(self.store, fmt='ndjson', batch_size=1))
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual([json.loads(line) for line in ''.join(chunks).splitlines()], self.records)
+
+    def test_json_filtered_rows(self):
+        text = ''.join(iter_export(self.store, np.array([1]), fmt='json'))
+        self.assertEqual(json.loads(text), self.records[1:])
+        self.assertEqual(''.join(iter_export(self.store, np.array([], dtype=np.int64), fmt='json')), '[]')
+
+    def test_indented_json_matches_dumps(self):
+        text = ''.join(iter_json_array([self.records[:1], self.records[1:]], indent=2))
+        self.assertEqual(text, json.dumps(self.records, ensure_ascii=False, indent=2))
+
+    def test_csv(self):
+        buffer = io.StringIO()
+        write_export(iter_export(self.store, fmt='csv', batch_size=1), buffer)
+        rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]['entiri'], self.records[0]['entiri'])
+
+    def test_short_writes(self):
+        class ShortWriter(io.RawIOBase):
+            def __init__(self):
+                self.data = bytearray()
+
+            def writable(self):
+                return True
+
+            def write(self, data):
+                self.data += bytes(data[:3])
+                return min(len(data), 3)
+
+        fileobj = ShortWriter()
+        written = write_export(iter_export(self.store, fmt='ndjson'), fileobj)
+        expected = ''.join(iter_export(self.store, fmt='ndjson')).encode('utf-8')
+        self.assertEqual(bytes(fileobj.data), expected)
+        self.assertEqual(written, len(expected))
+
+    def test_export_to_buffer(self):
+        with export_to_buffer(self.store, fmt='ndjson') as buffer:
+            self.assertEqual(len(buffer.read().decode('utf-8').splitlines()), 2)
+            # st.download_button only takes bytes, BytesIO or raw/buffered-reader files.
+            self.assertIsInstance(buffer, io.RawIOBase)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            iter_export(self.store, fmt='xml')
+
+if __name__ == '__main__':
+    unittest.main()
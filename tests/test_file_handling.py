@@ -0,0 +1,45 @@
+import os
+import time
+import shutil
+import tempfile
+import unittest
+from io import BytesIO
+from utils.file_handling import save_uploaded_file, remove_temp_file, hash_file_content, cleanup_temp_files
+
+class TestFileHandling(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.upload = BytesIO(b"skor,baslik,entiri,silinmis,tarih\n1,a,b,false,2023-01-01T00:00:00.000Z\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_save_is_content_addressed(self):
+        first = save_uploaded_file(self.upload, directory=self.directory)
+        second = save_uploaded_file(self.upload, directory=self.directory)
+        self.assertEqual(first, second)
+        self.assertIn(hash_file_content(self.upload.getvalue()), os.path.basename(first))
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+    def test_errors_are_raised(self):
+        # Saving runs on a job thread, where only a raised error reaches the user.
+        with self.assertRaises(OSError):
+            save_uploaded_file(self.upload, directory=os.path.join(self.directory, 'yok'))
+        file_path = save_uploaded_file(self.upload, directory=self.directory)
+        remove_temp_file(file_path)
+        # Already removed, e.g. by another session's cleanup.
+        remove_temp_file(file_path)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_cleanup_removes_stale_files(self):
+        file_path = save_uploaded_file(self.upload, directory=self.directory)
+        self.assertEqual(cleanup_temp_files(directory=self.directory), 0)
+
+        stale = time.time() - 7200
+        os.utime(file_path, (stale, stale))
+        freed = cleanup_temp_files(max_age_seconds=3600, directory=self.directory)
+        self.assertEqual(freed, len(self.upload.getvalue()))
+        self.assertFalse(os.path.exists(file_path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from services.entry_store import EntryStore
+from services.filter_masks import FilterMasks, get_filter_masks
+
+class TestFilterMasks(unittest.TestCase):
+    def setUp(self):
+        self.store = EntryStore.from_frame(pd.DataFrame([
+            {"skor": 1, "baslik": "kedi", "entiri": "bir kedi", "silinmis": False, "tarih": "2023-01-01T12:00:00.000Z"},
+            {"skor": 2, "baslik": "köpek", "entiri": "bir kedi daha", "silinmis": True, "tarih": "2023-02-01T12:00:00.000Z"},
+            {"skor": 3, "baslik": "kuş", "entiri": "kanarya", "silinmis": False, "tarih": "2023-03-01T12:00:00.000Z"}
+        ]))
+        self.masks = get_filter_masks(self.store)
+        self.start = pd.Timestamp("2023-01-01", tz="UTC")
+        self.end = pd.Timestamp("2023-02-28", tz="UTC")
+
+    def test_rows(self):
+        self.assertEqual(self.masks.rows(self.start, self.end).tolist(), [0, 1])
+        self.assertEqual(self.masks.rows(self.start, self.end, show_deleted=False).tolist(), [0])
+        self.assertEqual(self.masks.rows(self.start, "2023-12-31", search_term="KEDİ").tolist(), [0, 1])
+        self.assertEqual(self.masks.rows(self.start, "2023-12-31", False, "kedi").tolist(), [0])
+
+    def test_sorted_rows(self):
+        end = "2023-12-31"
+        self.assertEqual(self.masks.rows(self.start, end, sort_by='tarih', ascending=False).tolist(), [2, 1, 0])
+        self.assertEqual(self.masks.rows(self.start, end, False, sort_by='skor', ascending=False).tolist(), [2, 0])
+        # Turkish collation: kedi < köpek < kuş (ö sorts after o, before u).
+        self.assertEqual(self.masks.rows(self.start, end, sort_by='baslik').tolist(), [0, 1, 2])
+        self.assertEqual(self.masks.rows(self.start, end, search_term="kedi", sort_by='baslik', ascending=False).tolist(), [1, 0])
+
+    def test_ranked_rows(self):
+        end = "2023-12-31"
+        self.assertEqual(self.masks.ranked_rows(self.start, end, True, "kedi", 10).tolist(), [0, 1])
+        self.assertEqual(self.masks.ranked_rows(self.start, end, False, "kedi", 10).tolist(), [0])
+        self.assertEqual(self.masks.ranked_rows(self.start, end, True, "kedi kanarya", 1).tolist(), [2])
+
+    def test_masks_are_memoized_per_predicate(self):
+        self.assertIs(get_filter_masks(self.store), self.masks)
+        rows = self.masks.rows(self.start, self.end, search_term="kedi")
+        with patch.object(FilterMasks, 'search_mask', side_effect=AssertionError) as search_mask:
+            # Unchanged filters, e.g. a page flip, reuse the memoized rows.
+            self.assertIs(self.masks.rows(self.start, self.end, search_term="kedi"), rows)
+            search_mask.assert_not_called()
+        date_mask = self.masks.date_mask(self.start, self.end)
+        self.masks.rows(self.start, self.end, search_term="kanarya")
+        self.assertIs(self.masks.date_mask(self.start, self.end), date_mask)
+        self.assertFalse(rows.flags.writeable)
+
+    def test_lru_bound(self):
+        masks = FilterMasks(self.store, max_entries=2)
+        for term in ["a", "b", "c"]:
+            masks.search_mask(term)
+        self.assertEqual(len(masks._cache), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import json
+import unittest
+import tracemalloc
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from services.instrumentation import PerformanceRecorder, stage_timer, set_memory_tracking
+from services.jobs import JobManager
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.context = contextvars.Context()
+
+    def run_in_context(self, fn):
+        return self.context.run(fn)
+
+    def test_records_nested_stages_per_rerun(self):
+        recorder = PerformanceRecorder()
+
+        @stage_timer('inner')
+        def inner():
+            return sum(range(10000))
+
+        def rerun():
+            recorder.start_rerun()
+            with stage_timer('outer'):
+                inner()
+                inner()
+        self.run_in_context(rerun)
+        self.run_in_context(rerun)
+
+        self.assertEqual([record.stage for record in recorder.records(2)], ['inner', 'inner', 'outer'])
+        summary = {row['stage']: row for row in recorder.summary()}
+        self.assertEqual(summary['inner']['runs'], 4)
+        self.assertEqual(summary['outer']['runs'], 2)
+        self.assertGreaterEqual(summary['outer']['wall_ms'], summary['inner']['max_wall_ms'])
+        self.assertIsNone(summary['outer']['peak_mib'])
+
+    def test_peak_memory_carries_to_enclosing_stage(self):
+        recorder = PerformanceRecorder()
+
+        def rerun():
+            recorder.start_rerun()
+            with stage_timer('outer'):
+                with stage_timer('inner'):
+                    block = bytearray(4 * 2 ** 20)
+                    del block
+                with stage_timer('small'):
+                    pass
+        set_memory_tracking(True, recorder)
+        try:
+            self.run_in_context(rerun)
+        finally:
+            set_memory_tracking(False, recorder)
+        peaks = {record.stage: record.peak_bytes for record in recorder.records()}
+        self.assertGreaterEqual(peaks['inner'], 4 * 2 ** 20)
+        self.assertGreaterEqual(peaks['outer'], 4 * 2 ** 20)
+        self.assertLess(peaks['small'], 2 ** 20)
+
+    def test_memory_tracking_stays_on_while_a_session_asks(self):
+        first, second = PerformanceRecorder(), PerformanceRecorder()
+        try:
+            set_memory_tracking(True, first)
+            set_memory_tracking(True, second)
+            set_memory_tracking(False, first)
+            self.assertTrue(tracemalloc.is_tracing())
+            # A session that ended without switching tracking off does not keep it on.
+            del second
+            set_memory_tracking(False, first)
+            self.assertFalse(tracemalloc.is_tracing())
+        finally:
+            set_memory_tracking(False, first)
+
+    def test_jobs_record_into_submitting_session(self):
+        recorder = PerformanceRecorder()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            def submit():
+                recorder.start_rerun()
+                return JobManager(executor).submit('work', stage_timer('job')(lambda job: 42))
+            job = self.run_in_context(submit)
+            self.assertEqual(job.result(), 42)
+        finally:
+            executor.shutdown(wait=True)
+        self.assertEqual([(record.stage, record.rerun) for record in recorder.records()], [('job', 1)])
+
+    def test_ndjson_export(self):
+        recorder = PerformanceRecorder()
+        def rerun():
+            recorder.start_rerun()
+            with stage_timer('filter'):
+                pass
+        self.run_in_context(rerun)
+        lines = recorder.to_ndjson().splitlines()
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0])
+        self.assertEqual((record['stage'], record['rerun']), ('filter', 1))
+        self.assertIn('cpu_s', record)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import threading
+import unittest
+from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
+from services.jobs import JobManager, JobCancelled, DONE, FAILED, CANCELLED, store_job_key
+from components.job_component import display_job_status
+
+class TestJobManager(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.jobs = JobManager(self.executor)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def test_result_and_progress(self):
+        def work(job, n):
+            job.report(0.5, "yarısı")
+            return n * 2
+        job = self.jobs.submit("double", work, 21, label="İkiye katla")
+        self.assertEqual(job.result(), 42)
+        self.assertEqual(job.status, DONE)
+        self.assertEqual((job.progress, job.message), (0.5, "yarısı"))
+        self.assertEqual(self.jobs.active(), [])
+
+    def test_submit_reuses_job_for_key(self):
+        calls = []
+        job = self.jobs.submit("key", lambda job: calls.append(1))
+        job.result()
+        self.assertIs(self.jobs.submit("key", lambda job: calls.append(1)), job)
+        self.assertEqual(calls, [1])
+        self.jobs.discard("key")
+        self.jobs.submit("key", lambda job: calls.append(1)).result()
+        self.assertEqual(calls, [1, 1])
+
+    def test_cancel(self):
+        started, release = threading.Event(), threading.Event()
+        def work(job):
+            started.set()
+            release.wait(5)
+            job.report(1.0)
+            return "unreachable"
+        job = self.jobs.submit("slow", work)
+        queued = self.jobs.submit("queued", lambda job: "never")
+        started.wait(5)
+        self.assertEqual(len(self.jobs.active()), 2)
+        job.cancel()
+        queued.cancel()
+        release.set()
+        with self.assertRaises(JobCancelled):
+            job.result()
+        self.assertEqual(job.status, CANCELLED)
+        self.assertEqual(queued.status, CANCELLED)
+
+    def test_failure(self):
+        def work(job):
+            raise ValueError("bozuk dosya")
+        with self.assertLogs('services.error_handling', 'ERROR') as logs:
+            job = self.jobs.submit("broken", work)
+            job.future.exception()
+        self.assertEqual(job.status, FAILED)
+        self.assertIsInstance(job.error(), ValueError)
+        # Logged once, with the traceback, however often the failure is shown.
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("broken", logs.records[0].getMessage())
+        self.assertIsNotNone(logs.records[0].exc_info)
+
+    def test_consumed_result_is_released(self):
+        job = self.jobs.submit("load", lambda job: {"store": "büyük"})
+        job.future.result()
+        with patch('components.job_component.get_job_manager', return_value=self.jobs):
+            self.assertEqual(display_job_status(job), {"store": "büyük"})
+        # The session no longer holds the result; a later submit runs the work again.
+        self.assertIsNone(self.jobs.get("load"))
+        self.assertIsNot(self.jobs.submit("load", lambda job: None), job)
+
+    def test_reloaded_store_gets_its_own_job(self):
+        class Store:
+            fingerprint = "abc"
+        evicted, reloaded = Store(), Store()
+        job = self.jobs.submit(store_job_key("search_index", evicted), lambda job: None)
+        job.future.result()
+        self.assertIsNot(self.jobs.submit(store_job_key("search_index", reloaded), lambda job: None), job)
+        self.assertIs(self.jobs.submit(store_job_key("search_index", evicted), lambda job: None), job)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import os
+import signal
+import unittest
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import pandas as pd
+from services.entry_store import EntryStore
+from services.ngrams import NgramCounts, count_shard
+from services.jobs import Job, get_process_pool
+from components.visualization_component import build_ngram_counts
+
+class TestNgrams(unittest.TestCase):
+    def setUp(self):
+        texts = [
+            "Zor hafta geçti, zor hafta bitti.",
+            "bir gün zor hafta gelir",
+            "Kahve falı ve kahve falı",
+            "kahve falı https://ornek.com zor hafta",
+        ] * 3
+        self.store = EntryStore.from_frame(pd.DataFrame({
+            'skor': 1, 'baslik': 'başlık', 'entiri': texts, 'silinmis': False, 'tarih': '2023-01-01T00:00:00.000Z',
+        }))
+
+    def test_count_shard(self):
+        counters, total = count_shard(["Zor hafta bir gün zor hafta", "ve kahve falı"])
+        self.assertEqual(counters[0]['zor'], 2)
+        self.assertEqual(counters[1]['zor hafta'], 2)
+        # Stopwords break n-grams instead of being skipped over.
+        self.assertEqual(counters[1]['hafta gün'], 0)
+        self.assertEqual(counters[2]['zor hafta gün'], 0)
+        self.assertEqual(counters[1]['kahve falı'], 1)
+        self.assertEqual(total, 7)
+
+    def test_pool_matches_serial(self):
+        serial = NgramCounts.from_store(self.store, shard_size=5)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = NgramCounts.from_store(self.store, executor, shard_size=5)
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as executor:
+            processes = NgramCounts.from_store(self.store, executor, shard_size=2)
+        self.assertEqual(threaded.counts, serial.counts)
+        self.assertEqual(processes.counts, serial.counts)
+        self.assertEqual(processes.total_tokens, serial.total_tokens)
+
+    def test_top_and_collocations(self):
+        progress = []
+        ngrams = NgramCounts.from_store(self.store, shard_size=4, on_progress=progress.append)
+        self.assertEqual(progress, [1 / 3, 2 / 3, 1.0])
+        self.assertEqual(ngrams.top(2, 2), [('zor hafta', 12), ('kahve falı', 9)])
+        self.assertEqual(ngrams.top(3, 1), [('zor hafta geçti', 3)])
+        bigram, pmi, count = ngrams.collocations(k=1, min_count=9)[0]
+        self.assertEqual((bigram, count), ('kahve falı', 9))
+        self.assertGreater(pmi, 0)
+
+    def test_broken_pool_is_replaced(self):
+        get_process_pool.clear()
+        pool = get_process_pool()
+        pool.submit(count_shard, ["ısınma"]).result()
+        # A worker killed e.g. for memory breaks the whole pool.
+        os.kill(next(iter(pool._processes)), signal.SIGKILL)
+        with self.assertRaises(BrokenProcessPool):
+            pool.submit(count_shard, ["bozuk"]).result(timeout=30)
+
+        ngrams = build_ngram_counts(Job('ngrams:test'), self.store, pool)
+        self.assertEqual(ngrams.counts, NgramCounts.from_store(self.store).counts)
+        fresh = get_process_pool()
+        self.assertIsNot(fresh, pool)
+        self.assertEqual(fresh.submit(count_shard, ["zor hafta"]).result()[1], 2)
+        fresh.shutdown()
+        get_process_pool.clear()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.relevance_index import RelevanceIndex, query_terms, snippet, highlight
+
+class TestRelevanceIndex(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        words = ['kahve', 'çay', 'İstanbul', 'boğaz', 'bir', 've', 'gün', 'hafta', 'zor', 'güzel']
+        bodies = [' '.join(rng.choice(words, size=rng.integers(1, 30))) for _ in range(500)]
+        self.store = EntryStore.from_frame(pd.DataFrame({
+            'skor': 0,
+            'baslik': [f"başlık {i % 7}" for i in range(500)],
+            'entiri': bodies,
+            'silinmis': False,
+            'tarih': '2023-01-01T00:00:00.000Z',
+        }))
+        self.index = RelevanceIndex.from_store(self.store)
+
+    def exhaustive(self, query, k, mask=None):
+        scores = self.index.scores(query)
+        if mask is not None:
+            scores[~mask] = 0
+        ranked = np.lexsort((np.arange(len(scores)), -scores))[:k]
+        return ranked[scores[ranked] > 0]
+
+    def test_query_terms(self):
+        self.assertEqual(query_terms("İstanbul'da KAHVE, kahve ve 2023"), ['istanbul', 'kahve', 've'])
+
+    def test_bm25_prefers_frequent_term_in_short_entry(self):
+        store = EntryStore.from_frame(pd.DataFrame({
+            'skor': 0, 'baslik': 'a', 'silinmis': False, 'tarih': '2023-01-01T00:00:00.000Z',
+            'entiri': ['kahve kahve', 'kahve ve çok uzun bir yazı daha', 'çay'],
+        }))
+        rows, scores = RelevanceIndex.from_store(store).search('Kahve', k=10)
+        self.assertEqual(rows.tolist(), [0, 1])
+        self.assertGreater(scores[0], scores[1])
+
+    def test_pruned_search_matches_exhaustive_ranking(self):
+        mask = np.arange(len(self.store)) % 3 != 0
+        for query in ['kahve', 'bir gün', 'zor hafta ve çay', 'istanbul boğaz güzel bir gün', 'başlık 3 kahve']:
+            for k in [1, 5, 50]:
+                self.assertEqual(self.index.search(query, k)[0].tolist(), self.exhaustive(query, k).tolist())
+                self.assertEqual(self.index.search(query, k, mask)[0].tolist(),
+                                 self.exhaustive(query, k, mask).tolist())
+
+    def test_unknown_terms(self):
+        self.assertEqual(len(self.index.search('bilinmeyen')[0]), 0)
+        self.assertEqual(len(self.index.search('')[0]), 0)
+
+    def test_snippet(self):
+        text = ' '.join(['dolgu'] * 100) + " İstanbul'da kahve içtik " + ' '.join(['dolgu'] * 100)
+        segments = snippet(text, query_terms('istanbul kahve'), width=60)
+        self.assertEqual(segments[0], ('…', False))
+        self.assertEqual(segments[-1], ('…', False))
+        self.assertEqual([text for text, match in segments if match], ['İstanbul', 'kahve'])
+        self.assertLess(sum(len(text) for text, _ in segments), 80)
+        self.assertEqual(highlight('Kahve https://kahve.com', ['kahve']),
+                         [('Kahve', True), (' https://kahve.com', False)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.rollups import TimeRollups
+
+class TestTimeRollups(unittest.TestCase):
+    def setUp(self):
+        self.store = EntryStore.from_frame(pd.DataFrame([
+            {"skor": 1, "baslik": "a", "entiri": "x", "silinmis": False, "tarih": "2022-12-31T23:30:00.000Z"},
+            {"skor": 2, "baslik": "b", "entiri": "y", "silinmis": True, "tarih": "2023-01-02T08:00:00.000Z"},
+            {"skor": 4, "baslik": "c", "entiri": "z", "silinmis": False, "tarih": "2023-01-02T09:15:00.000Z"},
+            {"skor": -3, "baslik": "d", "entiri": "w", "silinmis": False, "tarih": "2023-03-06T09:00:00.000Z"}
+        ]))
+        self.rollups = TimeRollups.from_store(self.store)
+
+    def test_totals(self):
+        self.assertEqual(self.rollups.total_entries, 4)
+        self.assertEqual(self.rollups.total_skor, 4)
+        self.assertEqual(self.rollups.deleted_entries, 1)
+
+    def test_matches_groupby(self):
+        df = self.store.frame()
+        expected = {
+            'year': df['tarih'].dt.year,
+            'month': df['tarih'].dt.to_period('M').dt.to_timestamp(),
+            'day': df['tarih'].dt.normalize(),
+        }
+        for granularity, keys in expected.items():
+            frame = self.rollups[granularity].frame()
+            grouped = df.groupby(keys)['skor'].agg(['size', 'sum'])
+            self.assertEqual(frame.index.tolist(), grouped.index.tolist(), granularity)
+            self.assertEqual(frame['count'].tolist(), grouped['size'].tolist(), granularity)
+            self.assertEqual(frame['skor'].tolist(), grouped['sum'].tolist(), granularity)
+
+    def test_weekday_and_hour(self):
+        weekday = self.rollups['weekday'].frame()
+        self.assertEqual(len(weekday), 7)
+        # Saturday, then two Mondays.
+        self.assertEqual(weekday['count'].tolist(), [3, 0, 0, 0, 0, 1, 0])
+        hour = self.rollups['hour'].frame(silinmis=False)
+        self.assertEqual(hour.loc[9].tolist(), [2, 1])
+        self.assertEqual(hour.loc[8].tolist(), [0, 0])
+        self.assertEqual(self.rollups['hour'].frame(silinmis=True).loc[8].tolist(), [1, 2])
+
+    def test_hourly_and_weekday_hour(self):
+        hourly = self.rollups['hourly'].frame()
+        # Every hour from 2022-12-31 23:00 to 2023-03-06 09:00, empty ones included.
+        self.assertEqual(len(hourly), 64 * 24 + 11)
+        self.assertEqual(hourly.index[0], pd.Timestamp('2022-12-31 23:00'))
+        self.assertEqual(hourly['count'].sum(), 4)
+        self.assertEqual(hourly.loc[pd.Timestamp('2023-01-02 09:00'), 'skor'], 4)
+        weekday_hour = self.rollups['weekday_hour'].frame()
+        self.assertEqual(len(weekday_hour), 168)
+        # Monday 09:00 twice, Monday 08:00 and Saturday 23:00 once.
+        self.assertEqual(weekday_hour.loc[9, 'count'], 2)
+        self.assertEqual(weekday_hour.loc[8, 'count'], 1)
+        self.assertEqual(weekday_hour.loc[5 * 24 + 23, 'count'], 1)
+
+    def test_rows_subset(self):
+        rollups = TimeRollups.from_store(self.store, np.array([1, 2]))
+        self.assertEqual(rollups['year'].frame().to_dict('index'), {2023: {'count': 2, 'skor': 6}})
+
+if __name__ == '__main__':
+    unittest.main()
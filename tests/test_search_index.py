@@ -0,0 +1,37 @@
+import unittest
+import pandas as pd
+from services.entry_store import EntryStore
+from services.search_index import SearchIndex
+from utils.turkish_text import turkish_casefold
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        df = pd.DataFrame([
+            {"skor": 1, "baslik": "İstanbul", "entiri": "Boğaz manzarası", "silinmis": False,
+             "tarih": "2023-01-01T12:00:00.000Z"},
+            {"skor": 2, "baslik": "ISPARTA", "entiri": "Gül bahçeleri", "silinmis": False,
+             "tarih": "2023-01-02T12:00:00.000Z"},
+            {"skor": 3, "baslik": "ankara", "entiri": "başkent ılık değil", "silinmis": True,
+             "tarih": "2023-01-03T12:00:00.000Z"}
+        ])
+        self.index = SearchIndex.from_store(EntryStore.from_frame(df))
+
+    def test_turkish_casefold(self):
+        self.assertEqual(turkish_casefold("İSTANBUL"), "istanbul")
+        self.assertEqual(turkish_casefold("ISPARTA"), "ısparta")
+        self.assertEqual(turkish_casefold(None), "")
+
+    def test_search_uses_turkish_rules(self):
+        self.assertEqual(self.index.search("istanbul").tolist(), [0])
+        self.assertEqual(self.index.search("ısparta").tolist(), [1])
+        self.assertEqual(self.index.search("ILIK").tolist(), [2])
+
+    def test_search_title_and_body(self):
+        self.assertEqual(self.index.search("boğaz").tolist(), [0])
+        self.assertEqual(self.index.search("a").tolist(), [0, 1, 2])
+        self.assertEqual(self.index.search("").tolist(), [0, 1, 2])
+        self.assertEqual(self.index.search("bulboğ").tolist(), [])
+        self.assertEqual(self.index.search("yok").tolist(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.snapshot import write_snapshot, read_snapshot, has_snapshot, prune_snapshots
+from services.text_store import CompressedText
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = EntryStore.from_frame(pd.DataFrame([
+            {"skor": 10, "baslik": "Test Başlık", "entiri": "Çok satırlı\nİçerik", "silinmis": False,
+             "tarih": "2023-01-02T12:00:00.000Z"},
+            {"skor": -5, "baslik": "Another Test", "entiri": "More Content", "silinmis": True,
+             "tarih": "2023-01-01T13:00:00.000Z"}
+        ]), fingerprint="abc")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        write_snapshot(self.store, directory=self.directory)
+        self.assertTrue(has_snapshot("abc", directory=self.directory))
+
+        loaded = read_snapshot("abc", directory=self.directory)
+        self.assertIsInstance(loaded.skor, np.memmap)
+        self.assertEqual(loaded.fingerprint, "abc")
+        self.assertEqual(loaded.records(loaded.all_rows()), self.store.records(self.store.all_rows()))
+        np.testing.assert_array_equal(loaded.date_order, [1, 0])
+        np.testing.assert_array_equal(loaded.entry_id, self.store.entry_id)
+        # Bodies stay compressed in the mapping and are decoded per block.
+        self.assertIsInstance(loaded.entiri, CompressedText)
+        self.assertIsInstance(loaded.entiri.blocks[0], np.memmap)
+
+    def test_round_trip_empty(self):
+        empty = self.store.take(np.array([], dtype=np.int64), fingerprint="empty")
+        write_snapshot(empty, directory=self.directory)
+        loaded = read_snapshot("empty", directory=self.directory)
+        self.assertEqual(len(loaded), 0)
+        self.assertEqual(loaded.records(loaded.all_rows()), [])
+
+    def test_missing_snapshot(self):
+        self.assertIsNone(read_snapshot("missing", directory=self.directory))
+
+    def test_prune(self):
+        write_snapshot(self.store, directory=self.directory)
+        self.assertEqual(prune_snapshots(directory=self.directory), 0)
+        self.assertGreater(prune_snapshots(max_total_bytes=0, directory=self.directory), 0)
+        self.assertFalse(has_snapshot("abc", directory=self.directory))
+
+    def test_prune_removes_old_versions(self):
+        os.makedirs(os.path.join(self.directory, "abc.v1"))
+        prune_snapshots(directory=self.directory)
+        self.assertEqual(os.listdir(self.directory), [])
+
+if __name__ == '__main__':
+    unittest.main()
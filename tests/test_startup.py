@@ -0,0 +1,17 @@
+import unittest
+from utils.import_profile import import_time_report, check_report
+
+class TestStartup(unittest.TestCase):
+    def test_app_import_skips_heavy_modules(self):
+        report = import_time_report('app')
+        self.assertIn('streamlit', report['packages_ms'])
+        problems = check_report(report, forbid=['plotly.express', 'plotly.graph_objs', 'nltk', 'components.visualization_component'])
+        self.assertEqual(problems, [])
+
+    def test_check_report_budget(self):
+        report = {'module': 'app', 'total_ms': 120.0, 'imported': ['app', 'plotly.express']}
+        self.assertEqual(len(check_report(report, budget_ms=100, forbid=['plotly'])), 2)
+        self.assertEqual(check_report(report, budget_ms=200, forbid=['nltk']), [])
+
+if __name__ == '__main__':
+    unittest.main()
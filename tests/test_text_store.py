@@ -0,0 +1,52 @@
+import unittest
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.text_store import CompressedText
+
+class TestCompressedText(unittest.TestCase):
+    def setUp(self):
+        self.texts = [f"girdi {i} " + "çok uzun bir metin " * (i % 7) for i in range(1000)] + ["", "İstanbul\nşehri"]
+        self.values = pd.array(self.texts, dtype='string[pyarrow]')
+
+    def test_take_decodes_requested_rows(self):
+        compressed = CompressedText.from_arrow(self.values, block_size=64)
+        self.assertEqual(len(compressed), len(self.texts))
+        self.assertEqual(len(compressed.blocks), 16)
+        rows = np.array([1001, 3, 640, 3, 1000])
+        self.assertEqual(compressed.take(rows).tolist(), [self.texts[row] for row in rows])
+        self.assertEqual(compressed.take(np.array([], dtype=np.int64)).tolist(), [])
+        self.assertEqual(compressed.to_array().tolist(), self.texts)
+        self.assertLess(compressed.nbytes, self.values.nbytes)
+
+    def test_concat_and_buffers(self):
+        parts = [CompressedText.from_arrow(self.values[start:start + 256], block_size=64) for start in range(0, len(self.texts), 256)]
+        joined = CompressedText.concat(parts)
+        self.assertEqual(joined.to_array().tolist(), self.texts)
+        self.assertEqual(CompressedText.concat([]).to_array().tolist(), [])
+        with self.assertRaises(ValueError):
+            CompressedText.concat([CompressedText.from_arrow(self.values[:10], block_size=64), parts[0]])
+        data, block_offsets = joined.to_buffers()
+        restored = CompressedText.from_buffers(data, block_offsets, joined.offsets, joined.block_size)
+        self.assertEqual(restored.take(np.array([1001, 5])).tolist(), [self.texts[1001], self.texts[5]])
+
+    def test_compressed_store(self):
+        df = pd.DataFrame({
+            'skor': np.arange(len(self.texts)),
+            'baslik': ['başlık'] * len(self.texts),
+            'entiri': self.texts,
+            'silinmis': False,
+            'tarih': '2023-01-01T12:00:00.000Z',
+        })
+        store = EntryStore.from_frame(df, fingerprint='abc')
+        compact = store.compress_text(block_size=100)
+        self.assertEqual(compact.fingerprint, 'abc')
+        rows = np.array([7, 999, 500])
+        self.assertEqual(compact.records(rows), store.records(rows))
+        self.assertTrue(compact.frame().equals(store.frame()))
+        self.assertLess(compact.memory_usage()['entiri'], store.memory_usage()['entiri'])
+        merged = EntryStore.merge([compact, store])
+        self.assertEqual(len(merged), len(store))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.title_index import TitleIndex, normalize_title
+
+class TestTitleIndex(unittest.TestCase):
+    def setUp(self):
+        self.store = EntryStore.from_frame(pd.DataFrame([
+            {"skor": 3, "baslik": "İstanbul", "entiri": "a", "silinmis": False, "tarih": "2023-03-01T00:00:00.000Z"},
+            {"skor": 5, "baslik": "kahve", "entiri": "b", "silinmis": True, "tarih": "2023-01-01T00:00:00.000Z"},
+            {"skor": 1, "baslik": "istanbul ", "entiri": "c", "silinmis": False, "tarih": "2023-01-15T00:00:00.000Z"},
+            {"skor": 2, "baslik": "kahve", "entiri": "d", "silinmis": False, "tarih": "2023-02-01T00:00:00.000Z"},
+            {"skor": 4, "baslik": "İSTANBUL", "entiri": "e", "silinmis": True, "tarih": "2023-02-10T00:00:00.000Z"},
+        ]))
+        self.index = TitleIndex.from_store(self.store)
+
+    def test_groups_spelling_variants(self):
+        self.assertEqual(normalize_title("  İSTANBUL  "), "istanbul")
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.title_rows("istanbul").tolist(), [2, 4, 0])
+        self.assertEqual(self.index.title_rows("KAHVE").tolist(), [1, 3])
+        self.assertEqual(self.index.title_rows("çay").tolist(), [])
+
+    def test_aggregates_and_ranking(self):
+        stats = self.index.stats.set_index('baslik')
+        self.assertEqual(stats.loc['istanbul ', ['entries', 'skor', 'deleted']].tolist(), [3, 8, 1])
+        self.assertEqual(stats.loc['istanbul ', 'first'], pd.Timestamp('2023-01-15'))
+        self.assertEqual(stats.loc['istanbul ', 'last'], pd.Timestamp('2023-03-01'))
+        self.assertEqual(self.index.top(1)['baslik'].tolist(), ['istanbul '])
+        self.assertEqual(self.index.top(2, by='deleted')['entries'].tolist(), [3, 2])
+        with self.assertRaises(ValueError):
+            self.index.top(2, by='baslik')
+
+    def test_unused_categories_after_take(self):
+        index = TitleIndex.from_store(self.store.take(np.array([1, 3])))
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.stats['entries'].tolist(), [2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,16 @@
+import unittest
+from unittest.mock import patch
+import pandas as pd
+from services.entry_store import EntryStore
+from components.visualization_component import run_visualization_component
+
+class TestVisualizationComponent(unittest.TestCase):
+    @patch('streamlit.info')
+    def test_empty_store(self, mock_info):
+        store = EntryStore.from_frame(pd.DataFrame(columns=['skor', 'baslik', 'entiri', 'silinmis', 'tarih']))
+        self.assertEqual(len(store), 0)
+        run_visualization_component(store)
+        mock_info.assert_called_once_with("No entries to visualize.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+import numpy as np
+import pandas as pd
+from services.entry_store import EntryStore
+from services.word_frequency import WordCounts, tokenize
+
+class TestWordFrequency(unittest.TestCase):
+    def setUp(self):
+        store = EntryStore.from_frame(pd.DataFrame([
+            {"skor": 1, "baslik": "a", "entiri": "İstanbul'da kedi, KEDİ ve köpek.", "silinmis": False,
+             "tarih": "2023-01-01T12:00:00.000Z"},
+            {"skor": 2, "baslik": "b", "entiri": "Köpek köpek kuş https://example.com/kedi", "silinmis": True,
+             "tarih": "2023-01-02T12:00:00.000Z"}
+        ]))
+        self.counts = WordCounts.from_store(store)
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("İstanbul'da 2023'te IRMAK ve bir kedi!"), ["istanbul", "ırmak", "kedi"])
+
+    def test_top_words(self):
+        self.assertEqual(self.counts.top_words(n=2), [("köpek", 3), ("kedi", 2)])
+
+    def test_top_words_for_rows(self):
+        self.assertEqual(self.counts.top_words(np.array([1]), n=5), [("köpek", 2), ("kuş", 1)])
+        self.assertEqual(self.counts.top_words(np.array([True, False]), n=1), [("kedi", 2)])
+        self.assertEqual(self.counts.top_words(np.array([], dtype=np.int64)), [])
+
+if __name__ == '__main__':
+    unittest.main()